@@ -0,0 +1,246 @@
+from argparse import ArgumentParser
+from csv import DictWriter
+from math import log as logarithm
+from pathlib import Path
+from sys import exit as sys_exit
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable
+import tracemalloc
+
+try:
+    from modules.Debug import log
+    from modules.FontValidator import FontValidator
+    from modules.global_objects import set_preference_parser, \
+        set_font_validator, set_media_info_set
+    from modules.Manager import Manager
+    from modules.MediaInfoSet import MediaInfoSet
+    from modules.PreferenceParser import PreferenceParser
+    from modules.SyntheticLibrary import SyntheticLibrary
+except ImportError as e:
+    print(f'Required Python packages are missing - execute "pipenv install"')
+    print(f'  Specific Error: {e}')
+    sys_exit(1)
+
+# Default values
+DEFAULT_SIZES = (100, 250, 500, 1000)
+DEFAULT_EPISODES = 50
+
+"""Scaling exponent above which a stage is reported as superlinear"""
+SUPERLINEAR_EXPONENT = 1.2
+
+parser = ArgumentParser(
+    description='Measure how TitleCardMaker scales with library size, using '
+                'generated libraries')
+parser.add_argument(
+    '-n', '--sizes',
+    type=int,
+    nargs='+',
+    default=DEFAULT_SIZES,
+    metavar='SERIES',
+    help=f'Number of series in each generated library. Defaults to '
+         f'{" ".join(map(str, DEFAULT_SIZES))}')
+parser.add_argument(
+    '-e', '--episodes',
+    type=int,
+    default=DEFAULT_EPISODES,
+    metavar='EPISODES',
+    help=f'Number of episodes of each series. Defaults to {DEFAULT_EPISODES}')
+parser.add_argument(
+    '-d', '--directory',
+    type=Path,
+    default=None,
+    metavar='DIRECTORY',
+    help='Directory to generate (and keep) the libraries in. Defaults to a '
+         'temporary directory')
+parser.add_argument(
+    '-o', '--output',
+    type=Path,
+    default=None,
+    metavar='FILE',
+    help='CSV file to write the measurements to')
+parser.add_argument(
+    '--seed',
+    type=int,
+    default=0,
+    help='Seed to generate the libraries with. Defaults to 0')
+parser.add_argument(
+    '--no-memory',
+    action='store_true',
+    help='Do not measure peak memory (which slows down every stage)')
+parser.add_argument(
+    '-l', '--log',
+    choices=('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'),
+    default='WARNING',
+    help='Level of logging verbosity to use. Defaults to "WARNING"')
+
+
+class EpisodeIDCounter:
+    """
+    Stand-in for the episode data source interface of a Show, so that
+    the filtering of `Show.set_episode_ids()` can be measured without a
+    server. This only counts the episodes which would be queried.
+    """
+
+    def __init__(self) -> None:
+        """Initialize this counter with no episodes counted."""
+
+        self.episode_count = 0
+
+
+    def set_episode_ids(self, library_name, series_info, episode_infos):
+        """Count the given episodes which would be queried for IDs."""
+
+        self.episode_count += len(episode_infos)
+
+
+def measure(function: Callable[[], Any], memory: bool) -> tuple[float, float]:
+    """
+    Measure the given function.
+
+    Args:
+        function: Function to call.
+        memory: Whether to measure the peak memory of the function.
+
+    Returns:
+        Tuple of the runtime (in seconds) and peak memory allocated (in
+        MiB) by the function. Memory is 0 if not measured.
+    """
+
+    if memory:
+        tracemalloc.start()
+    start = perf_counter()
+    function()
+    runtime = perf_counter() - start
+    peak = 0.0
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+
+    return runtime, peak
+
+
+def benchmark(library: SyntheticLibrary, memory: bool) -> dict[str, tuple]:
+    """
+    Generate the given library and measure each stage against it.
+
+    Args:
+        library: Library to generate and measure.
+        memory: Whether to measure the peak memory of each stage.
+
+    Returns:
+        Dictionary of stage names to their runtime and peak memory.
+    """
+
+    # Read generated preferences, store all databases within the library
+    preference_file = library.generate()
+    pp = PreferenceParser(preference_file, is_docker=False)
+    pp.database_directory = library.directory / '.objects'
+    set_preference_parser(pp)
+    set_font_validator(FontValidator())
+    set_media_info_set(MediaInfoSet())
+
+    shows = []
+    def read_series_files():
+        shows.extend(pp.iterate_series_files())
+
+    def read_source():
+        for show in shows:
+            show.read_source()
+
+    def find_multipart_episodes():
+        for show in shows:
+            show.find_multipart_episodes()
+
+    counter = EpisodeIDCounter()
+    def set_episode_ids():
+        for show in shows:
+            setattr(show, f'{show.episode_data_source}_interface', counter)
+            show.set_episode_ids()
+
+    def report_missing():
+        manager = Manager(check_tautulli=False)
+        manager.shows = shows
+        manager.report_missing(library.directory / 'missing.yml')
+
+    stages = {
+        'iterate_series_files': read_series_files,
+        'read_source': read_source,
+        'find_multipart_episodes': find_multipart_episodes,
+        'set_episode_ids': set_episode_ids,
+        'report_missing': report_missing,
+    }
+
+    results = {stage: measure(function, memory)
+               for stage, function in stages.items()}
+    log.debug(f'{counter.episode_count} episodes of {len(shows)} shows '
+              f'would query episode IDs')
+
+    return results
+
+
+def main(directory: Path) -> None:
+    """Benchmark libraries of each size in the given directory."""
+
+    rows = []
+    for size in sorted(set(args.sizes)):
+        library = SyntheticLibrary(
+            directory / f'{size}', size,
+            episodes_per_series=args.episodes, seed=args.seed,
+        )
+        print(f'Benchmarking {size} series ({library.episode_count} '
+              f'episodes)..')
+        for stage, (runtime, peak) in benchmark(
+                library, not args.no_memory).items():
+            rows.append({
+                'stage': stage, 'series': size,
+                'episodes': library.episode_count,
+                'seconds': round(runtime, 4), 'peak_mib': round(peak, 2),
+            })
+
+    # Print scaling curve of each stage, marking superlinear growth
+    print(f'\n{"Stage":<24} {"Series":>7} {"Episodes":>9} {"Seconds":>9} '
+          f'{"Peak MiB":>9} {"Exponent":>9}')
+    superlinear = []
+    for stage in dict.fromkeys(row['stage'] for row in rows):
+        previous = None
+        for row in (row for row in rows if row['stage'] == stage):
+            # Exponent k of runtime ~ N^k between consecutive sizes
+            exponent = ''
+            if previous is not None and previous['seconds'] > 0:
+                value = (
+                    logarithm(max(row['seconds'], 1e-4) / previous['seconds'])
+                    / logarithm(row['series'] / previous['series'])
+                )
+                exponent = f'{value:.2f}'
+                if value > SUPERLINEAR_EXPONENT:
+                    exponent += ' !'
+                    superlinear.append(f'{stage} (N^{value:.2f} from '
+                                       f'{previous["series"]} to '
+                                       f'{row["series"]} series)')
+            print(f'{stage:<24} {row["series"]:>7} {row["episodes"]:>9} '
+                  f'{row["seconds"]:>9.3f} {row["peak_mib"]:>9.1f} '
+                  f'{exponent:>9}')
+            previous = row
+
+    if superlinear:
+        print(f'\nSuperlinear scaling:\n  ' + '\n  '.join(superlinear))
+
+    # Write measurements to CSV if indicated
+    if args.output is not None:
+        with args.output.open('w', newline='', encoding='utf-8') as file:
+            writer = DictWriter(file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f'\nWrote measurements to "{args.output.resolve()}"')
+
+
+# Parse given arguments, set global log level
+args = parser.parse_args()
+log.handlers[0].setLevel(args.log)
+
+if args.directory is None:
+    with TemporaryDirectory() as temporary_directory:
+        main(Path(temporary_directory))
+else:
+    main(args.directory)
@@ -7,16 +7,11 @@ from sys import exit as sys_exit
 
 try:
     from modules.Debug import log, LOG_FILE
-    from modules.EmbyInterface import EmbyInterface
     from modules.EpisodeInfo import EpisodeInfo
     from modules.ImageMaker import ImageMaker
-    from modules.JellyfinInterface import JellyfinInterface
-    from modules.PlexInterface import PlexInterface
     from modules.PreferenceParser import PreferenceParser
     from modules.global_objects import set_preference_parser
     from modules.SeriesInfo import SeriesInfo
-    from modules.SonarrInterface import SonarrInterface
-    from modules.TMDbInterface import TMDbInterface
 except ImportError:
     print(f'Required Python packages are missing - execute "pipenv install"')
     sys_exit(1)
@@ -196,13 +191,16 @@ if ((hasattr(args, 'import_cards') or hasattr(args, 'revert_series'))
         episode_info: EpisodeInfo
         spoil_type: str
 
-    # Create MediaServer Interface
+    # Create MediaServer Interface - only importing the one being used
     try:
         if args.media_server == 'emby':
+            from modules.EmbyInterface import EmbyInterface
             media_interface = EmbyInterface(**pp.emby_interface_kwargs)
         elif args.media_server == 'jellyfin':
+            from modules.JellyfinInterface import JellyfinInterface
             media_interface = JellyfinInterface(**pp.jellyfin_interface_kwargs)
         else:
+            from modules.PlexInterface import PlexInterface
             media_interface = PlexInterface(**pp.plex_interface_kwargs)
     except Exception:
         log.critical(f'Cannot connect to "{args.media_server}" Media Server')
@@ -279,14 +277,17 @@ if (hasattr(args, 'forget_cards')
     and any((pp.use_emby, pp.use_jellyfin, pp.use_plex))):
     series_info = SeriesInfo(args.forget_cards[1], args.forget_cards[2])
     if args.media_server == 'emby':
+        from modules.EmbyInterface import EmbyInterface
         EmbyInterface(**pp.emby_interface_kwargs).remove_records(
             args.forget_cards[0], series_info,
         )
     elif args.media_server == 'jellyfin':
+        from modules.JellyfinInterface import JellyfinInterface
         JellyfinInterface(**pp.jellyfin_interface_kwargs).remove_records(
             args.forget_cards[0], series_info,
         )
     else:
+        from modules.PlexInterface import PlexInterface
         PlexInterface(**pp.plex_interface_kwargs).remove_records(
             args.forget_cards[0], series_info,
         )
@@ -294,18 +295,22 @@ if (hasattr(args, 'forget_cards')
 
 # Execute Sonarr related options
 if args.sonarr_list_ids and pp.use_sonarr:
+    from modules.SonarrInterface import SonarrInterface
     SonarrInterface(**pp.sonarr_kwargs[0]).list_all_series_id()
 
 # Execute TMDB related options
 if hasattr(args, 'unblacklist'):
+    from modules.TMDbInterface import TMDbInterface
     TMDbInterface.unblacklist(
         SeriesInfo(args.unblacklist[0], args.unblacklist[1])
     )
 
 if hasattr(args, 'delete_blacklist') and args.delete_blacklist:
+    from modules.TMDbInterface import TMDbInterface
     TMDbInterface.delete_blacklist(pp.database_directory)
 
 if hasattr(args, 'tmdb_download_images') and pp.use_tmdb:
+    from modules.TMDbInterface import TMDbInterface
     for arg_set in args.tmdb_download_images:
         try:
             start, end = map(int, arg_set[3].split('-'))
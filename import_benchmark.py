@@ -0,0 +1,135 @@
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import median
+from subprocess import run
+from sys import executable
+
+# Default values
+DEFAULT_MODULES = (
+    'modules.PreferenceParser', 'modules.Manager', 'modules.TitleCard',
+)
+DEFAULT_REPEAT = 5
+DEFAULT_TOP = 10
+
+"""Code which imports everything that is otherwise imported lazily"""
+EAGER_IMPORTS = '; '.join((
+    'from modules.TitleCard import TitleCard',
+    'list(TitleCard.CARD_TYPES.values())',
+    'import modules.EmbyInterface, modules.JellyfinInterface',
+    'import modules.PlexInterface, modules.SonarrInterface',
+    'import modules.TautulliInterface, modules.TMDbInterface',
+))
+
+parser = ArgumentParser(
+    description='Measure how long TitleCardMaker modules take to import (with '
+                '-X importtime), compared to importing every card type and '
+                'interface up front')
+parser.add_argument(
+    '-m', '--modules',
+    type=str,
+    nargs='+',
+    default=DEFAULT_MODULES,
+    metavar='MODULE',
+    help=f'Modules to measure the import of. Defaults to '
+         f'{" ".join(DEFAULT_MODULES)}')
+parser.add_argument(
+    '-r', '--repeat',
+    type=int,
+    default=DEFAULT_REPEAT,
+    metavar='N',
+    help=f'Number of times to measure each import, reporting the median. '
+         f'Defaults to {DEFAULT_REPEAT}')
+parser.add_argument(
+    '-n', '--top',
+    type=int,
+    default=DEFAULT_TOP,
+    metavar='N',
+    help=f'Number of the slowest packages to list for each module. Defaults '
+         f'to {DEFAULT_TOP}')
+
+
+def measure(code: str) -> dict[str, tuple[int, int]]:
+    """
+    Measure the imports of the given code in a new interpreter.
+
+    Args:
+        code: Python code to execute.
+
+    Returns:
+        Dictionary of each imported module to its self and cumulative
+        import time (in microseconds). Only top-level imports have a
+        cumulative time, all others are 0.
+    """
+
+    process = run(
+        [executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, cwd=Path(__file__).parent,
+        check=True,
+    )
+
+    # Lines are "import time: self [us] | cumulative | indented name"
+    imports = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        top_level = not name[1:].startswith(' ')
+        imports[name.strip()] = (
+            int(self_time), int(cumulative) if top_level else 0,
+        )
+
+    return imports
+
+
+def total(imports: dict[str, tuple[int, int]]) -> float:
+    """Get the total import time (in milliseconds) of the given imports."""
+
+    return sum(cumulative for _, cumulative in imports.values()) / 1000
+
+
+def main() -> None:
+    """Measure and print the import time of each module."""
+
+    # Imports made by the interpreter itself are excluded from every total
+    startup_runs = [measure('pass') for _ in range(args.repeat)]
+    startup = median(map(total, startup_runs))
+    startup_modules = set(startup_runs[0])
+
+    print(f'{"Module":<28} {"Lazy ms":>9} {"Eager ms":>9} {"Saved ms":>9} '
+          f'{"Modules":>8}')
+    slowest = {}
+    for module in args.modules:
+        lazy_runs = [measure(f'import {module}') for _ in range(args.repeat)]
+        eager_runs = [
+            measure(f'import {module}; {EAGER_IMPORTS}')
+            for _ in range(args.repeat)
+        ]
+        lazy = median(map(total, lazy_runs)) - startup
+        eager = median(map(total, eager_runs)) - startup
+        modules = len(set(lazy_runs[0]) - startup_modules)
+        print(f'{module:<28} {lazy:>9.1f} {eager:>9.1f} {eager - lazy:>9.1f} '
+              f'{modules:>8}')
+
+        # Self time of each top-level package, from the median run
+        packages = {}
+        for name, (self_time, _) in sorted(lazy_runs, key=total)[
+                len(lazy_runs) // 2].items():
+            if name in startup_modules:
+                continue
+            package = name.split('.', maxsplit=1)[0]
+            packages[package] = packages.get(package, 0) + self_time / 1000
+        slowest[module] = sorted(
+            packages.items(), key=lambda item: item[1], reverse=True,
+        )[:args.top]
+
+    # List the slowest packages of each (lazy) import
+    for module, packages in slowest.items():
+        print(f'\nSlowest packages imported by {module}:\n  ' + '\n  '.join(
+            f'{package:<24} {milliseconds:>7.1f} ms'
+            for package, milliseconds in packages
+        ))
+
+
+# Parse given arguments
+args = parser.parse_args()
+main()
@@ -1,10 +1,15 @@
+# pylint: disable=import-outside-toplevel
 from argparse import ArgumentParser, ArgumentTypeError, SUPPRESS
 from datetime import datetime
+from gc import collect
 from pathlib import Path
+from mmap import PAGESIZE
 from os import environ
 from sys import exit as sys_exit
 from re import match
+from threading import RLock, Thread
 from time import sleep
+from typing import TYPE_CHECKING, Optional
 
 from modules.Version import Version
 
@@ -12,7 +17,9 @@ try:
     from requests import get
     import schedule
 
+    from modules.CleanPath import CleanPath
     from modules.Debug import log, apply_no_color_formatter
+    from modules import global_objects
     from modules.FontValidator import FontValidator
     from modules.PreferenceParser import PreferenceParser
     from modules.RemoteFile import RemoteFile
@@ -26,6 +33,12 @@ except ImportError as e:
     print(f'  Specific Error: {e}')
     sys_exit(1)
 
+# Optional features are only imported if used
+if TYPE_CHECKING:
+    from modules.FileWatcher import FileWatcher
+    from modules.HTTPCassette import HTTPCassette
+    from modules.WebhookServer import WebhookServer
+
 # Version information
 REPO_URL = ('https://api.github.com/repos/'
             'CollinHeist/TitleCardMaker/releases/latest')
@@ -39,12 +52,18 @@ ENV_MISSING_FILE = 'TCM_MISSING'
 ENV_LOG_LEVEL = 'TCM_LOG'
 ENV_UPDATE_LIST= 'TCM_TAUTULLI_UPDATE_LIST'
 ENV_UPDATE_FREQUENCY = 'TCM_TAUTULLI_UPDATE_FREQUENCY'
+ENV_WEBHOOK_PORT = 'TCM_WEBHOOK_PORT'
 
 # Default values
 DEFAULT_PREFERENCE_FILE = Path(__file__).parent / 'preferences.yml'
 DEFAULT_MISSING_FILE = Path(__file__).parent / 'missing.yml'
 DEFAULT_FREQUENCY = '12h'
 DEFAULT_TAUTULLI_FREQUENCY = '4m'
+DEFAULT_DAEMON_MEMORY_LIMIT = 1024
+DEFAULT_WATCH_DEBOUNCE = 2.0
+DEFAULT_WEBHOOK_HOST = '127.0.0.1'
+DEFAULT_WEBHOOK_PORT = 8765
+DEFAULT_WEBHOOK_QUEUE_SIZE = 1000
 
 # Pseudo-type functions for argument runtime and frequency
 def runtime(arg: str) -> dict:
@@ -85,10 +104,73 @@ parser.add_argument(
     '-r', '--run',
     action='store_true',
     help='Run the TitleCardMaker')
+parser.add_argument(
+    '-d', '--daemon',
+    action='store_true',
+    help='Keep preferences, series YAML files, and all connections to '
+         'servers between runs, only re-reading files that have changed')
+parser.add_argument(
+    '--daemon-memory-limit',
+    type=int,
+    default=DEFAULT_DAEMON_MEMORY_LIMIT,
+    metavar='MiB',
+    help=f'Memory usage (in MiB) above which the state kept by --daemon is '
+         f'discarded after a run. Defaults to {DEFAULT_DAEMON_MEMORY_LIMIT}')
 parser.add_argument(
     '-s', '--sync', '--run-sync',
     action='store_true',
     help='Sync from Sonarr/Plex without running')
+parser.add_argument(
+    '--full-sync',
+    action='store_true',
+    help='Ignore any incremental sync snapshots and fully rescan all '
+         'libraries on the next sync')
+parser.add_argument(
+    '--verify-all',
+    action='store_true',
+    help='Fully process all shows on the next run, even those unchanged '
+         'since the last run')
+parser.add_argument(
+    '--resume',
+    action='store_true',
+    help='Resume the last run if it was interrupted, skipping the shows and '
+         'steps it already completed')
+parser.add_argument(
+    '--prioritize',
+    type=str,
+    nargs='+',
+    default=[],
+    metavar='SERIES',
+    help='Names of series to process before all others when running in batch '
+         'or pipeline mode, e.g. "Breaking Bad (2008)"')
+cassette_group = parser.add_mutually_exclusive_group()
+cassette_group.add_argument(
+    '--record',
+    type=Path,
+    default=SUPPRESS,
+    metavar='DIRECTORY',
+    help='Record all HTTP responses from Plex/Sonarr/TMDb/Emby/Jellyfin to '
+         'the given directory')
+cassette_group.add_argument(
+    '--replay',
+    type=Path,
+    default=SUPPRESS,
+    metavar='DIRECTORY',
+    help='Replay HTTP responses recorded (with --record) in the given '
+         'directory instead of contacting any servers')
+parser.add_argument(
+    '--replay-latency',
+    type=float,
+    default=0.0,
+    metavar='SECONDS',
+    help='Delay added to each replayed response. Defaults to 0')
+parser.add_argument(
+    '--replay-error-rate',
+    type=float,
+    default=0.0,
+    metavar='RATE',
+    help='Fraction (0-1) of replayed requests which fail with a connection '
+         'error. Defaults to 0')
 parser.add_argument(
     '-t', '--runtime', '--time', 
     type=runtime,
@@ -121,6 +203,19 @@ parser.add_argument(
     '-nc', '--no-color',
     action='store_true',
     help='Omit color from all print messages')
+parser.add_argument(
+    '-w', '--watch',
+    action='store_true',
+    help='Watch the Tautulli update list, series YAML files, and source '
+         'directories, and immediately remake the affected cards when they '
+         'change - rather than checking the update list periodically')
+parser.add_argument(
+    '--watch-debounce',
+    type=float,
+    default=DEFAULT_WATCH_DEBOUNCE,
+    metavar='SECONDS',
+    help=f'How long to wait for a burst of file changes to stop before '
+         f'remaking cards. Defaults to {DEFAULT_WATCH_DEBOUNCE:.0f}')
 parser.add_argument(
     '-tl', '--tautulli-list', '--tautulli-update-list',
     type=Path,
@@ -136,6 +231,31 @@ parser.add_argument(
     help=f'How often to check the Tautulli update list. Units can be s/m/h/d/w '
          f'for seconds/minutes/hours/days/weeks. Environment variable '
          f'{ENV_UPDATE_FREQUENCY}. Defaults to "{DEFAULT_TAUTULLI_FREQUENCY}"')
+parser.add_argument(
+    '-wp', '--webhook-port',
+    type=int,
+    default=environ.get(ENV_WEBHOOK_PORT, SUPPRESS),
+    metavar='PORT',
+    help=f'Port to listen for Plex, Emby, and Jellyfin webhooks on - e.g. '
+         f'http://[host]:[port]/plex?token=[token] - and immediately remake the '
+         f'cards of the played or added episodes. Requires the '
+         f'options/webhook_token preference. Environment variable '
+         f'{ENV_WEBHOOK_PORT}. {DEFAULT_WEBHOOK_PORT} is suggested')
+parser.add_argument(
+    '--webhook-host',
+    type=str,
+    default=DEFAULT_WEBHOOK_HOST,
+    metavar='HOST',
+    help=f'Address to listen for webhooks on - e.g. 0.0.0.0 to accept '
+         f'webhooks from other hosts. Defaults to '
+         f'"{DEFAULT_WEBHOOK_HOST}"')
+parser.add_argument(
+    '--webhook-queue',
+    type=int,
+    default=DEFAULT_WEBHOOK_QUEUE_SIZE,
+    metavar='SIZE',
+    help=f'Maximum number of episodes to queue from webhooks before rejecting '
+         f'them. Defaults to {DEFAULT_WEBHOOK_QUEUE_SIZE}')
 
 # Parse given arguments
 args = parser.parse_args()
@@ -166,6 +286,36 @@ set_font_validator(FontValidator())
 set_media_info_set(MediaInfoSet())
 set_show_record_keeper(ShowRecordKeeper(pp.database_directory))
 
+# Reset incremental sync snapshots if a full sync was requested
+if args.full_sync:
+    from modules.PlexInterface import PlexInterface
+    PlexInterface.reset_sync_snapshots()
+
+# Reset show digests if a full verification was requested
+if args.verify_all:
+    from modules.ShowDigestKeeper import ShowDigestKeeper
+    ShowDigestKeeper.reset()
+
+# Record or replay all HTTP traffic if indicated
+cassette: Optional['HTTPCassette'] = None
+if hasattr(args, 'record'):
+    from modules.HTTPCassette import HTTPCassette
+    cassette = HTTPCassette.activate(args.record, 'record')
+elif hasattr(args, 'replay'):
+    from modules.HTTPCassette import HTTPCassette
+    cassette = HTTPCassette.activate(
+        args.replay, 'replay',
+        latency=args.replay_latency, error_rate=args.replay_error_rate,
+    )
+
+# Lock so that runs, update list reads, and remakes do not overlap
+run_lock = RLock()
+
+# State kept between runs in daemon mode
+preference_mtime = args.preferences.stat().st_mtime_ns
+warm_manager: Optional[Manager] = None
+resume_run = args.resume
+
 
 def check_for_update():
     """Check for a new version of TCM."""
@@ -192,15 +342,88 @@ def check_for_update():
 def read_preferences():
     """
     Read the indicated Preferences file, and then update the global
-    `PreferenceParser` object.
+    `PreferenceParser` object. In daemon mode, the file is only re-read
+    if it has been modified.
     """
 
+    # Skip re-reading unmodified preferences in daemon mode
+    global preference_mtime # pylint: disable=global-statement
+    if args.daemon:
+        if (mtime := args.preferences.stat().st_mtime_ns) == preference_mtime:
+            return None
+        log.info(f'Preference file was modified, re-reading')
+        preference_mtime = mtime
+        RemoteFile.reset_loaded_database()
+
     # Read the preference file, verify it is valid and exit if not
     if (pp := PreferenceParser(args.preferences, is_docker)).valid:
         set_preference_parser(pp)
     else:
         log.critical(f'Preference file is invalid, not updating preferences')
 
+    return None
+
+
+def get_manager(check_tautulli: bool = False) -> Manager:
+    """
+    Get the Manager to run with the current preferences. In daemon mode,
+    the Manager (and its interfaces) of the last run is reused unless
+    the preferences were re-read.
+
+    Args:
+        check_tautulli: Whether the Manager should check Tautulli
+            integration. A reused Manager which has not yet checked
+            Tautulli does so now.
+
+    Returns:
+        Manager to run.
+    """
+
+    global warm_manager # pylint: disable=global-statement
+    read_preferences()
+    if not args.daemon:
+        return Manager(check_tautulli=check_tautulli)
+
+    if (warm_manager is None
+        or warm_manager.preferences is not global_objects.pp):
+        log.debug(f'Creating new Manager for daemon')
+        warm_manager = Manager(check_tautulli=check_tautulli)
+    elif check_tautulli:
+        warm_manager.check_tautulli()
+
+    return warm_manager
+
+
+def release_run_state(manager: Manager) -> None:
+    """
+    Release the state of the given Manager's run. In daemon mode, all
+    kept state is also discarded if memory usage exceeds the limit.
+    """
+
+    global preference_mtime, warm_manager # pylint: disable=global-statement
+    if not args.daemon:
+        return None
+
+    manager.clear_run_state()
+    collect()
+
+    # Get resident memory usage (only available on Linux)
+    try:
+        with open('/proc/self/statm', 'r', encoding='utf-8') as file_handle:
+            usage = int(file_handle.read().split()[1]) * PAGESIZE / 2**20
+    except (OSError, IndexError, ValueError):
+        return None
+    log.debug(f'Using {usage:,.1f} MiB of memory')
+
+    # Discard all kept state (forcing a full reload) if using too much memory
+    if usage > args.daemon_memory_limit:
+        log.warning(f'Using {usage:,.0f} MiB of memory - discarding all '
+                    f'state kept between runs')
+        warm_manager, preference_mtime = None, None
+        collect()
+
+    return None
+
 
 def run():
     """
@@ -208,20 +431,29 @@ def run():
     `Manager.run()`. This also checks for a new version of TCM.
     """
 
-    # Check for new version
-    check_for_update()
+    global resume_run # pylint: disable=global-statement
 
-    # Re-read preferences
-    read_preferences()
+    # Check for new version (unless running offline)
+    if cassette is None or cassette.mode == 'record':
+        check_for_update()
 
-    # Reset previously loaded assets
-    RemoteFile.reset_loaded_database()
+    # Reset previously loaded assets (in daemon mode, when re-reading)
+    if not args.daemon:
+        RemoteFile.reset_loaded_database()
 
-    # Create Manager, run, and write missing report
+    # Get Manager, run, and write missing report
     try:
-        tcm = Manager()
-        tcm.run()
-        tcm.report_missing(args.missing)
+        with run_lock:
+            tcm = get_manager(check_tautulli=True)
+            try:
+                tcm.run(resume=resume_run, requested=args.prioritize)
+                resume_run = False
+                tcm.report_missing(args.missing)
+            finally:
+                release_run_state(tcm)
+        if cassette is not None:
+            cassette.flush()
+            log.info(cassette)
     except PermissionError as error:
         log.critical(f'Invalid permissions - {error}')
         sys_exit(1)
@@ -248,9 +480,6 @@ def read_update_list() -> None:
         log.debug(f'Update list does not exist')
         return None
 
-    # Re-read preferences
-    read_preferences()
-
     # Read update list contents
     try:
         with args.tautulli_list.open('r') as file_handle:
@@ -264,8 +493,93 @@ def read_update_list() -> None:
     # Delete (clear) update list
     args.tautulli_list.unlink(missing_ok=True)
 
-    # Remake all indicated cards
-    Manager(check_tautulli=False).remake_cards(update_list)
+    # Re-read preferences, remake all indicated cards
+    with run_lock:
+        tcm = get_manager()
+        try:
+            tcm.remake_cards(update_list)
+        finally:
+            release_run_state(tcm)
+
+
+def process_webhooks(server: 'WebhookServer') -> None:
+    """
+    Remake the cards of all episodes received by the given webhook
+    server, forever. Episodes received while remaking are remade
+    together in the next batch.
+    """
+
+    while True:
+        for media_server, keys in server.get_batch().items():
+            log.info(f'Remaking cards of {len(keys)} {media_server} webhook '
+                     f'item(s)')
+            try:
+                with run_lock:
+                    tcm = get_manager()
+                    try:
+                        tcm.remake_cards(keys, media_server=media_server)
+                    finally:
+                        release_run_state(tcm)
+            except Exception:
+                log.exception(f'Error remaking cards from webhooks')
+
+
+def watch_files(watcher: 'FileWatcher') -> None:
+    """
+    Watch the update list, series YAML files, and source directory of
+    the current preferences with the given watcher.
+    """
+
+    if hasattr(args, 'tautulli_list'):
+        watcher.watch_file(args.tautulli_list)
+    for file in global_objects.pp.series_files:
+        watcher.watch_file(CleanPath(file).sanitize())
+    watcher.watch_directory(global_objects.pp.source_directory)
+
+
+def process_changes(watcher: 'FileWatcher', changed: set[Path]) -> None:
+    """
+    Remake the cards affected by the given changed files - i.e. any
+    listed in the update list, and all series of the changed series
+    YAML files or source directories.
+    """
+
+    # Determine which series files and source directories were changed
+    series_files = {
+        CleanPath(file).sanitize().resolve()
+        for file in global_objects.pp.series_files
+    }
+    source_directory = global_objects.pp.source_directory.resolve()
+    changed_files, changed_directories = set(), set()
+    for path in changed:
+        if path in series_files:
+            changed_files.add(path)
+        elif source_directory in path.parents:
+            relative = path.relative_to(source_directory)
+            changed_directories.add(source_directory / relative.parts[0])
+
+    # Remake cards of update list, then all changed series
+    if (hasattr(args, 'tautulli_list')
+        and args.tautulli_list.resolve() in changed):
+        read_update_list()
+    if changed_files or changed_directories:
+        log.info(f'Remaking cards for {len(changed_files)} changed series '
+                 f'file(s) and {len(changed_directories)} changed source '
+                 f'directories')
+        with run_lock:
+            tcm = get_manager()
+            try:
+                tcm.remake_series(changed_files, changed_directories)
+            finally:
+                release_run_state(tcm)
+
+    # Ignore changes made while processing; re-read update list if re-written
+    watcher.clear()
+    watch_files(watcher)
+    if hasattr(args, 'tautulli_list') and args.tautulli_list.exists():
+        read_update_list()
+        watcher.clear()
+
 
 # Run immediately if specified
 if args.run:
@@ -274,11 +588,8 @@ if args.run:
 
 # Sync if specified
 if args.sync:
-    # Re-read preferences
-    read_preferences()
-
-    # Create Manager, run, and write missing report
-    Manager(check_tautulli=False).sync_series_files()
+    # Re-read preferences, get Manager, and sync
+    get_manager().sync_series_files()
 
 # Schedule first run, which then schedules subsequent runs
 if hasattr(args, 'runtime'):
@@ -286,13 +597,55 @@ if hasattr(args, 'runtime'):
     schedule.every().day.at(args.runtime).do(first_run)
     log.info(f'Starting first run in {schedule.idle_seconds():,.0f} seconds')
 
-# Schedule reading the update list
-if hasattr(args, 'tautulli_list'):
+# Schedule reading the update list (if not watching it)
+if hasattr(args, 'tautulli_list') and not args.watch:
     interval = args.tautulli_frequency['interval']
     unit = args.tautulli_frequency['unit']
     getattr(schedule.every(interval), unit).do(read_update_list)
     log.debug(f'Scheduled read_update_list() every {interval} {unit}')
 
+# Listen for webhooks, remaking cards in the background
+if hasattr(args, 'webhook_port'):
+    if (webhook_token := global_objects.pp.webhook_token) is None:
+        log.critical(f'Listening for webhooks requires a shared token - '
+                     f'specify options/webhook_token')
+        sys_exit(1)
+    from modules.WebhookServer import WebhookServer
+    webhook_server = WebhookServer(
+        webhook_token, args.webhook_host, args.webhook_port,
+        args.webhook_queue,
+    )
+    try:
+        webhook_server.start()
+    except OSError as error:
+        log.critical(f'Cannot listen for webhooks on port {args.webhook_port} '
+                     f'- {error}')
+        sys_exit(1)
+    webhook_thread = Thread(
+        target=process_webhooks, args=(webhook_server,), name='Webhooks',
+        daemon=True,
+    )
+    webhook_thread.start()
+
+# Watch for file changes until stopped, running any scheduled runs
+if args.watch:
+    from modules.FileWatcher import FileWatcher
+    file_watcher = FileWatcher(debounce=args.watch_debounce)
+    watch_files(file_watcher)
+    log.info(f'Watching for changes to files')
+    if hasattr(args, 'tautulli_list') and args.tautulli_list.exists():
+        process_changes(file_watcher, {args.tautulli_list.resolve()})
+    while True:
+        # Run any pending scheduled run, ignoring the changes it makes
+        if (idle := schedule.idle_seconds()) is not None and idle <= 0:
+            schedule.run_pending()
+            file_watcher.clear()
+            continue
+
+        # Wait for changes (or the next scheduled run)
+        if (changed := file_watcher.wait(idle)):
+            process_changes(file_watcher, changed)
+
 # Infinte loop if either infinite argument was indicated
 if hasattr(args, 'runtime') or hasattr(args, 'tautulli_list'):
     while True:
@@ -301,3 +654,7 @@ if hasattr(args, 'runtime') or hasattr(args, 'tautulli_list'):
         next_run = schedule.next_run().strftime("%H:%M:%S %Y-%m-%d")
         log.info(f'Sleeping until {next_run}')
         sleep(max(0, (schedule.next_run()-datetime.today()).total_seconds()))
+
+# Only listening for webhooks, wait forever
+if hasattr(args, 'webhook_port'):
+    webhook_thread.join()
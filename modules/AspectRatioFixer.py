@@ -16,10 +16,7 @@ class AspectRatioFixer(ImageMaker):
     VALID_STYLES = ('copy', 'stretch')
     DEFAULT_STYLE = 'copy'
 
-    """Temporary intermediate files"""
-    __RESIZED_TEMP = ImageMaker.TEMP_DIR / 'ar_temp.png'
-
-    __slots__ = ('source', 'destination', 'style')
+    __slots__ = ('source', 'destination', 'style', '__resized_temp')
 
 
     def __init__(self,
@@ -49,6 +46,9 @@ class AspectRatioFixer(ImageMaker):
         self.destination = destination
         self.style = style.lower()
 
+        # Temporary intermediate files
+        self.__resized_temp = self.get_temporary_file('ar_temp.png')
+
         assert self.style in self.VALID_STYLES, 'Invalid style'
 
 
@@ -87,16 +87,19 @@ class AspectRatioFixer(ImageMaker):
                 f'+profile "*"',
                 f'"{self.source.resolve()}"',
                 f'-resize x1800',
-                f'"{self.__RESIZED_TEMP.resolve()}"',
+                f'"{self.__resized_temp.resolve()}"',
             ])
             self.image_magick.run(resize_command)
 
             # Get dimensions of resized image, exit if too narrow for stretching
             width, height = self.image_magick.get_image_dimensions(
-                self.__RESIZED_TEMP
+                self.__resized_temp
             )
             if width < 400 or height < 1800:
                 log.error(f'Image too narrow for correcting with "stretch" style')
+                self.image_magick.delete_intermediate_images(
+                    self.__resized_temp
+                )
                 return None
 
             # Stretch sides to fit into 3200px wide
@@ -105,14 +108,14 @@ class AspectRatioFixer(ImageMaker):
             command = ' '.join([
                 f'convert',
                 # Crop left 50px and stretch
-                f'\( "{self.__RESIZED_TEMP.resolve()}"',
+                f'\( "{self.__resized_temp.resolve()}"',
                 f'-crop "50x1800+0+0"',
                 f'-resize "{side_width}!" \)',
                 # Crop middle section
-                f'\(  "{self.__RESIZED_TEMP.resolve()}"',
+                f'\(  "{self.__resized_temp.resolve()}"',
                 f'-crop "{width-100}x1800+50+0" \)',
                 # Crop right 50px and stretch
-                f'\(  "{self.__RESIZED_TEMP.resolve()}"',
+                f'\(  "{self.__resized_temp.resolve()}"',
                 f'-crop "50x1800+{width-50}+0"',
                 f'-resize "{side_width}!" \)',
                 # Append like [LEFT 50][MIDDLE][RIGHT 50] left-to-right
@@ -124,7 +127,7 @@ class AspectRatioFixer(ImageMaker):
 
         # Delete temporary images
         if self.style == 'stretch':
-            self.image_magick.delete_intermediate_images(self.__RESIZED_TEMP)
+            self.image_magick.delete_intermediate_images(self.__resized_temp)
 
         log.debug(f'Created "{self.destination.resolve()}"')
         return None
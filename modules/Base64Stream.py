@@ -0,0 +1,119 @@
+from base64 import b64encode
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+class Base64Stream:
+    """
+    This class describes a read-only, file-like stream of the Base64
+    encoding of a file. The file is read and encoded in fixed-size
+    chunks as the stream is read, so the complete file (or its encoding)
+    is never held in memory. Because the length of the encoding is known
+    ahead of time, this can be passed as the body of a request and sent
+    with a Content-Length, rather than chunked.
+    """
+
+    """Number of bytes of the file to encode at a time (a multiple of 3)"""
+    CHUNK_SIZE = 3 * 16384
+
+    __slots__ = ('file', 'size', '__handle', '__chunks', '__buffer')
+
+
+    def __init__(self, file: Path) -> None:
+        """
+        Initialize a stream of the given file. The file is not opened
+        until this stream is entered.
+
+        Args:
+            file: Path to the file to encode.
+        """
+
+        self.file = Path(file)
+        self.size = self.file.stat().st_size
+        self.__handle = None
+        self.__chunks: Optional[Iterator[bytes]] = None
+        self.__buffer = b''
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return f'<Base64Stream of "{self.file.resolve()}", {len(self)} bytes>'
+
+
+    def __len__(self) -> int:
+        """Number of bytes in the Base64 encoding of the file."""
+
+        return 4 * ((self.size + 2) // 3)
+
+
+    def __enter__(self) -> 'Base64Stream':
+        """Open the underlying file for reading."""
+
+        self.__handle = self.file.open('rb')
+        self.__chunks = self.__encode()
+        self.__buffer = b''
+
+        return self
+
+
+    def __exit__(self, *_) -> None:
+        """Close the underlying file."""
+
+        if self.__handle is not None:
+            self.__handle.close()
+            self.__handle = None
+
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate through the encoded chunks of the file."""
+
+        while (chunk := self.read(self.CHUNK_SIZE)):
+            yield chunk
+
+
+    def __encode(self) -> Iterator[bytes]:
+        """
+        Read and encode the underlying file. As each raw chunk is a
+        multiple of 3 bytes, the concatenated chunks are identical to the
+        encoding of the whole file.
+
+        Yields:
+            Base64-encoded chunks of the file.
+        """
+
+        while (raw := self.__handle.read(self.CHUNK_SIZE)):
+            yield b64encode(raw)
+
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read up to the given number of bytes from this stream.
+
+        Args:
+            size: Maximum number of bytes to read. If negative, the rest
+                of the stream is read.
+
+        Returns:
+            Next bytes of the encoded file. Empty if the stream is
+            exhausted.
+
+        Raises:
+            ValueError: This stream has not been entered.
+        """
+
+        if self.__chunks is None:
+            raise ValueError(f'{self!r} must be opened before reading')
+
+        # Encode chunks until enough bytes are buffered (or file is exhausted)
+        while size < 0 or len(self.__buffer) < size:
+            if (chunk := next(self.__chunks, None)) is None:
+                break
+            self.__buffer += chunk
+
+        if size < 0:
+            data, self.__buffer = self.__buffer, b''
+        else:
+            data, self.__buffer = self.__buffer[:size], self.__buffer[size:]
+
+        return data
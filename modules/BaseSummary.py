@@ -34,9 +34,11 @@ class BaseSummary(ImageMaker):
     HEADER_FONT = REF_DIRECTORY.parent / 'Proxima Nova Regular.otf'
     __CREATED_BY_FONT = REF_DIRECTORY.parent / 'star_wars' / 'HelveticaNeue.ttc'
     __TCM_LOGO = REF_DIRECTORY / 'logo.png'
-    __CREATED_BY_TEMPORARY_PATH = ImageMaker.TEMP_DIR / 'user_created_by.png'
 
-    __slots__ = ('show', 'logo', 'created_by', 'output', 'inputs','number_rows')
+    __slots__ = (
+        'show', 'logo', 'created_by', 'output', 'inputs', 'number_rows',
+        '__created_by_temporary_path',
+    )
 
 
     @abstractmethod
@@ -64,6 +66,8 @@ class BaseSummary(ImageMaker):
         self.show = show
         self.logo = show.logo
         self.created_by = created_by
+        self.__created_by_temporary_path = \
+            self.get_temporary_file('user_created_by.png')
 
         # Summary output is just below show media directory
         self.output = show.media_directory / 'Summary.jpg'
@@ -162,9 +166,9 @@ class BaseSummary(ImageMaker):
             f'label:"TitleCardMaker"',
             # Combine all text images with 30px padding
             f'+smush 30',
-            f'"{self.__CREATED_BY_TEMPORARY_PATH.resolve()}"'
+            f'"{self.__created_by_temporary_path.resolve()}"'
         ])
 
         self.image_magick.run(command)
 
-        return self.__CREATED_BY_TEMPORARY_PATH
+        return self.__created_by_temporary_path
@@ -0,0 +1,101 @@
+from collections.abc import Mapping
+from importlib import import_module
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    from modules.BaseCardType import BaseCardType
+
+
+class CardTypeRegistry(Mapping):
+    """
+    This class describes a registry of the built-in card types. Each
+    card type identifier is mapped to the name of its class, and the
+    module of that class is only imported once the card type is first
+    used - so importing the registry does not import every card type.
+
+    The registry is a read-only mapping of identifiers to classes, so it
+    can be used like a dictionary - although iterating its values or
+    items imports every card type.
+    """
+
+    """Package of the modules of all built-in card types"""
+    PACKAGE = 'modules.cards'
+
+
+    def __init__(self, card_types: dict[str, str]) -> None:
+        """
+        Initialize this registry.
+
+        Args:
+            card_types: Mapping of card type identifiers to the names of
+                their classes. Each class must be defined in the module
+                of the same name within the card package.
+        """
+
+        self.__card_types = card_types
+        self.__classes: dict[str, type['BaseCardType']] = {}
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return (f'<CardTypeRegistry of {len(self.__card_types)} card types, '
+                f'{len(self.__classes)} loaded>')
+
+
+    def __getitem__(self, identifier: str) -> type['BaseCardType']:
+        """
+        Get the class of the given card type, importing it if not yet
+        imported.
+
+        Args:
+            identifier: Identifier of the card type.
+
+        Returns:
+            Class of the card type.
+
+        Raises:
+            KeyError if the identifier is not a built-in card type.
+        """
+
+        class_name = self.__card_types[identifier]
+        if (card_class := self.__classes.get(class_name)) is None:
+            module = import_module(f'{self.PACKAGE}.{class_name}')
+            card_class = self.__classes[class_name] = getattr(module,class_name)
+
+        return card_class
+
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate through the identifiers of all card types."""
+
+        return iter(self.__card_types)
+
+
+    def __len__(self) -> int:
+        """Number of card type identifiers."""
+
+        return len(self.__card_types)
+
+
+    def get_identifier(self,
+            card_class: type['BaseCardType'],
+        ) -> Optional[str]:
+        """
+        Get the (first) identifier of the given card type class, without
+        importing any other card types.
+
+        Args:
+            card_class: Card type class to identify.
+
+        Returns:
+            Identifier of the card type. None if the class is not a
+            built-in card type.
+        """
+
+        for identifier, class_name in self.__card_types.items():
+            if (card_class.__module__ == f'{self.PACKAGE}.{class_name}'
+                and card_class.__name__ == class_name):
+                return identifier
+
+        return None
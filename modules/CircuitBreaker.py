@@ -0,0 +1,152 @@
+from threading import Lock
+from time import monotonic
+from typing import Literal
+from weakref import WeakSet
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from modules.Debug import log
+
+
+class CircuitOpenError(RequestsConnectionError):
+    """Exception raised when a request is rejected by an open circuit."""
+
+
+class CircuitBreaker:
+    """
+    This class describes a circuit breaker for all the requests made by
+    a single interface. After some number of consecutive failed requests
+    the circuit "opens", and all requests are immediately rejected (by
+    raising a CircuitOpenError) - rather than each waiting out its own
+    timeouts and retries. After a cooldown, a single probe request is
+    allowed through; if it succeeds the circuit closes again, otherwise
+    it re-opens for another cooldown.
+    """
+
+    """Number of consecutive failures which open the circuit"""
+    FAILURE_THRESHOLD = 5
+
+    """How long (in seconds) the circuit stays open before a probe"""
+    COOLDOWN = 60.0
+
+    """All circuit breakers, for reporting"""
+    _breakers: 'WeakSet[CircuitBreaker]' = WeakSet()
+
+    __slots__ = (
+        'name', 'failure_threshold', 'cooldown', 'state', 'failures',
+        'trips', 'rejected', '__lock', '__opened_at', '__weakref__',
+    )
+
+
+    def __init__(self,
+            name: str,
+            failure_threshold: int = FAILURE_THRESHOLD,
+            cooldown: float = COOLDOWN,
+        ) -> None:
+        """
+        Initialize a closed circuit breaker.
+
+        Args:
+            name: Name (for logging) of the interface this breaker is
+                for.
+            failure_threshold: Number of consecutive failures which open
+                the circuit.
+            cooldown: How long (in seconds) the circuit stays open
+                before allowing a probe request.
+        """
+
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = float(cooldown)
+
+        self.state: Literal['closed', 'open', 'half-open'] = 'closed'
+        self.failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self.__lock = Lock()
+        self.__opened_at = 0.0
+
+        self._breakers.add(self)
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return (f'<CircuitBreaker for {self.name}, state={self.state}, '
+                f'failures={self.failures}/{self.failure_threshold}>')
+
+
+    def __str__(self) -> str:
+        """Returns a string summary of this circuit breaker."""
+
+        return (f'{self.name} circuit is {self.state} - opened {self.trips} '
+                f'time(s), rejected {self.rejected} request(s)')
+
+
+    @classmethod
+    def log_states(cls) -> None:
+        """Log the state of all circuit breakers which have opened."""
+
+        for breaker in list(cls._breakers):
+            if breaker.state != 'closed':
+                log.warning(breaker)
+            elif breaker.trips:
+                log.info(breaker)
+
+
+    def before_request(self) -> None:
+        """
+        Determine whether a request may be made. If the circuit is open
+        and the cooldown has elapsed, the request is allowed through as
+        the single probe.
+
+        Raises:
+            CircuitOpenError: The circuit is open (or a probe is already
+                in progress), and the request is rejected.
+        """
+
+        with self.__lock:
+            if self.state == 'closed':
+                return None
+
+            # Cooldown elapsed, allow this request as the only probe
+            if (self.state == 'open'
+                and monotonic() - self.__opened_at >= self.cooldown):
+                self.state = 'half-open'
+                log.debug(f'Probing {self.name} connection')
+                return None
+
+            self.rejected += 1
+
+        raise CircuitOpenError(f'{self.name} is unavailable - not sending '
+                               f'request')
+
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+
+        with self.__lock:
+            self.failures = 0
+            if self.state != 'closed':
+                log.info(f'Connection to {self.name} restored')
+            self.state = 'closed'
+
+
+    def record_failure(self) -> None:
+        """
+        Record a failed request, opening the circuit if the threshold is
+        reached or the failed request was a probe.
+        """
+
+        with self.__lock:
+            self.failures += 1
+            if (self.state == 'half-open'
+                or (self.state == 'closed'
+                    and self.failures >= self.failure_threshold)):
+                if self.state == 'closed':
+                    self.trips += 1
+                    log.warning(f'{self.name} failed {self.failures} '
+                                f'consecutive requests - skipping requests '
+                                f'for {self.cooldown:.0f}s')
+                self.state = 'open'
+                self.__opened_at = monotonic()
@@ -1,6 +1,10 @@
 from pathlib import Path
 from typing import Any, Iterable, Iterator
-from yaml import safe_load, dump
+from yaml import dump, load
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 from modules import global_objects
 from modules.Debug import log
@@ -76,7 +80,7 @@ class DataFileInterface:
         # Read file
         with self.file.open('r', encoding='utf-8') as file_handle:
             try:
-                yaml = safe_load(file_handle)
+                yaml = load(file_handle, Loader=SafeLoader)
             except Exception as e: # pylint: disable=broad-except
                 log.error(f'Error reading datafile:\n{e}\n')
                 return {}
@@ -227,22 +231,46 @@ class DataFileInterface:
             new_data: Generic new data to write.
         """
 
+        self.add_data_to_entries([(episode_info, new_data)])
+
+
+    def add_data_to_entries(self,
+            entries: Iterable[tuple[EpisodeInfo, dict[str, Any]]],
+        ) -> list[EpisodeInfo]:
+        """
+        Add generic data to many YAML entries at once. This only reads
+        and writes from this interface's file once.
+
+        Args:
+            entries: Iterable of EpisodeInfo objects and the new data to
+                write to their entries.
+
+        Returns:
+            List of the EpisodeInfo objects whose entries were modified.
+            Entries which do not exist in the file are not modified.
+        """
+
         yaml = self.__read_data()
 
-        # Verify this entry already exists, warn and exit if not
-        season_key = f'Season {episode_info.season_number}'
-        if (season_key not in yaml
-            or episode_info.episode_number not in yaml[season_key]):
-            log.error(f'Cannot add data to entry for {episode_info} in '
-                      f'"{self.file.resolve()}" - entry does not exist')
-            return None
+        modified = []
+        for episode_info, new_data in entries:
+            # Verify this entry already exists, warn and skip if not
+            season_key = f'Season {episode_info.season_number}'
+            if (season_key not in yaml
+                or episode_info.episode_number not in yaml[season_key]):
+                log.error(f'Cannot add data to entry for {episode_info} in '
+                          f'"{self.file.resolve()}" - entry does not exist')
+                continue
 
-        # Add new data
-        yaml[season_key][episode_info.episode_number].update(new_data)
+            # Add new data
+            yaml[season_key][episode_info.episode_number].update(new_data)
+            modified.append(episode_info)
 
-        # Write updated data
-        self.__write_data(yaml)
-        return None
+        # Write updated data if any entries were modified
+        if modified:
+            self.__write_data(yaml)
+
+        return modified
 
 
     def add_many_entries(self, new_episodes: Iterable[EpisodeInfo]) -> None:
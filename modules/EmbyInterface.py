@@ -1,9 +1,12 @@
-from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from pathlib import Path
 from sys import exit as sys_exit
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from modules import global_objects
+from modules.Base64Stream import Base64Stream
 from modules.Debug import log
 from modules.Episode import Episode
 from modules.EpisodeDataSource import EpisodeDataSource
@@ -12,6 +15,7 @@ from modules.SeasonPosterSet import SeasonPosterSet
 from modules.MediaServer import MediaServer, SourceImage
 from modules.SeriesInfo import SeriesInfo
 from modules.SyncInterface import SyncInterface
+from modules.UploadScheduler import UploadScheduler
 from modules.WebInterface import WebInterface
 
 if TYPE_CHECKING:
@@ -38,9 +42,13 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
     """Datetime format string for airdates reported by Emby"""
     AIRDATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%f000000Z'
 
-    """Range of years to query series by"""
+    """Range of years to query series by if paged queries are unreliable"""
     YEAR_RANGE = range(1960, datetime.now().year)
 
+    """How many series to request per page, and how many pages at once"""
+    PAGE_SIZE = 500
+    PAGE_CONCURRENCY = 4
+
 
     def __init__(self,
             url: str,
@@ -48,6 +56,7 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
             username: str,
             verify_ssl: bool = True,
             filesize_limit: Optional[int] = None,
+            upload_concurrency: int = UploadScheduler.DEFAULT_CONCURRENCY,
         ) -> None:
         """
         Construct a new instance of an interface to an Emby server.
@@ -60,16 +69,19 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
             verify_ssl: Whether to verify SSL requests.
             filesize_limit: Number of bytes to limit a single file to
                 during upload.
+            upload_concurrency: Maximum number of simultaneous uploads.
 
         Raises:
             SystemExit: Invalid URL/API key provided.
         """
 
         # Intiialize parent classes
-        super().__init__(filesize_limit)
+        super().__init__(filesize_limit, upload_concurrency)
 
         # Store attributes of this Interface
-        self.session = WebInterface('Emby', verify_ssl)
+        self.session = WebInterface(
+            'Emby', verify_ssl, pool_size=upload_concurrency,
+        )
         self.info_set = global_objects.info_set
         self.url = url[:-1] if url.endswith('/') else url
         self.__params = {'api_key': api_key}
@@ -125,6 +137,16 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         return None
 
 
+    def clear_cache(self) -> None:
+        """
+        Clear the cached requests of this interface, and re-map all
+        libraries - e.g. between runs.
+        """
+
+        self.session.clear_cache()
+        self.libraries = self._map_libraries()
+
+
     def _map_libraries(self) -> dict[str, tuple[int]]:
         """
         Map the libraries on this interface's Emby server.
@@ -304,6 +326,122 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         }
 
 
+    @staticmethod
+    def __get_series_year(series: dict[str, Any]) -> Optional[int]:
+        """
+        Get the year of the given series as returned by Emby.
+
+        Args:
+            series: Dictionary of the series details.
+
+        Returns:
+            Production year of the series, or the year of its premiere
+            date if no production year is reported. None if neither are
+            reported.
+        """
+
+        if (year := series.get('ProductionYear')) is not None:
+            return int(year)
+
+        if (premiere := series.get('PremiereDate')):
+            try:
+                return datetime.strptime(premiere[:4], '%Y').year
+            except ValueError:
+                return None
+
+        return None
+
+
+    def __get_folder_series(self,
+            parent_id: str,
+            params: dict[str, Any],
+        ) -> Optional[list[tuple[dict[str, Any], int]]]:
+        """
+        Get all series within the given folder, requesting a page of
+        series at a time. After the first page, multiple pages are
+        requested at once.
+
+        Args:
+            parent_id: ID of the folder to get the series of.
+            params: Base params for all queries.
+
+        Returns:
+            List of tuples of the series details and year of each series
+            in the folder. None if Emby returned incomplete data (e.g.
+            fewer series than it reported, or no years).
+        """
+
+        def get_page(start_index: int) -> dict[str, Any]:
+            return self.session.get(
+                f'{self.url}/Items',
+                params=params | {
+                    'ParentId': parent_id,
+                    'Fields': f'{params["Fields"]},ProductionYear',
+                    'SortBy': 'SortName',
+                    'SortOrder': 'Ascending',
+                    'StartIndex': start_index,
+                    'Limit': self.PAGE_SIZE,
+                },
+                cache=False,
+            )
+
+        # Get first page to determine how many series are in this folder
+        first_page = get_page(0)
+        items = list(first_page['Items'])
+        total = first_page.get('TotalRecordCount', len(items))
+
+        # Get all remaining pages
+        if (start_indices := range(self.PAGE_SIZE, total, self.PAGE_SIZE)):
+            with ThreadPoolExecutor(self.PAGE_CONCURRENCY) as executor:
+                for page in executor.map(get_page, start_indices):
+                    items.extend(page['Items'])
+
+        # Remove any duplicates from pages shifting between requests
+        items = list({series['Id']: series for series in items}.values())
+        if len(items) < total:
+            return None
+
+        # Skip series without a year; if no series have a year, data is broken
+        folder = []
+        for series in items:
+            if (year := self.__get_series_year(series)) is None:
+                log.debug(f'Series {series["Name"]} has no year')
+                continue
+            folder.append((series, year))
+
+        return None if items and not folder else folder
+
+
+    def __get_folder_series_by_year(self,
+            parent_id: str,
+            params: dict[str, Any],
+        ) -> list[tuple[dict[str, Any], int]]:
+        """
+        Get all series within the given folder, requesting the series of
+        each year in YEAR_RANGE individually. This is much slower than
+        paged queries, and is only used if those return incomplete data.
+
+        Args:
+            parent_id: ID of the folder to get the series of.
+            params: Base params for all queries.
+
+        Returns:
+            List of tuples of the series details and year of each series
+            in the folder.
+        """
+
+        folder = []
+        for year in self.YEAR_RANGE:
+            # Get all items (series) in this subfolder for this year
+            response = self.session.get(
+                f'{self.url}/Items',
+                params=params | {'ParentId': parent_id, 'Years': year}
+            )
+            folder.extend((series, year) for series in response['Items'])
+
+        return folder
+
+
     def get_all_series(self,
             filter_libraries: list[str] = [],
             required_tags: list[str] = [],
@@ -348,18 +486,17 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
 
             # Go through every subfolder (the parent ID) in this library
             for parent_id in library_ids:
-                # Have to query year by year, for SOME stupid reason...
-                for year in self.YEAR_RANGE:
-                    # Get all items (series) in this subfolder for this year
-                    response = self.session.get(
-                        f'{self.url}/Items',
-                        params=params | {'ParentId': parent_id, 'Years': year}
-                    )
-
-                    for series in response['Items']:
-                        series_info = SeriesInfo(series['Name'], year,
-                                                 emby_id=series['Id'])
-                        all_series.append((series_info, series['Path'],library))
+                # Get all series in this subfolder a page at a time
+                folder = self.__get_folder_series(parent_id, params)
+                if folder is None:
+                    log.debug(f'Emby returned incomplete series data for '
+                              f'library "{library}" - querying by year')
+                    folder = self.__get_folder_series_by_year(parent_id, params)
+
+                for series, year in folder:
+                    series_info = SeriesInfo(series['Name'], year,
+                                             emby_id=series['Id'])
+                    all_series.append((series_info, series['Path'], library))
 
         # Reset request timeout
         self.REQUEST_TIMEOUT = 30
@@ -469,6 +606,48 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         return series_info.has_id('emby_id')
 
 
+    def get_series_watermark(self,
+            library_name: str,
+            series_info: SeriesInfo,
+        ) -> Optional[tuple[int, int, Optional[str]]]:
+        """
+        Get the watermark of the given series within Emby. This
+        changes whenever an episode is added, removed, or (un)watched.
+
+        Args:
+            library_name: The name of the library containing the series.
+            series_info: The series to get the watermark of.
+
+        Returns:
+            Tuple of the number of episodes, the number of watched
+            episodes, and the date the series was last watched. None if
+            the series has no Emby ID or cannot be queried.
+        """
+
+        # If series has no Emby ID, exit
+        if not series_info.has_id('emby_id'):
+            return None
+
+        # Query for all episodes of this series - the same query as updating
+        # watched statuses, so that the response is reused
+        try:
+            response = self.session.get(
+                f'{self.url}/Shows/{series_info.emby_id}/Episodes',
+                params={'UserId': self.user_id} | self.__params
+            )
+            user_data = [episode['UserData'] for episode in response['Items']]
+        except Exception: # pylint: disable=broad-except
+            log.exception(f'Error getting watermark of {series_info}')
+            return None
+
+        return (
+            len(user_data),
+            sum(1 for data in user_data if data.get('Played')),
+            max((data['LastPlayedDate'] for data in user_data
+                 if data.get('LastPlayedDate')), default=None),
+        )
+
+
     def update_watched_statuses(self,
             library_name: str,
             series_info: SeriesInfo,
@@ -537,6 +716,55 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         return None
 
 
+    def __upload_card(self,
+            item_id: str,
+            card: Path,
+            series_info: SeriesInfo,
+        ) -> bool:
+        """
+        Compress and upload the given card to the given Emby item. This
+        is executed by the UploadScheduler, so it might be called from
+        any thread.
+
+        Args:
+            item_id: Emby ID of the item to upload the card to.
+            card: Path to the card to upload.
+            series_info: The series being updated (for logging).
+
+        Returns:
+            True if the card was uploaded, False if the card could not be
+            compressed.
+
+        Raises:
+            Exception: Any Exception raised while uploading the card -
+                including HTTPError if the server rejected the upload.
+        """
+
+        # Shrink image if necessary, skip if cannot be compressed
+        if (compressed := self.compress_image(card)) is None:
+            return False
+
+        # Submit POST request for image upload; image content must be
+        # Base64-encoded, so stream the encoding from the file. HTTP errors
+        # (e.g. an overloaded server) are raised like any other failure
+        try:
+            with Base64Stream(compressed) as card_base64:
+                self.session.session.post(
+                    url=f'{self.url}/Items/{item_id}/Images/Primary',
+                    headers={'Content-Type': 'image/jpeg'},
+                    params=self.__params,
+                    data=card_base64,
+                ).raise_for_status()
+        except Exception:
+            log.exception(f'Unable to upload {card.resolve()} to '
+                          f'"{series_info}"')
+            raise
+        finally:
+            self.remove_compressed_image(card, compressed)
+
+        return True
+
+
     def set_title_cards(self,
             library_name: str,
             series_info: SeriesInfo,
@@ -568,47 +796,35 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         if len(filtered_episodes) == 0:
             return None
 
-        # Go through each remaining episode and load the card
-        loaded_count = 0
-        for episode in filtered_episodes.values():
-            # Skip episodes without Emby ID's (e.g. not in Emby)
-            if (emby_id := episode.episode_info.emby_id) is None:
-                continue
-
-            # Shrink image if necessary, skip if cannot be compressed
-            if (card := self.compress_image(episode.destination)) is None:
-                continue
-
-            # Image content must be Base64-encoded
-            card_base64 = b64encode(card.read_bytes())
-
-            # Submit POST request for image upload
-            try:
-                self.session.session.post(
-                    url=f'{self.url}/Items/{emby_id}/Images/Primary',
-                    headers={'Content-Type': 'image/jpeg'},
-                    params=self.__params,
-                    data=card_base64,
-                )
-                loaded_count += 1
-            except Exception as e:
-                log.exception(f'Unable to upload {card.resolve()} to '
-                              f'{series_info}', e)
+        # Determine which remaining episodes have cards to upload
+        uploads, records = [], {}
+        for key, episode in filtered_episodes.items():
+            # Skip episodes without ID's (e.g. not in Emby)
+            if (item_id := episode.episode_info.emby_id) is None:
                 continue
 
-            # Update loaded database for this episode
-            self.loaded_db.upsert({
+            uploads.append((key, partial(
+                self.__upload_card, item_id, episode.destination, series_info,
+            )))
+            records[key] = {
                 'library': library_name,
                 'series': series_info.full_name,
                 'season': episode.episode_info.season_number,
                 'episode': episode.episode_info.episode_number,
                 'filesize': episode.destination.stat().st_size,
                 'spoiler': episode.spoil_type,
-            }, self._get_condition(library_name, series_info, episode))
+            }
+
+        # Upload cards, update loaded database with all uploaded cards
+        uploaded, _, _ = self.upload_scheduler.run(uploads)
+        self._upsert_loaded_records(
+            self.loaded_db, library_name, series_info,
+            [records[key] for key in uploaded],
+        )
 
         # Log load operations to user
-        if loaded_count > 0:
-            log.info(f'Loaded {loaded_count} cards for "{series_info}"')
+        if uploaded:
+            log.info(f'Loaded {len(uploaded)} cards for "{series_info}"')
 
         return None
 
@@ -670,6 +886,97 @@ class EmbyInterface(EpisodeDataSource, MediaServer, SyncInterface):
         return response
 
 
+    def get_episode_details(self,
+            item_id: str,
+        ) -> list[tuple[SeriesInfo, EpisodeInfo, str]]:
+        """
+        Get all details for all episodes indicated by the given
+        Emby item ID.
+
+        Args:
+            item_id: ID of the item within Emby.
+
+        Returns:
+            List of tuples of the SeriesInfo, EpisodeInfo, and the
+            library name corresponding to the given item. If the item
+            is a series/season, then all contained episodes are
+            detailed. An empty list is returned if the item(s) cannot be
+            found.
+        """
+
+        try:
+            # Get the item, and the series it belongs to
+            item = self.session.get(
+                f'{self.url}/Users/{self.user_id}/Items/{item_id}',
+                params=self.__params, cache=False,
+            )
+            if (item_type := item.get('Type')) == 'Series':
+                series, series_id = item, item['Id']
+            elif item_type in ('Season', 'Episode'):
+                series_id = item['SeriesId']
+                series = self.session.get(
+                    f'{self.url}/Users/{self.user_id}/Items/{series_id}',
+                    params=self.__params,
+                )
+            else:
+                log.warning(f'Emby item {item_id} is a {item_type}')
+                return []
+
+            # Series must have a year
+            if (year := self.__get_series_year(series)) is None:
+                log.warning(f'Emby item {item_id} has no year')
+                return []
+            series_info = self.info_set.get_series_info(series['Name'], year)
+
+            # Identify library from the ancestors of the series
+            ancestors = self.session.get(
+                f'{self.url}/Items/{series_id}/Ancestors',
+                params=self.__params,
+            )
+            ancestor_ids = {
+                int(ancestor['Id']) for ancestor in ancestors
+                if str(ancestor.get('Id', '')).isdigit()
+            }
+            library_name = next(
+                (name for name, folder_ids in self.libraries.items()
+                 if ancestor_ids.intersection(folder_ids)),
+                None
+            )
+            if library_name is None:
+                log.warning(f'Emby item {item_id} is not in a known '
+                            f'library')
+                return []
+
+            # Get all indicated episodes
+            if item_type == 'Episode':
+                episodes = [item]
+            else:
+                episodes = self.session.get(
+                    f'{self.url}/Shows/{series_id}/Episodes',
+                    params=self.__params | (
+                        {'SeasonId': item_id} if item_type == 'Season'
+                        else {}
+                    ),
+                    cache=False,
+                )['Items']
+
+            return [
+                (series_info,
+                 EpisodeInfo(
+                     episode['Name'], episode['ParentIndexNumber'],
+                     episode['IndexNumber'],
+                 ),
+                 library_name)
+                for episode in episodes
+                if (episode.get('IndexNumber') is not None
+                    and episode.get('ParentIndexNumber') is not None)
+            ]
+        except Exception:
+            log.exception(f'Emby item {item_id} has some error')
+
+        return []
+
+
     def get_libraries(self) -> list[str]:
         """
         Get the names of all libraries within this server.
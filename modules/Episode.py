@@ -23,7 +23,7 @@ class Episode:
     __slots__ = (
         'episode_info', 'card_class', '_base_source', 'source', 'destination',
         'downloadable_source', 'extra_characteristics', 'given_keys', 'watched',
-        'blur', 'grayscale', 'spoil_type',
+        'blur', 'grayscale', 'spoil_type', 'card_exists',
     )
 
 
@@ -63,6 +63,10 @@ class Episode:
         self.destination = destination
         self.downloadable_source = True
 
+        # Whether the card was seen to exist - it can then only go missing if
+        # deleted, so it does not need to be checked again
+        self.card_exists = False
+
         # Store given keys and extra characteristics
         self.given_keys = given_keys
         self.extra_characteristics = extras
@@ -206,6 +210,9 @@ class Episode:
             True if card was deleted, False otherwise.
         """
 
+        # Card is missing whether or not it is deleted here
+        self.card_exists = False
+
         # No destination, nothing to delete
         if self.destination is None or not self.destination.exists():
             return False
@@ -236,7 +243,7 @@ class MultiEpisode:
     __slots__ = (
         'season_number', 'episode_start', 'episode_end', 'abs_start', 'abs_end',
         '_first_episode', 'episode_info', 'destination', 'episode_range',
-        'word_set',
+        'word_set', 'card_exists',
     )
 
 
@@ -291,6 +298,7 @@ class MultiEpisode:
 
         # Set object attributes from first episode
         self.episode_info = deepcopy(self._first_episode.episode_info)
+        self.card_exists = False
 
         # Create modified WordSet with words for the start/ends of this range
         self.word_set = WordSet()
@@ -0,0 +1,409 @@
+from ctypes import CDLL, get_errno
+from ctypes.util import find_library
+from os import close, read, scandir, strerror
+from pathlib import Path
+from select import select
+from struct import calcsize, unpack_from
+from sys import platform
+from time import monotonic, sleep
+from typing import Literal, Optional
+
+from modules.Debug import log
+
+
+class FileWatcher:
+    """
+    This class describes a watcher of files and directories. On Linux,
+    changes are reported by the kernel (inotify), so nothing is polled
+    while idle; elsewhere - or if inotify is unavailable - the watched
+    paths are polled for changes.
+
+    Bursts of changes are debounced: once a change is seen, changes are
+    collected until none occur for the debounce period (or the maximum
+    delay elapses), and are then reported together.
+    """
+
+    """Default debounce period and maximum delay (in seconds)"""
+    DEFAULT_DEBOUNCE = 2.0
+    MAX_DELAY = 30.0
+
+    """Default interval (in seconds) between polls if polling"""
+    DEFAULT_POLL_INTERVAL = 10.0
+
+    """inotify flags - see inotify(7)"""
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+                  | IN_DELETE)
+
+    """Format of the fixed-size header of an inotify event"""
+    EVENT_FORMAT = 'iIII'
+    EVENT_SIZE = calcsize(EVENT_FORMAT)
+
+    __slots__ = (
+        'debounce', 'poll_interval', 'mode', '__libc', '__fd', '__watches',
+        '__watched', '__files', '__directories', '__snapshot',
+    )
+
+
+    def __init__(self,
+            debounce: float = DEFAULT_DEBOUNCE,
+            poll_interval: float = DEFAULT_POLL_INTERVAL,
+        ) -> None:
+        """
+        Initialize a watcher with nothing watched.
+
+        Args:
+            debounce: How long (in seconds) no changes must occur before
+                a burst of changes is reported.
+            poll_interval: How often (in seconds) to poll for changes if
+                inotify is unavailable.
+        """
+
+        self.debounce = max(0.0, float(debounce))
+        self.poll_interval = max(0.1, float(poll_interval))
+        self.mode: Literal['inotify', 'polling'] = 'polling'
+
+        # Watched files, and watched directories (and whether recursive)
+        self.__files: set[Path] = set()
+        self.__directories: dict[Path, bool] = {}
+
+        # Watch descriptors of each watched directory, and polled snapshot
+        self.__watches: dict[int, Path] = {}
+        self.__watched: set[Path] = set()
+        self.__snapshot: dict[Path, tuple[float, int]] = {}
+
+        # Attempt to use inotify
+        self.__libc, self.__fd = None, -1
+        if platform.startswith('linux'):
+            try:
+                self.__libc = CDLL(find_library('c'), use_errno=True)
+                self.__fd = self.__libc.inotify_init1(
+                    self.IN_NONBLOCK | self.IN_CLOEXEC
+                )
+                if self.__fd < 0:
+                    raise OSError(get_errno(), strerror(get_errno()))
+                self.mode = 'inotify'
+            except (AttributeError, OSError) as exc:
+                log.debug(f'inotify is unavailable ({exc}) - polling instead')
+
+        log.debug(f'Watching files with {self.mode}')
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return (f'<FileWatcher using {self.mode}, {len(self.__files)} files, '
+                f'{len(self.__directories)} directories>')
+
+
+    def close(self) -> None:
+        """Stop watching all files and directories."""
+
+        if self.__fd >= 0:
+            close(self.__fd)
+            self.__fd = -1
+
+
+    def __fallback_to_polling(self, reason: str) -> None:
+        """Stop using inotify, and poll all watched paths instead."""
+
+        log.warning(f'Cannot watch files with inotify ({reason}) - polling '
+                    f'every {self.poll_interval:.0f}s instead')
+        self.close()
+        self.mode = 'polling'
+        self.__watches, self.__watched = {}, set()
+        self.__snapshot = self.__take_snapshot()
+
+
+    def __add_watch(self, directory: Path) -> None:
+        """Add an inotify watch on the given directory."""
+
+        if self.mode != 'inotify' or directory in self.__watched:
+            return None
+
+        descriptor = self.__libc.inotify_add_watch(
+            self.__fd, str(directory).encode(), self.WATCH_MASK
+        )
+        if descriptor < 0:
+            self.__fallback_to_polling(strerror(get_errno()))
+        else:
+            self.__watches[descriptor] = directory
+            self.__watched.add(directory)
+
+        return None
+
+
+    def __walk(self, directory: Path) -> list[Path]:
+        """Get the given directory and all its subdirectories."""
+
+        directories = [directory]
+        try:
+            for entry in scandir(directory):
+                if entry.is_dir(follow_symlinks=False):
+                    directories.extend(self.__walk(Path(entry.path)))
+        except OSError:
+            pass
+
+        return directories
+
+
+    def watch_file(self, file: Path) -> None:
+        """
+        Watch the given file. The file does not need to exist, and may
+        be deleted and recreated - but its directory must exist, so that
+        a mistyped path is not silently created.
+
+        Args:
+            file: File to watch.
+        """
+
+        file = Path(file).resolve()
+        if file in self.__files:
+            return None
+
+        if not file.parent.is_dir():
+            log.warning(f'Cannot watch "{file}" - directory "{file.parent}" '
+                        f'does not exist')
+            return None
+
+        self.__files.add(file)
+        self.__add_watch(file.parent)
+        if self.mode == 'polling':
+            self.__snapshot.update(self.__take_snapshot([file.parent]))
+
+        return None
+
+
+    def watch_directory(self, directory: Path, recursive: bool = True) -> None:
+        """
+        Watch all the files within the given directory.
+
+        Args:
+            directory: Directory to watch.
+            recursive: Whether to also watch all subdirectories
+                (including those created later).
+        """
+
+        directory = Path(directory).resolve()
+        if directory in self.__directories:
+            return None
+
+        if not directory.is_dir():
+            log.warning(f'Cannot watch directory "{directory}" - it does not '
+                        f'exist')
+            return None
+
+        self.__directories[directory] = recursive
+        for subdirectory in (self.__walk(directory) if recursive
+                             else [directory]):
+            self.__add_watch(subdirectory)
+        if self.mode == 'polling':
+            self.__snapshot.update(self.__take_snapshot([directory]))
+
+        return None
+
+
+    def __is_recursively_watched(self, path: Path) -> bool:
+        """Whether the given path is within a recursive watch."""
+
+        return any(
+            recursive and directory in path.parents
+            for directory, recursive in self.__directories.items()
+        )
+
+
+    def __is_watched(self, path: Path) -> bool:
+        """Whether changes to the given path should be reported."""
+
+        return (path in self.__files
+                or path.parent in self.__directories
+                or self.__is_recursively_watched(path))
+
+
+    def __take_snapshot(self,
+            directories: Optional[list[Path]] = None,
+        ) -> dict[Path, tuple[float, int]]:
+        """
+        Get the modification time and size of every watched file in the
+        given (or all watched) directories.
+        """
+
+        if directories is None:
+            directories = list(self.__directories)
+            directories += [file.parent for file in self.__files]
+
+        snapshot = {}
+        for directory in directories:
+            recursive = self.__directories.get(directory, False)
+            for subdirectory in (self.__walk(directory) if recursive
+                                 else [directory]):
+                try:
+                    for entry in scandir(subdirectory):
+                        path = Path(entry.path)
+                        if entry.is_file() and self.__is_watched(path):
+                            stat = entry.stat()
+                            snapshot[path] = (stat.st_mtime, stat.st_size)
+                except OSError:
+                    continue
+
+        return snapshot
+
+
+    def __poll(self, timeout: Optional[float]) -> set[Path]:
+        """
+        Poll for changes until any occur, or the timeout elapses.
+
+        Args:
+            timeout: Maximum number of seconds to wait. None to wait
+                indefinitely.
+
+        Returns:
+            Set of changed paths. Empty if the timeout elapsed.
+        """
+
+        start = monotonic()
+        while True:
+            snapshot = self.__take_snapshot()
+            changed = {
+                path for path in set(snapshot) | set(self.__snapshot)
+                if snapshot.get(path) != self.__snapshot.get(path)
+            }
+            self.__snapshot = snapshot
+            if changed:
+                return changed
+
+            # Wait for next poll, or stop if timeout will elapse
+            if timeout is None:
+                sleep(self.poll_interval)
+            elif (remaining := timeout - (monotonic() - start)) <= 0:
+                return set()
+            else:
+                sleep(min(self.poll_interval, remaining))
+
+
+    def __read_buffer(self) -> set[Path]:
+        """
+        Read all available inotify events.
+
+        Returns:
+            Set of changed (watched) paths.
+        """
+
+        changed = set()
+        try:
+            buffer = read(self.__fd, 65536)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset + self.EVENT_SIZE <= len(buffer):
+            descriptor, mask, _, length = unpack_from(
+                self.EVENT_FORMAT, buffer, offset
+            )
+            name = buffer[offset + self.EVENT_SIZE:
+                          offset + self.EVENT_SIZE + length]
+            offset += self.EVENT_SIZE + length
+
+            # Events were lost, report all watched paths as changed
+            if mask & self.IN_Q_OVERFLOW:
+                log.debug(f'inotify queue overflowed')
+                changed.update(self.__files, self.__directories)
+                continue
+
+            if (directory := self.__watches.get(descriptor)) is None:
+                continue
+            path = directory / name.rstrip(b'\0').decode(errors='replace')
+
+            # New subdirectory of a recursively watched directory
+            if (mask & self.IN_ISDIR
+                and mask & (self.IN_CREATE | self.IN_MOVED_TO)
+                and self.__is_recursively_watched(path)):
+                for subdirectory in self.__walk(path):
+                    self.__add_watch(subdirectory)
+
+            if self.__is_watched(path):
+                changed.add(path)
+
+        return changed
+
+
+    def __read_events(self, timeout: Optional[float]) -> set[Path]:
+        """
+        Read inotify events until any watched path changes, or the
+        timeout elapses.
+
+        Args:
+            timeout: Maximum number of seconds to wait. None to wait
+                indefinitely.
+
+        Returns:
+            Set of changed paths. Empty if the timeout elapsed.
+        """
+
+        start = monotonic()
+        while True:
+            remaining = None
+            if timeout is not None:
+                remaining = max(0.0, timeout - (monotonic() - start))
+            if not select([self.__fd], [], [], remaining)[0]:
+                return set()
+
+            # Events may only be for unwatched files, if so keep waiting
+            if (changed := self.__read_buffer()) or remaining == 0:
+                return changed
+
+
+    def __get_changes(self, timeout: Optional[float]) -> set[Path]:
+        """Get the next changes with the active mode."""
+
+        if self.mode == 'inotify':
+            return self.__read_events(timeout)
+
+        return self.__poll(timeout)
+
+
+    def wait(self, timeout: Optional[float] = None) -> set[Path]:
+        """
+        Wait for a burst of changes to any watched file.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the first
+                change. None to wait indefinitely.
+
+        Returns:
+            Set of all paths changed during the burst. Empty if no
+            changes occurred before the timeout elapsed.
+        """
+
+        # Wait for the first change(s)
+        if not (changed := self.__get_changes(timeout)):
+            return changed
+
+        # Collect changes until none occur for the debounce period
+        start = monotonic()
+        while (remaining := self.MAX_DELAY - (monotonic() - start)) > 0:
+            if not (new_changes := self.__get_changes(
+                    min(self.debounce, remaining))):
+                break
+            changed |= new_changes
+
+        log.debug(f'Detected changes to {len(changed)} file(s)')
+        return changed
+
+
+    def clear(self) -> None:
+        """Discard all changes which have not been waited for."""
+
+        if self.mode == 'inotify':
+            while select([self.__fd], [], [], 0)[0]:
+                self.__read_buffer()
+        else:
+            self.__snapshot = self.__take_snapshot()
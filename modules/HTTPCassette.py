@@ -0,0 +1,297 @@
+from atexit import register as register_exit
+from base64 import b64decode, b64encode
+from hashlib import sha1
+from io import BytesIO
+from json import dumps, loads
+from pathlib import Path
+from random import Random
+from threading import Lock
+from time import sleep
+from typing import Literal, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests import PreparedRequest, Response
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3 import HTTPResponse
+
+from modules.Debug import log
+
+
+class HTTPCassette:
+    """
+    This class describes a "cassette" of recorded HTTP traffic. While
+    recording, every response received by a WebInterface (including
+    those made through plexapi and tmdbapis) is written to the cassette
+    directory. While replaying, requests are answered from the cassette
+    instead of the network - optionally with added latency and injected
+    errors - so that complete runs can be reproduced and benchmarked
+    without any live servers.
+
+    Identical requests are replayed in the order they were recorded; once
+    all recordings of a request are exhausted, the last is repeated.
+    Recordings are buffered in memory, and written to the cassette when
+    flushed (or at exit).
+    """
+
+    """Query parameters and headers which are removed before recording"""
+    SECRET_KEYS = ('api_key', 'apikey', 'x-plex-token', 'token')
+
+    """Response headers which do not apply to the recorded (decoded) body"""
+    IGNORED_HEADERS = (
+        'content-encoding', 'content-length', 'transfer-encoding',
+        'set-cookie',
+    )
+
+    """Cassette in use by all WebInterface objects (if any)"""
+    active: Optional['HTTPCassette'] = None
+
+    __slots__ = (
+        'directory', 'mode', 'latency', 'error_rate', '__random', '__lock',
+        '__positions', '__pending', 'recorded', 'replayed', 'missed',
+        'injected',
+    )
+
+
+    def __init__(self,
+            directory: Path,
+            mode: Literal['record', 'replay'],
+            *,
+            latency: float = 0.0,
+            error_rate: float = 0.0,
+            seed: int = 0,
+        ) -> None:
+        """
+        Initialize a cassette in the given directory.
+
+        Args:
+            directory: Directory to record responses to, or replay
+                responses from.
+            mode: Whether to record or replay responses.
+            latency: (Keyword) Seconds to delay each replayed response.
+            error_rate: (Keyword) Fraction (0-1) of replayed requests
+                which fail with a connection error.
+            seed: (Keyword) Seed for error injection, so that injected
+                errors are repeatable.
+        """
+
+        self.directory = Path(directory)
+        self.mode = mode
+        self.latency = max(0.0, float(latency))
+        self.error_rate = min(1.0, max(0.0, float(error_rate)))
+        self.__random = Random(seed)
+        self.__lock = Lock()
+        self.__positions: dict[str, int] = {}
+        self.__pending: dict[str, list[dict]] = {}
+
+        # Metrics
+        self.recorded = 0
+        self.replayed = 0
+        self.missed = 0
+        self.injected = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return (f'<HTTPCassette {self.mode} "{self.directory.resolve()}", '
+                f'latency={self.latency}s, error_rate={self.error_rate}>')
+
+
+    def __str__(self) -> str:
+        """Returns a string summary of the metrics of this cassette."""
+
+        if self.mode == 'record':
+            return f'Recorded {self.recorded} responses'
+
+        return (f'Replayed {self.replayed} responses, {self.missed} '
+                f'unrecorded requests, {self.injected} injected errors')
+
+
+    @classmethod
+    def activate(cls,
+            directory: Path,
+            mode: Literal['record', 'replay'],
+            **kwargs,
+        ) -> 'HTTPCassette':
+        """
+        Create a cassette and use it for all WebInterface requests.
+
+        Args:
+            directory: Directory of the cassette.
+            mode: Whether to record or replay responses.
+            kwargs: Any keyword arguments to initialize the cassette
+                with.
+
+        Returns:
+            The activated cassette.
+        """
+
+        cls.active = cls(directory, mode, **kwargs)
+        log.info(f'Using {cls.active!r}')
+
+        # Write any buffered recordings on exit
+        if mode == 'record':
+            register_exit(cls.active.flush)
+
+        return cls.active
+
+
+    def __redact_url(self, url: str) -> str:
+        """Get the given URL without any secret query parameters."""
+
+        parts = urlsplit(url)
+        query = urlencode(sorted(
+            (key, value) for key, value in parse_qsl(parts.query)
+            if key.lower() not in self.SECRET_KEYS
+        ))
+
+        return urlunsplit(parts._replace(query=query))
+
+
+    def __get_key(self, request: PreparedRequest) -> str:
+        """
+        Get the key which identifies recordings of the given request.
+        This is a hash of the method, redacted URL, and body.
+
+        Args:
+            request: Request to get the key of.
+
+        Returns:
+            Hexadecimal hash of the request.
+        """
+
+        body = request.body or b''
+        if isinstance(body, str):
+            body = body.encode()
+        elif not isinstance(body, bytes):
+            body = b'<stream>'
+
+        url = self.__redact_url(request.url)
+        key = sha1(f'{request.method} {url}'.encode())
+        key.update(sha1(body).digest())
+
+        return key.hexdigest()
+
+
+    def record(self, request: PreparedRequest, response: Response) -> None:
+        """
+        Record the given response to the given request.
+
+        Args:
+            request: Request which was sent.
+            response: Response which was received.
+        """
+
+        key = self.__get_key(request)
+        headers = {
+            header: value for header, value in response.headers.items()
+            if header.lower() not in self.IGNORED_HEADERS
+            and header.lower() not in self.SECRET_KEYS
+        }
+        recording = {
+            'method': request.method,
+            'url': self.__redact_url(request.url),
+            'status_code': response.status_code,
+            'reason': response.reason,
+            'headers': headers,
+            'body': b64encode(response.content).decode(),
+        }
+
+        # Buffer as a recording of this request, written when flushed
+        with self.__lock:
+            self.__pending.setdefault(key, []).append(recording)
+            self.recorded += 1
+
+
+    def flush(self) -> None:
+        """
+        Write all buffered recordings to the cassette, appending them to
+        any existing recordings of the same requests.
+        """
+
+        with self.__lock:
+            pending, self.__pending = self.__pending, {}
+            for key, new_recordings in pending.items():
+                file = self.directory / f'{key}.json'
+                recordings = loads(file.read_text()) if file.exists() else []
+                recordings.extend(new_recordings)
+                file.write_text(dumps(recordings, indent=2))
+
+        if pending:
+            log.debug(f'Wrote recordings of {len(pending)} requests to '
+                      f'{self!r}')
+
+
+    def replay(self, request: PreparedRequest) -> Response:
+        """
+        Replay the recorded response to the given request.
+
+        Args:
+            request: Request being sent.
+
+        Returns:
+            The recorded Response.
+
+        Raises:
+            ConnectionError: The request was never recorded, or an error
+                was injected.
+        """
+
+        # Simulate network latency
+        if self.latency:
+            sleep(self.latency)
+
+        key = self.__get_key(request)
+        with self.__lock:
+            # Inject error
+            if self.error_rate and self.__random.random() < self.error_rate:
+                self.injected += 1
+                raise RequestsConnectionError(
+                    f'Injected error for {request.method} '
+                    f'{self.__redact_url(request.url)}', request=request
+                )
+
+            # Get next recording of this request
+            file = self.directory / f'{key}.json'
+            if not file.exists():
+                self.missed += 1
+                log.debug(f'No recording of {request.method} '
+                          f'{self.__redact_url(request.url)}')
+                raise RequestsConnectionError(
+                    f'No recording of {request.method} '
+                    f'{self.__redact_url(request.url)}', request=request
+                )
+            recordings = loads(file.read_text())
+            position = self.__positions.get(key, 0)
+            self.__positions[key] = position + 1
+            self.replayed += 1
+
+        recording = recordings[min(position, len(recordings) - 1)]
+
+        # Construct Response from recording - with a raw body that can also
+        # be streamed (e.g. by iter_content or raw.read)
+        content = b64decode(recording['body'])
+        response = Response()
+        response.status_code = recording['status_code']
+        response.reason = recording['reason']
+        response.headers = CaseInsensitiveDict(recording['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = HTTPResponse(
+            body=BytesIO(content),
+            headers=recording['headers'],
+            status=recording['status_code'],
+            reason=recording['reason'],
+            preload_content=False,
+            decode_content=False,
+        )
+        # pylint: disable=protected-access
+        response._content = content
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+
+        return response
@@ -1,15 +1,18 @@
-from os import environ, name as os_name
+from os import cpu_count, environ, name as os_name
 from pathlib import Path
 from random import choices as random_choices
 from re import findall
 from shlex import split as command_split
 from string import hexdigits
 from subprocess import Popen, PIPE, TimeoutExpired
-from typing import Iterable, Literal, NamedTuple, Optional, overload
+from threading import Condition
+from time import monotonic
+from typing import Any, Iterable, Literal, NamedTuple, Optional, overload
 
 from imagesize import get as im_get
 
 from modules.Debug import log
+from modules import global_objects
 
 
 class Dimensions(NamedTuple): # pylint: disable=missing-class-docstring
@@ -35,6 +38,14 @@ class ImageMagickInterface:
 
     >>> docker run --name="ImageMagick" --entrypoint="/bin/bash" \
         -dit -v "/mnt/user/":"/mnt/user/" 'dpokidov/imagemagick'
+
+    All commands of this process share a memory budget. The memory of
+    each command is estimated from the largest image geometry within it
+    (or the card dimensions), and a command is only started once it fits
+    within the budget alongside the commands already running. Each
+    command is limited (via the MAGICK_*_LIMIT environment variables) to
+    its estimate, beyond which ImageMagick caches pixels on disk instead
+    of in memory.
     """
 
     """How long to wait before terminating a command as timed out"""
@@ -49,6 +60,22 @@ class ImageMagickInterface:
     """Temporary file location for svg -> png conversion"""
     TEMPORARY_SVG_FILE = TEMP_DIR / 'temp_logo.svg'
 
+    """Estimated bytes of each pixel of an image (16-bit RGBA)"""
+    BYTES_PER_PIXEL = 8
+
+    """Estimated number of full-size images held by a single command"""
+    IMAGES_PER_COMMAND = 6
+
+    """Fraction of the system memory used as the default memory budget"""
+    DEFAULT_MEMORY_FRACTION = 0.5
+
+    """Memory budget shared by all commands, and its usage"""
+    __governor = Condition()
+    __usage: dict[str, float] = {
+        'commands': 0, 'waited': 0, 'wait_seconds': 0.0, 'in_flight': 0,
+        'running': 0, 'peak': 0,
+    }
+
     """Characters that must be escaped in commands"""
     __REQUIRED_ESCAPE_CHARACTERS = ('\\', '"', '`', '%')
 
@@ -133,12 +160,164 @@ class ImageMagickInterface:
         return string
 
 
+    @classmethod
+    def get_memory_budget(cls) -> Optional[int]:
+        """
+        Get the memory budget (in bytes) shared by all commands. This is
+        the `imagemagick_memory_budget` of the global preferences, or a
+        fraction of the system memory if that is not set.
+
+        Returns:
+            Memory budget in bytes. None if there is no budget.
+        """
+
+        budget = getattr(global_objects.pp, 'imagemagick_memory_budget', None)
+        if budget is not None:
+            return int(budget * 1024 * 1024)
+
+        # System memory is only available on Unix
+        try:
+            from os import sysconf # pylint: disable=import-outside-toplevel
+            memory = sysconf('SC_PAGE_SIZE') * sysconf('SC_PHYS_PAGES')
+        except (ImportError, ValueError, OSError):
+            return None
+
+        return int(memory * cls.DEFAULT_MEMORY_FRACTION)
+
+
+    @staticmethod
+    def get_thread_limit() -> Optional[int]:
+        """
+        Get the number of threads each command may use. This is the
+        `imagemagick_threads` of the global preferences, or the CPUs
+        divided evenly between the concurrent render stages of the
+        pipeline.
+
+        Returns:
+            Number of threads. None if commands are not limited.
+        """
+
+        pp = global_objects.pp
+        if (threads := getattr(pp, 'imagemagick_threads', None)) is not None:
+            return threads
+        if getattr(pp, 'execution_mode', None) != 'pipeline':
+            return None
+
+        concurrency = getattr(pp, 'render_concurrency', 1)
+        return max(1, (cpu_count() or 1) // max(1, concurrency))
+
+
+    def estimate_memory(self, command: str) -> int:
+        """
+        Estimate the memory (in bytes) required by the given command.
+
+        Args:
+            command: The command (as string) being estimated.
+
+        Returns:
+            Estimated memory of the command in bytes.
+        """
+
+        # Largest geometry within the command, at least the card size
+        try:
+            width, height = map(
+                int, global_objects.pp.card_dimensions.split('x')
+            )
+            pixels = width * height
+        except (AttributeError, ValueError):
+            pixels = 0
+        for width, height in findall(r'\b(\d+)x(\d+)\b', command):
+            pixels = max(pixels, int(width) * int(height))
+
+        return pixels * self.BYTES_PER_PIXEL * self.IMAGES_PER_COMMAND
+
+
+    @classmethod
+    def __admit(cls, memory: int, budget: Optional[int]) -> None:
+        """
+        Wait until a command of the given memory fits within the memory
+        budget, and reserve that memory. Every call must be followed by
+        a call to `__release()`.
+
+        Args:
+            memory: Estimated memory of the command in bytes.
+            budget: Memory budget in bytes. None if there is no budget.
+        """
+
+        start = monotonic()
+        with cls.__governor:
+            # A command is always admitted if no others are running
+            def fits() -> bool:
+                return (budget is None
+                        or not cls.__usage['running']
+                        or cls.__usage['in_flight'] + memory <= budget)
+
+            if not fits():
+                cls.__usage['waited'] += 1
+                cls.__governor.wait_for(fits)
+                cls.__usage['wait_seconds'] += monotonic() - start
+
+            cls.__usage['commands'] += 1
+            cls.__usage['running'] += 1
+            cls.__usage['in_flight'] += memory
+            cls.__usage['peak'] = max(
+                cls.__usage['peak'], cls.__usage['in_flight']
+            )
+
+
+    @classmethod
+    def __release(cls, memory: int) -> None:
+        """Release the memory reserved by `__admit()`."""
+
+        with cls.__governor:
+            cls.__usage['running'] -= 1
+            cls.__usage['in_flight'] -= memory
+            cls.__governor.notify_all()
+
+
+    @classmethod
+    def get_usage(cls) -> dict[str, Any]:
+        """
+        Get the current memory usage of the commands of this process.
+
+        Returns:
+            Dictionary of the number of commands run, the number (and
+            total seconds) which waited for memory, the number running,
+            and the budget and the current and peak reserved memory (in
+            MiB).
+        """
+
+        with cls.__governor:
+            usage = dict(cls.__usage)
+
+        budget = cls.get_memory_budget()
+        return {
+            'commands': usage['commands'],
+            'waited': usage['waited'],
+            'wait_seconds': round(usage['wait_seconds'], 1),
+            'running': usage['running'],
+            'in_flight_mib': round(usage['in_flight'] / 1024 / 1024, 1),
+            'peak_mib': round(usage['peak'] / 1024 / 1024, 1),
+            'budget_mib': None if budget is None else \
+                round(budget / 1024 / 1024, 1),
+        }
+
+
+    @classmethod
+    def log_usage(cls) -> None:
+        """Log the memory usage of all commands, if any were run."""
+
+        if (usage := cls.get_usage())['commands']:
+            log.debug(f'ImageMagick usage - {usage}')
+
+
     def run(self, command: str) -> tuple[bytes, bytes]:
         """
         Wrapper for running a given command. This uses either the host
         machine (i.e. direct calls); or through the provided docker
         container (if preferences has been set; i.e. wrapped through
-        "docker exec -t {id} {command}").
+        "docker exec -t {id} {command}"). This waits until the command
+        fits within the memory budget.
 
         Args:
             command: The command (as string) to execute.
@@ -151,10 +330,24 @@ class ImageMagickInterface:
         if os_name == 'nt':
             command = command.replace('\(', '(').replace('\)', ')')
 
+        # Limit the resources of this command to its share of the budget -
+        # limited to the budget so that any single command can be admitted
+        budget = self.get_memory_budget()
+        memory = self.estimate_memory(command)
+        limits = {}
+        if budget is not None:
+            memory = min(memory, budget)
+            limits['MAGICK_MEMORY_LIMIT'] = f'{memory // 1024 // 1024 or 1}MiB'
+            limits['MAGICK_MAP_LIMIT'] = f'{memory * 2 // 1024 // 1024 or 1}MiB'
+        if (threads := self.get_thread_limit()) is not None:
+            limits['MAGICK_THREAD_LIMIT'] = str(threads)
+
         # If a docker image ID is specified, execute the command in that
         # container otherwise, execute on the host machine (no docker wrapper)
         if self.use_docker:
-            command = f'docker exec -t {self.container} {self.prefix}{command}'
+            variables = ''.join(f'-e {var}={val} ' for var,val in limits.items())
+            command = (f'docker exec -t {variables}{self.container} '
+                       f'{self.prefix}{command}')
         # If an executable was indicated, use as 
         elif self.executable:
             command = f'{self.executable} {command}'
@@ -169,10 +362,12 @@ class ImageMagickInterface:
             log.debug(command)
             return b'', b''
 
-        # Execute, capturing stdout and stderr
+        # Execute once admitted, capturing stdout and stderr
         stdout, stderr = b'', b''
+        self.__admit(memory, budget)
         try:
-            with Popen(cmd, stdout=PIPE, stderr=PIPE) as process:
+            with Popen(cmd, stdout=PIPE, stderr=PIPE,
+                       env=environ | limits) as process:
                 stdout, stderr = process.communicate(timeout=self.timeout)
         except TimeoutExpired:
             log.error('ImageMagick command timed out')
@@ -180,6 +375,8 @@ class ImageMagickInterface:
         except FileNotFoundError:
             log.exception('Command error')
             log.debug(command)
+        finally:
+            self.__release(memory)
 
         # Add command to history and return results
         self.__history.append((command, stdout, stderr))
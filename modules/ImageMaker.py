@@ -3,6 +3,7 @@ from collections import namedtuple
 from pathlib import Path
 from re import findall
 from typing import TYPE_CHECKING, Iterable, Literal, Optional
+from uuid import uuid4
 
 from modules import global_objects
 from modules.Debug import log
@@ -73,6 +74,25 @@ class ImageMaker(ABC):
             )
 
 
+    @classmethod
+    def get_temporary_file(cls, name: str) -> Path:
+        """
+        Get a new path for a temporary (intermediate) file. Paths are
+        unique to each call, so images created in parallel do not
+        overwrite each other's intermediate files.
+
+        Args:
+            name: Name of the file, e.g. "montage.png".
+
+        Returns:
+            Path to the temporary file within the temporary directory.
+        """
+
+        name = Path(name)
+
+        return cls.TEMP_DIR / f'{name.stem}_{uuid4().hex}{name.suffix}'
+
+
     def get_text_dimensions(self,
             text_command: list[str],
             *,
@@ -133,7 +153,11 @@ class ImageMaker(ABC):
 
 
     @staticmethod
-    def reduce_file_size(image: Path, quality: int = 90) -> Path:
+    def reduce_file_size(
+            image: Path,
+            quality: int = 90,
+            destination: Optional[Path] = None,
+        ) -> Path:
         """
         Reduce the file size of the given image.
 
@@ -141,6 +165,8 @@ class ImageMaker(ABC):
             image: Path to the image to reduce the file size of.
             quality: Quality of the reduction. 100 being no reduction, 0
                 being complete reduction. Passed to ImageMagick -quality.
+            destination: Path to write the reduced image to. If omitted,
+                the temporary compression file is used.
 
         Returns:
             Path to the created image.
@@ -162,6 +188,8 @@ class ImageMaker(ABC):
             global_objects.pp.use_magick_prefix,
             global_objects.pp.imagemagick_timeout,
         )
+        if destination is None:
+            destination = ImageMaker.TEMPORARY_COMPRESS_FILE
 
         # Downsample and reduce quality of source image
         command = ' '.join([
@@ -169,12 +197,12 @@ class ImageMaker(ABC):
             f'"{image.resolve()}"',
             f'-sampling-factor 4:2:0',
             f'-quality {quality}%',
-            f'"{ImageMaker.TEMPORARY_COMPRESS_FILE.resolve()}"',
+            f'"{destination.resolve()}"',
         ])
 
         image_magick_interface.run(command)
 
-        return ImageMaker.TEMPORARY_COMPRESS_FILE
+        return destination
 
 
     @staticmethod
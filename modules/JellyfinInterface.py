@@ -1,9 +1,11 @@
-from base64 import b64encode
 from datetime import datetime
+from functools import partial
+from pathlib import Path
 from sys import exit as sys_exit
 from typing import Optional, Union
 
 from modules import global_objects
+from modules.Base64Stream import Base64Stream
 from modules.Debug import log
 from modules.Episode import Episode
 from modules.EpisodeDataSource import EpisodeDataSource
@@ -13,6 +15,7 @@ from modules.MediaServer import MediaServer
 from modules.SeriesInfo import SeriesInfo
 from modules.StyleSet import StyleSet
 from modules.SyncInterface import SyncInterface
+from modules.UploadScheduler import UploadScheduler
 from modules.WebInterface import WebInterface
 
 
@@ -46,6 +49,7 @@ class JellyfinInterface(EpisodeDataSource, MediaServer, SyncInterface):
             username: Optional[str] = None,
             verify_ssl: bool = True,
             filesize_limit: Optional[int] = None,
+            upload_concurrency: int = UploadScheduler.DEFAULT_CONCURRENCY,
         ) -> None:
         """
         Construct a new instance of an interface to a Jellyfin server.
@@ -58,16 +62,19 @@ class JellyfinInterface(EpisodeDataSource, MediaServer, SyncInterface):
             verify_ssl: Whether to verify SSL requests.
             filesize_limit: Number of bytes to limit a single file to
                 during upload.
+            upload_concurrency: Maximum number of simultaneous uploads.
 
         Raises:
             SystemExit: Invalid URL/API key provided.
         """
 
         # Intiialize parent classes
-        super().__init__(filesize_limit)
+        super().__init__(filesize_limit, upload_concurrency)
 
         # Store attributes of this Interface
-        self.session = WebInterface('Jellyfin', verify_ssl)
+        self.session = WebInterface(
+            'Jellyfin', verify_ssl, pool_size=upload_concurrency,
+        )
         self.info_set = global_objects.info_set
         self.url = url[:-1] if url.endswith('/') else url
         self.__params = {'api_key': api_key}
@@ -124,6 +131,16 @@ class JellyfinInterface(EpisodeDataSource, MediaServer, SyncInterface):
         return None
 
 
+    def clear_cache(self) -> None:
+        """
+        Clear the cached requests of this interface, and re-map all
+        libraries - e.g. between runs.
+        """
+
+        self.session.clear_cache()
+        self.libraries = self._map_libraries()
+
+
     def _map_libraries(self) -> dict[str, int]:
         """
         Map the libraries on this interface's server.
@@ -451,6 +468,48 @@ class JellyfinInterface(EpisodeDataSource, MediaServer, SyncInterface):
         return series_info.has_id('jellyfin_id')
 
 
+    def get_series_watermark(self,
+            library_name: str,
+            series_info: SeriesInfo,
+        ) -> Optional[tuple[int, int, Optional[str]]]:
+        """
+        Get the watermark of the given series within Jellyfin. This
+        changes whenever an episode is added, removed, or (un)watched.
+
+        Args:
+            library_name: The name of the library containing the series.
+            series_info: The series to get the watermark of.
+
+        Returns:
+            Tuple of the number of episodes, the number of watched
+            episodes, and the date the series was last watched. None if
+            the series has no Jellyfin ID or cannot be queried.
+        """
+
+        # If series has no Jellyfin ID, exit
+        if not series_info.has_id('jellyfin_id'):
+            return None
+
+        # Query for all episodes of this series - the same query as updating
+        # watched statuses, so that the response is reused
+        try:
+            response = self.session.get(
+                f'{self.url}/Shows/{series_info.jellyfin_id}/Episodes',
+                params={'UserId': self.user_id} | self.__params
+            )
+            user_data = [episode['UserData'] for episode in response['Items']]
+        except Exception: # pylint: disable=broad-except
+            log.exception(f'Error getting watermark of {series_info}')
+            return None
+
+        return (
+            len(user_data),
+            sum(1 for data in user_data if data.get('Played')),
+            max((data['LastPlayedDate'] for data in user_data
+                 if data.get('LastPlayedDate')), default=None),
+        )
+
+
     def update_watched_statuses(self,
             library_name: str,
             series_info: SeriesInfo,
@@ -527,6 +586,55 @@ class JellyfinInterface(EpisodeDataSource, MediaServer, SyncInterface):
         return None
 
 
+    def __upload_card(self,
+            item_id: str,
+            card: Path,
+            series_info: SeriesInfo,
+        ) -> bool:
+        """
+        Compress and upload the given card to the given Jellyfin item. This
+        is executed by the UploadScheduler, so it might be called from
+        any thread.
+
+        Args:
+            item_id: Jellyfin ID of the item to upload the card to.
+            card: Path to the card to upload.
+            series_info: The series being updated (for logging).
+
+        Returns:
+            True if the card was uploaded, False if the card could not be
+            compressed.
+
+        Raises:
+            Exception: Any Exception raised while uploading the card -
+                including HTTPError if the server rejected the upload.
+        """
+
+        # Shrink image if necessary, skip if cannot be compressed
+        if (compressed := self.compress_image(card)) is None:
+            return False
+
+        # Submit POST request for image upload; image content must be
+        # Base64-encoded, so stream the encoding from the file. HTTP errors
+        # (e.g. an overloaded server) are raised like any other failure
+        try:
+            with Base64Stream(compressed) as card_base64:
+                self.session.session.post(
+                    url=f'{self.url}/Items/{item_id}/Images/Primary',
+                    headers={'Content-Type': 'image/jpeg'},
+                    params=self.__params,
+                    data=card_base64,
+                ).raise_for_status()
+        except Exception:
+            log.exception(f'Unable to upload {card.resolve()} to '
+                          f'"{series_info}"')
+            raise
+        finally:
+            self.remove_compressed_image(card, compressed)
+
+        return True
+
+
     def set_title_cards(self,
             library_name: str,
             series_info: SeriesInfo,
@@ -558,51 +666,37 @@ class JellyfinInterface(EpisodeDataSource, MediaServer, SyncInterface):
         if len(filtered_episodes) == 0:
             return None
 
-        # Go through each remaining episode and load the card
-        loaded_count = 0
-        for episode in filtered_episodes.values():
+        # Determine which remaining episodes have cards to upload
+        uploads, records = [], {}
+        for key, episode in filtered_episodes.items():
             # Skip episodes without ID's (e.g. not in Jellyfin)
-            if (jellyfin_id := episode.episode_info.jellyfin_id) is None:
+            if (item_id := episode.episode_info.jellyfin_id) is None:
                 log.debug(f'Skipping {episode.episode_info!r} - not found in '
                           f'Jellyfin')
                 continue
 
-            # Shrink image if necessary, skip if cannot be compressed
-            if (card := self.compress_image(episode.destination)) is None:
-                continue
-
-            # Image content must be Base64-encoded
-            card_base64 = b64encode(card.read_bytes())
-
-            # Submit POST request for image upload
-            try:
-                self.session.session.post(
-                    url=f'{self.url}/Items/{jellyfin_id}/Images/Primary',
-                    headers={'Content-Type': 'image/jpeg'},
-                    params=self.__params,
-                    data=card_base64,
-                )
-                loaded_count += 1
-                log.debug(f'Loaded "{series_info}" Episode '
-                          f'{episode.episode_info} into Jellyfin')
-            except Exception:
-                log.exception(f'Unable to upload {card.resolve()} to '
-                              f'"{series_info}"')
-                continue
-
-            # Update loaded database for this episode
-            self.loaded_db.upsert({
+            uploads.append((key, partial(
+                self.__upload_card, item_id, episode.destination, series_info,
+            )))
+            records[key] = {
                 'library': library_name,
                 'series': series_info.full_name,
                 'season': episode.episode_info.season_number,
                 'episode': episode.episode_info.episode_number,
                 'filesize': episode.destination.stat().st_size,
                 'spoiler': episode.spoil_type,
-            }, self._get_condition(library_name, series_info, episode))
+            }
+
+        # Upload cards, update loaded database with all uploaded cards
+        uploaded, _, _ = self.upload_scheduler.run(uploads)
+        self._upsert_loaded_records(
+            self.loaded_db, library_name, series_info,
+            [records[key] for key in uploaded],
+        )
 
         # Log load operations to user
-        if loaded_count > 0:
-            log.info(f'Loaded {loaded_count} cards for "{series_info}"')
+        if uploaded:
+            log.info(f'Loaded {len(uploaded)} cards for "{series_info}"')
 
         return None
 
@@ -664,6 +758,97 @@ class JellyfinInterface(EpisodeDataSource, MediaServer, SyncInterface):
         return response
 
 
+    def get_episode_details(self,
+            item_id: str,
+        ) -> list[tuple[SeriesInfo, EpisodeInfo, str]]:
+        """
+        Get all details for all episodes indicated by the given
+        Jellyfin item ID.
+
+        Args:
+            item_id: ID of the item within Jellyfin.
+
+        Returns:
+            List of tuples of the SeriesInfo, EpisodeInfo, and the
+            library name corresponding to the given item. If the item
+            is a series/season, then all contained episodes are
+            detailed. An empty list is returned if the item(s) cannot be
+            found.
+        """
+
+        try:
+            # Get the item, and the series it belongs to
+            item = self.session.get(
+                f'{self.url}/Users/{self.user_id}/Items/{item_id}',
+                params=self.__params, cache=False,
+            )
+            if (item_type := item.get('Type')) == 'Series':
+                series, series_id = item, item['Id']
+            elif item_type in ('Season', 'Episode'):
+                series_id = item['SeriesId']
+                series = self.session.get(
+                    f'{self.url}/Users/{self.user_id}/Items/{series_id}',
+                    params=self.__params,
+                )
+            else:
+                log.warning(f'Jellyfin item {item_id} is a {item_type}')
+                return []
+
+            # Series must have a year
+            year = series.get('ProductionYear')
+            if year is None and series.get('PremiereDate'):
+                year = int(series['PremiereDate'][:4])
+            if year is None:
+                log.warning(f'Jellyfin item {item_id} has no year')
+                return []
+            series_info = self.info_set.get_series_info(series['Name'], year)
+
+            # Identify library from the ancestors of the series
+            ancestors = self.session.get(
+                f'{self.url}/Items/{series_id}/Ancestors',
+                params=self.__params,
+            )
+            ancestor_ids = {ancestor.get('Id') for ancestor in ancestors}
+            library_name = next(
+                (name for name, library_id in self.libraries.items()
+                 if library_id in ancestor_ids),
+                None
+            )
+            if library_name is None:
+                log.warning(f'Jellyfin item {item_id} is not in a known '
+                            f'library')
+                return []
+
+            # Get all indicated episodes
+            if item_type == 'Episode':
+                episodes = [item]
+            else:
+                episodes = self.session.get(
+                    f'{self.url}/Shows/{series_id}/Episodes',
+                    params=self.__params | (
+                        {'SeasonId': item_id} if item_type == 'Season'
+                        else {}
+                    ),
+                    cache=False,
+                )['Items']
+
+            return [
+                (series_info,
+                 EpisodeInfo(
+                     episode['Name'], episode['ParentIndexNumber'],
+                     episode['IndexNumber'],
+                 ),
+                 library_name)
+                for episode in episodes
+                if (episode.get('IndexNumber') is not None
+                    and episode.get('ParentIndexNumber') is not None)
+            ]
+        except Exception:
+            log.exception(f'Jellyfin item {item_id} has some error')
+
+        return []
+
+
     def get_libraries(self) -> list[str]:
         """
         Get the names of all libraries within this server.
@@ -1,19 +1,27 @@
+# pylint: disable=import-outside-toplevel
 from pathlib import Path
-from typing import Callable, Iterable
+from typing import TYPE_CHECKING, Callable, Iterable, Literal, Optional, Union
 
 from tqdm import tqdm
 from yaml import dump
 
 from modules import global_objects
-from modules.EmbyInterface import EmbyInterface
+from modules.CircuitBreaker import CircuitBreaker
+from modules.ImageMagickInterface import ImageMagickInterface
 from modules.Debug import log, TQDM_KWARGS
-from modules.JellyfinInterface import JellyfinInterface
-from modules.PlexInterface import PlexInterface
+from modules.PipelineExecutor import PipelineExecutor, PipelineStage
+from modules.RenderQueue import RenderQueue
+from modules.RequestScheduler import RequestScheduler
+from modules.RunJournal import RunJournal
 from modules.Show import Show
 from modules.ShowArchive import ShowArchive
-from modules.SonarrInterface import SonarrInterface
-from modules.TautulliInterface import TautulliInterface
-from modules.TMDbInterface import TMDbInterface
+from modules.ShowDigestKeeper import ShowDigestKeeper
+from modules.WorkPrioritizer import WorkPrioritizer
+
+if TYPE_CHECKING:
+    from modules.EmbyInterface import EmbyInterface
+    from modules.JellyfinInterface import JellyfinInterface
+    from modules.PlexInterface import PlexInterface
 
 
 def notify(message: str) -> Callable:
@@ -50,7 +58,15 @@ class Manager:
     DEFAULT_EXECUTION_MODE = 'serial'
 
     """Valid execution modes for Manager.run()"""
-    VALID_EXECUTION_MODES = ('serial', 'batch')
+    VALID_EXECUTION_MODES = ('serial', 'batch', 'pipeline')
+
+    """Stages whose results persist, and so are skipped when resuming"""
+    # Episode ID's are only kept in memory, so they are always set again
+    RESUMABLE_STAGES = (
+        'Adding new episodes', 'Adding translations', 'Downloading logo',
+        'Creating cards', 'Creating season posters', 'Updating server',
+        'Updating archive', 'Creating summary',
+    )
 
 
     def __init__(self, check_tautulli: bool = True) -> None:
@@ -67,15 +83,16 @@ class Manager:
         # Get the global preferences
         self.preferences = global_objects.pp
 
+        # Interfaces (and their dependencies) are only imported if enabled
         # Optionally integrate with Tautulli
-        if check_tautulli and self.preferences.use_tautulli:
-            TautulliInterface(
-                **self.preferences.tautulli_interface_args
-            ).integrate()
+        self.tautulli_checked = False
+        if check_tautulli:
+            self.check_tautulli()
 
         # Optionally assign EmbyInterface
         self.emby_interface = None
         if self.preferences.use_emby:
+            from modules.EmbyInterface import EmbyInterface
             self.emby_interface = EmbyInterface(
                 **self.preferences.emby_interface_kwargs
             )
@@ -83,6 +100,7 @@ class Manager:
          # Optionally assign JellyfinInterface
         self.jellyfin_interface = None
         if self.preferences.use_jellyfin:
+            from modules.JellyfinInterface import JellyfinInterface
             self.jellyfin_interface = JellyfinInterface(
                 **self.preferences.jellyfin_interface_kwargs
             )
@@ -90,6 +108,7 @@ class Manager:
         # Optionally assign PlexInterface
         self.plex_interface = None
         if self.preferences.use_plex:
+            from modules.PlexInterface import PlexInterface
             self.plex_interface = PlexInterface(
                 **self.preferences.plex_interface_kwargs
             )
@@ -97,6 +116,7 @@ class Manager:
         # Optionally assign SonarrInterface
         self.sonarr_interfaces = []
         if self.preferences.use_sonarr:
+            from modules.SonarrInterface import SonarrInterface
             self.sonarr_interfaces = [
                 SonarrInterface(server_id=server_id, **kw)
                 for server_id, kw in enumerate(self.preferences.sonarr_kwargs)
@@ -105,15 +125,68 @@ class Manager:
         # Optionally assign TMDbInterface
         self.tmdb_interface = None
         if self.preferences.use_tmdb:
+            from modules.TMDbInterface import TMDbInterface
             self.tmdb_interface = TMDbInterface(
                 **self.preferences.tmdb_interface_kwargs,
             )
 
+        # Optionally skip shows which are unchanged since the last run
+        self.digest_keeper = None
+        if getattr(self.preferences, 'skip_unchanged', False):
+            self.digest_keeper = ShowDigestKeeper(
+                self.preferences.verification_interval
+            )
+
+        # Optionally render cards through a (shared) queue
+        self.render_queue = None
+        if getattr(self.preferences, 'render_queue', None) is not None:
+            self.render_queue = RenderQueue(
+                self.preferences.render_queue,
+                self.preferences.render_lease,
+                self.preferences.card_type_directories,
+            )
+
+        # Journal and prioritizer of the active run
+        self.journal: Optional[RunJournal] = None
+        self.prioritizer = WorkPrioritizer()
+
         # Setup blank show and archive lists
         self.shows: list[Show] = []
         self.archives: list[ShowArchive] = []
 
 
+    def check_tautulli(self) -> None:
+        """
+        Check (and set up) the Tautulli integration, if enabled. This is
+        only done once per Manager - so a Manager which is reused across
+        runs can be created without checking, and checked later.
+        """
+
+        if self.tautulli_checked or not self.preferences.use_tautulli:
+            return None
+
+        from modules.TautulliInterface import TautulliInterface
+        TautulliInterface(**self.preferences.tautulli_interface_args).integrate()
+        self.tautulli_checked = True
+
+        return None
+
+
+    def clear_run_state(self) -> None:
+        """
+        Clear all state of the previous run - i.e. all Show objects, and
+        the cached results of every interface - while keeping the
+        interfaces (and their connections) for the next run.
+        """
+
+        self.shows, self.archives = [], []
+        for interface in (self.emby_interface, self.jellyfin_interface,
+                          self.plex_interface, self.tmdb_interface,
+                          *self.sonarr_interfaces):
+            if interface:
+                interface.clear_cache()
+
+
     def sync_series_files(self) -> None:
         """Sync series YAML files from Emby/Jellyfin/Sonarr/Plex."""
 
@@ -196,31 +269,165 @@ class Manager:
                 self.jellyfin_interface,
                 self.plex_interface,
                 self.sonarr_interfaces,
-                self.tmdb_interface
+                self.tmdb_interface,
+                self.render_queue,
             )
 
 
+    def __get_pending(self,
+            stage: str,
+            shows: list[Union[Show, ShowArchive]],
+        ) -> list[Union[Show, ShowArchive]]:
+        """
+        Get which of the given shows have not completed the given stage
+        in the resumed run.
+        """
+
+        if self.journal is None:
+            return shows
+
+        return [show for show in shows
+                if not self.journal.is_complete(show, stage)]
+
+
+    def __record(self, stage: str, show: Union[Show, ShowArchive]) -> None:
+        """Record that the given show completed the given stage."""
+
+        if self.journal is not None:
+            self.journal.complete(show, stage)
+
+
+    def __wait_for_renders(self,
+            stage: str,
+            shows: list[Union[Show, ShowArchive]],
+        ) -> None:
+        """
+        Wait for all cards submitted to the render queue, then record
+        that the given shows completed the given stage.
+        """
+
+        if self.render_queue is None:
+            return None
+
+        log.info(f'Waiting for cards to be rendered..')
+        done, failed = self.render_queue.wait()
+        if done or failed:
+            log.info(f'Rendered {done} cards ({failed} failed)')
+        for show in shows:
+            self.__record(stage, show)
+
+        return None
+
+
+    def skip_completed_shows(self) -> None:
+        """
+        Remove all shows (and their archives) which completed every
+        stage of the resumed run from this Manager.
+        """
+
+        # If not journaling this run, skip
+        if self.journal is None:
+            return None
+
+        completed = {
+            id(show.series_info) for show in self.shows
+            if self.journal.is_complete(show, RunJournal.COMPLETE)
+        }
+        self.shows = [show for show in self.shows
+                      if id(show.series_info) not in completed]
+        self.archives = [archive for archive in self.archives
+                         if id(archive.series_info) not in completed]
+        if completed and self.preferences.execution_mode != 'serial':
+            log.info(f'Skipping {len(completed)} shows completed by the '
+                     f'resumed run')
+
+        return None
+
+
+    def record_completed_shows(self) -> None:
+        """Record that all shows of this Manager completed every stage."""
+
+        for show in self.shows:
+            self.__record(RunJournal.COMPLETE, show)
+
+
+    def prioritize_shows(self) -> None:
+        """
+        Re-evaluate the priority of every show of this Manager, and
+        order them so that the most urgent shows are processed first.
+        """
+
+        # A single show (i.e. serial execution) has nothing to reorder
+        if len(self.shows) < 2:
+            return None
+
+        for show in self.shows:
+            self.prioritizer.update(show)
+        self.shows.sort(key=self.prioritizer.get, reverse=True)
+
+        return None
+
+
     @notify("Starting to set show ID's..")
     def set_show_ids(self) -> None:
         """Set the series ID's of each Show known to this Manager"""
 
         # For each show in the Manager, set series IDs
-        for show in tqdm(self.shows + self.archives, desc='Setting series IDs',
+        for show in tqdm(self.shows, desc='Setting series IDs',
                          **TQDM_KWARGS):
             # Select interfaces based on what's enabled
             show.set_series_ids()
 
 
+    def skip_unchanged_shows(self) -> None:
+        """
+        Remove all shows (and their archives) which are unchanged since
+        they were last processed from this Manager. This only executes
+        if skipping unchanged shows is enabled.
+        """
+
+        # If not skipping unchanged shows, skip
+        if self.digest_keeper is None:
+            return None
+
+        # Remove each unchanged show, and its archive
+        unchanged = set()
+        for show in tqdm(self.shows, desc='Checking for changes',
+                         **TQDM_KWARGS):
+            if self.digest_keeper.is_unchanged(show):
+                log.debug(f'Skipping unchanged show {show}')
+                unchanged.add(id(show.series_info))
+        self.shows = [show for show in self.shows
+                      if id(show.series_info) not in unchanged]
+        self.archives = [archive for archive in self.archives
+                         if id(archive.series_info) not in unchanged]
+        if unchanged and self.preferences.execution_mode == 'batch':
+            log.info(f'Skipping {len(unchanged)} unchanged shows')
+
+        return None
+
+
+    def record_show_digests(self) -> None:
+        """
+        Record the digests of all shows processed by this Manager, so
+        they can be skipped if unchanged on the next run.
+        """
+
+        if self.digest_keeper is not None:
+            for show in self.shows:
+                self.digest_keeper.add_digest(show)
+
+
     @notify('Starting to read source files..')
     def read_show_source(self) -> None:
         """
         Reads all source files known to this manager. This reads Episode
-        objects for all Show and ShowArchives, and also looks for
-        multipart episodes.
+        objects for all Shows (which are shared with their ShowArchives),
+        and also looks for multipart episodes.
         """
 
-        # Read source files for Show objects
-        for show in (pbar := tqdm(self.shows + self.archives, **TQDM_KWARGS)):
+        # Read source files for Show objects - archives share these episodes
+        for show in (pbar := tqdm(self.shows, **TQDM_KWARGS)):
             pbar.set_description(f'Reading source files for {show}')
             show.read_source()
             show.find_multipart_episodes()
@@ -232,9 +439,11 @@ class Manager:
 
         # For each show in the Manager, look for new episodes using any of the
         # possible interfaces
-        for show in (pbar := tqdm(self.shows + self.archives, **TQDM_KWARGS)):
+        pending = self.__get_pending('Adding new episodes', self.shows)
+        for show in (pbar := tqdm(pending, **TQDM_KWARGS)):
             pbar.set_description(f'Adding new episodes for {show}')
             show.add_new_episodes()
+            self.__record('Adding new episodes', show)
 
 
     @notify("Starting to set episode ID's..")
@@ -242,9 +451,11 @@ class Manager:
         """Set all episode ID's for all shows."""
 
         # For each show in the Manager, set IDs for every episode
-        for show in (pbar := tqdm(self.shows + self.archives, **TQDM_KWARGS)):
+        pending = self.__get_pending('Setting episode IDs', self.shows)
+        for show in (pbar := tqdm(pending, **TQDM_KWARGS)):
             pbar.set_description(f'Setting episode IDs for {show}')
             show.set_episode_ids()
+            self.__record('Setting episode IDs', show)
 
 
     @notify('Starting to add translations..')
@@ -256,9 +467,11 @@ class Manager:
             return None
 
         # For each show in the Manager, add translation
-        for show in (pbar := tqdm(self.shows + self.archives, **TQDM_KWARGS)):
+        pending = self.__get_pending('Adding translations', self.shows)
+        for show in (pbar := tqdm(pending, **TQDM_KWARGS)):
             pbar.set_description(f'Adding translations for {show}')
             show.add_translations()
+            self.__record('Adding translations', show)
 
         return None
 
@@ -272,9 +485,11 @@ class Manager:
             return None
 
         # For each show in the Manager, download a logo
-        for show in (pbar := tqdm(self.shows + self.archives, **TQDM_KWARGS)):
+        pending = self.__get_pending('Downloading logo', self.shows)
+        for show in (pbar := tqdm(pending, **TQDM_KWARGS)):
             pbar.set_description(f'Downloading logo for {show}')
             show.download_logo()
+            self.__record('Downloading logo', show)
 
         return None
 
@@ -294,9 +509,13 @@ class Manager:
         """Creates all missing title cards for all shows."""
 
         # Go through every show in the Manager, create cards
-        for show in (pbar := tqdm(self.shows, **TQDM_KWARGS)):
+        pending = self.__get_pending('Creating cards', self.shows)
+        for show in (pbar := tqdm(pending, **TQDM_KWARGS)):
             pbar.set_description(f'Creating cards for {show}')
-            show.create_missing_title_cards()
+            show.create_missing_title_cards(wait=False)
+            if self.render_queue is None:
+                self.__record('Creating cards', show)
+        self.__wait_for_renders('Creating cards', pending)
 
 
     @notify('Starting to create season posters..')
@@ -304,9 +523,13 @@ class Manager:
         """Create season posters for all shows."""
 
         # For each show in the Manager, create its posters
-        for show in tqdm(self.shows + self.archives,
-                         desc='Creating season posters',**TQDM_KWARGS):
+        pending = self.__get_pending(
+            'Creating season posters', self.shows + self.archives
+        )
+        for show in tqdm(pending, desc='Creating season posters',
+                         **TQDM_KWARGS):
             show.create_season_posters()
+            self.__record('Creating season posters', show)
 
 
     @notify('Starting to update Media Servers..')
@@ -323,9 +546,11 @@ class Manager:
             return None
 
         # Go through each show in the Manager, update Plex
-        for show in (pbar := tqdm(self.shows, **TQDM_KWARGS)):
+        pending = self.__get_pending('Updating server', self.shows)
+        for show in (pbar := tqdm(pending, **TQDM_KWARGS)):
             pbar.set_description(f'Updating Server for {show}')
             show.update_media_server()
+            self.__record('Updating server', show)
 
         return None
 
@@ -339,9 +564,13 @@ class Manager:
             return None
 
         # Update each archive
-        for show_archive in (pbar := tqdm(self.archives, **TQDM_KWARGS)):
+        pending = self.__get_pending('Updating archive', self.archives)
+        for show_archive in (pbar := tqdm(pending, **TQDM_KWARGS)):
             pbar.set_description(f'Updating archive for {show_archive}')
-            show_archive.create_missing_title_cards()
+            show_archive.create_missing_title_cards(wait=False)
+            if self.render_queue is None:
+                self.__record('Updating archive', show_archive)
+        self.__wait_for_renders('Updating archive', pending)
 
         return None
 
@@ -359,20 +588,30 @@ class Manager:
             return None
 
         # Go through each archive and create summaries
-        for show_archive in (pbar := tqdm(self.archives, **TQDM_KWARGS)):
+        pending = self.__get_pending('Creating summary', self.archives)
+        for show_archive in (pbar := tqdm(pending, **TQDM_KWARGS)):
             pbar.set_description(f'Creating Summary for {show_archive}')
             show_archive.create_summary()
+            self.__record('Creating summary', show_archive)
 
         return None
 
 
-    def __run(self, *, serial: bool = False) -> None:
+    def __run(self,
+            *,
+            serial: bool = False,
+            skip_unchanged: bool = False,
+        ) -> None:
         """
         Run the Manager. If serial execution is not indicated, then sync
         is run and Show/ShowArchive objects are created.
 
         Args:
             serial: (Keyword only) Whether execution is serial.
+            skip_unchanged: (Keyword only) Whether to skip shows which
+                are unchanged since last processed. This is only done
+                for full runs, so explicitly remade cards are never
+                skipped.
         """
 
         # If serial, don't update series files or create shows
@@ -381,19 +620,205 @@ class Manager:
             self.create_shows()
 
         # Always execute these, even in serial mode
+        self.skip_completed_shows()
         self.assign_interfaces()
         self.set_show_ids()
+        if skip_unchanged:
+            self.skip_unchanged_shows()
         self.read_show_source()
         self.add_new_episodes()
+        self.prioritize_shows()
         self.set_episode_ids()
         self.add_translations()
         self.download_logos()
         self.select_source_images()
+        self.prioritize_shows()
         self.create_missing_title_cards()
         self.create_season_posters()
         self.update_media_server()
         self.update_archive()
         self.create_summaries()
+        self.record_show_digests()
+        self.record_completed_shows()
+
+
+    def __get_pipeline_stages(self) -> list[PipelineStage]:
+        """
+        Get the stages of each show (and its archive) when pipelined.
+        These are the steps of `Manager.__run()`, skipping any which are
+        globally disabled.
+
+        Returns:
+            List of stages, whose functions are called with a tuple of a
+            Show and its ShowArchive (or None).
+        """
+
+        def each(*functions: str, archive: bool = True) -> Callable:
+            """Get a stage which calls the given Show functions."""
+            def stage(item: tuple[Show, Optional[ShowArchive]]) -> None:
+                show, show_archive = item
+                for function in functions:
+                    getattr(show, function)()
+                    if archive and show_archive is not None:
+                        getattr(show_archive, function)()
+            return stage
+
+        def check_for_changes(item: tuple[Show, Optional[ShowArchive]]) -> bool:
+            """Get whether the given show has changed."""
+            return not self.digest_keeper.is_unchanged(item[0])
+
+        def record_digest(item: tuple[Show, Optional[ShowArchive]]) -> None:
+            """Record the digest of the given (processed) show."""
+            self.digest_keeper.add_digest(item[0])
+
+        def journaled(pipeline_stage: PipelineStage) -> Callable:
+            """Get a stage which is skipped if completed, and recorded."""
+            def stage(item: tuple[Show, Optional[ShowArchive]]) -> None:
+                if self.journal.is_complete(item[0], pipeline_stage.name):
+                    return None
+                result = pipeline_stage.function(item)
+                self.__record(pipeline_stage.name, item[0])
+                return result
+            return stage
+
+        def record_complete(item: tuple[Show, Optional[ShowArchive]]) -> None:
+            """Record that the given show completed every stage."""
+            self.__record(RunJournal.COMPLETE, item[0])
+
+        def prioritized(function: Callable) -> Callable:
+            """Get a stage which re-evaluates the priority of its show."""
+            def stage(item: tuple[Show, Optional[ShowArchive]]) -> None:
+                function(item)
+                self.prioritizer.update(item[0])
+            return stage
+
+        def archive(function: str) -> Callable:
+            """Get a stage which calls the given ShowArchive function."""
+            def stage(item: tuple[Show, Optional[ShowArchive]]) -> None:
+                if item[1] is not None:
+                    getattr(item[1], function)()
+            return stage
+
+        stages = [
+            PipelineStage(
+                'Setting series IDs', 'io',
+                each('set_series_ids', archive=False),
+            ),
+        ]
+        if self.digest_keeper is not None:
+            stages.append(
+                PipelineStage('Checking for changes', 'io', check_for_changes)
+            )
+        stages += [
+            PipelineStage(
+                'Reading source files', 'io',
+                prioritized(each(
+                    'read_source', 'find_multipart_episodes', archive=False,
+                )),
+            ),
+            PipelineStage(
+                'Adding new episodes', 'io',
+                prioritized(each('add_new_episodes', archive=False)),
+            ),
+            PipelineStage(
+                'Setting episode IDs', 'io',
+                each('set_episode_ids', archive=False),
+            ),
+        ]
+        if self.preferences.use_tmdb:
+            stages += [
+                PipelineStage(
+                    'Adding translations', 'io',
+                    each('add_translations', archive=False),
+                ),
+                PipelineStage(
+                    'Downloading logo', 'io',
+                    each('download_logo', archive=False),
+                ),
+            ]
+        stages += [
+            PipelineStage(
+                'Selecting sources', 'io',
+                prioritized(each('select_source_images')),
+            ),
+            PipelineStage(
+                'Creating cards', 'render',
+                each('create_missing_title_cards', archive=False),
+            ),
+            PipelineStage(
+                'Creating season posters', 'render',
+                each('create_season_posters'),
+            ),
+        ]
+        if (self.preferences.use_emby or self.preferences.use_jellyfin
+            or self.preferences.use_plex):
+            stages.append(PipelineStage(
+                'Updating server', 'io',
+                each('update_media_server', archive=False),
+            ))
+        if self.preferences.create_archive:
+            stages.append(PipelineStage(
+                'Updating archive', 'render',
+                archive('create_missing_title_cards'), maintenance=True,
+            ))
+            if self.preferences.create_summaries:
+                stages.append(PipelineStage(
+                    'Creating summary', 'render', archive('create_summary'),
+                    maintenance=True,
+                ))
+        if self.digest_keeper is not None:
+            stages.append(
+                PipelineStage('Recording digest', 'io', record_digest)
+            )
+
+        # Skip stages completed by the resumed run, record completed stages
+        if self.journal is not None:
+            stages = [
+                stage._replace(function=journaled(stage))
+                if stage.name in self.RESUMABLE_STAGES else stage
+                for stage in stages
+            ]
+            stages.append(
+                PipelineStage('Recording progress', 'io', record_complete)
+            )
+
+        return stages
+
+
+    def __run_pipelined(self) -> None:
+        """
+        Run the Manager, executing the steps of each show in order but
+        overlapping the steps of different shows - e.g. one show can
+        update its media server while another creates cards.
+        """
+
+        # Sync YAML files, create and assign interfaces to shows
+        self.sync_series_files()
+        self.create_shows()
+        self.skip_completed_shows()
+        self.assign_interfaces()
+
+        # Pair each show with its archive
+        archives = {
+            id(archive.series_info): archive for archive in self.archives
+        }
+        items = [(show, archives.get(id(show.series_info)))
+                 for show in self.shows]
+
+        # Run all stages of all shows
+        executor = PipelineExecutor(
+            self.__get_pipeline_stages(),
+            self.preferences.io_concurrency,
+            self.preferences.render_concurrency,
+        )
+        log.info(f'Starting to run {len(items)} shows through {executor!r}..')
+        result = executor.run(
+            items,
+            label=lambda item: str(item[0]),
+            priority=lambda item: self.prioritizer.get(item[0]),
+        )
+        log.info(f'Finished {result.completed} shows, skipped '
+                 f'{result.skipped} unchanged shows, {result.failed} failed')
 
 
     def __run_serially(self) -> None:
@@ -402,90 +827,187 @@ class Manager:
         # Sync YAML files
         self.sync_series_files()
 
-        # Go through each Series YAML file, creating Show/ShowArchive objects
+        # Go through each Series YAML file, run each Show
         for show in self.preferences.iterate_series_files():
-            # Skip shows whose YAML was invalid
-            if not show.valid:
-                log.warning(f'Skipping series {show}')
-                continue
+            self.__run_show(show, skip_unchanged=True)
 
-            # Create ShowArchive object if archive enabled globally + show
-            self.shows = [show]
-            if self.preferences.create_archive and show.archive:
-                archive = ShowArchive(self.preferences.archive_directory, show)
-                self.archives = [archive]
-
-            # Run all functions on this series
-            try:
-                self.__run(serial=True)
-            except Exception:
-                log.exception(f'Uncaught Exception while processing {show}')
-                continue
 
+    def __run_show(self, show: Show, *, skip_unchanged: bool = False) -> None:
+        """
+        Run the Manager for only the given Show (and its archive).
 
-    def run(self) -> None:
-        """Run the Manager either in either serial or batch mode"""
+        Args:
+            show: Show to run.
+            skip_unchanged: (Keyword only) Whether to skip the show if
+                it is unchanged since last processed.
+        """
 
-        if self.preferences.execution_mode == 'serial':
-            self.__run_serially()
-        elif self.preferences.execution_mode == 'batch':
-            self.__run()
+        # Skip shows whose YAML was invalid
+        if not show.valid:
+            log.warning(f'Skipping series {show}')
+            return None
+
+        # Create ShowArchive object if archive enabled globally + show
+        self.shows, self.archives = [show], []
+        if self.preferences.create_archive and show.archive:
+            archive = ShowArchive(self.preferences.archive_directory, show)
+            self.archives = [archive]
+
+        # Run all functions on this series
+        try:
+            self.__run(serial=True, skip_unchanged=skip_unchanged)
+        except Exception:
+            log.exception(f'Uncaught Exception while processing {show}')
+
+        return None
 
 
-    def remake_cards(self, rating_keys: Iterable[int]) -> None:
+    def run(self,
+            resume: bool = False,
+            requested: Iterable[str] = (),
+        ) -> None:
+        """
+        Run the Manager in either serial, batch, or pipeline mode. The
+        progress of the run is journaled, so that if it is interrupted
+        it can be resumed. In batch and pipeline mode, the most urgent
+        shows are processed first.
+
+        Args:
+            resume: Whether to resume the last (interrupted) run,
+                skipping any shows and stages it completed.
+            requested: Names of series to process before all others.
+        """
+
+        self.journal = RunJournal(resume=resume)
+        self.prioritizer = WorkPrioritizer(requested)
+        try:
+            if self.preferences.execution_mode == 'serial':
+                self.__run_serially()
+            elif self.preferences.execution_mode == 'batch':
+                self.__run(skip_unchanged=True)
+            elif self.preferences.execution_mode == 'pipeline':
+                self.__run_pipelined()
+            self.journal.clear()
+        finally:
+            self.journal.close()
+            self.journal = None
+
+        RequestScheduler.log_statistics()
+        CircuitBreaker.log_states()
+        ImageMagickInterface.log_usage()
+
+
+    def remake_cards(self,
+            rating_keys: Iterable[Union[int, str]],
+            media_server: Literal['emby', 'jellyfin', 'plex'] = 'plex',
+        ) -> None:
         """
         Remake the title cards associated with the given list of rating
         keys. These keys are used to identify their corresponding
-        episodes within Plex.
+        episodes within the media server. All keys of the same series
+        are remade together, and series are found with the series index
+        if possible - otherwise all series files are searched.
 
         Args:
-            rating_keys: List of Plex rating keys corresponding to
-                Episodes to update the cards of.
+            rating_keys: List of Plex rating keys (or Emby/Jellyfin item
+                IDs) corresponding to Episodes to update the cards of.
+            media_server: Which media server the keys are from.
         """
 
-        # Exit if Plex is not enabled
-        if not self.preferences.use_plex:
-            log.error(f'Tautulli integration requires Plex')
+        # Exit if the media server is not enabled
+        interface: Union[EmbyInterface, JellyfinInterface, PlexInterface] = {
+            'emby': self.emby_interface,
+            'jellyfin': self.jellyfin_interface,
+            'plex': self.plex_interface,
+        }.get(media_server)
+        if interface is None:
+            if media_server == 'plex':
+                log.error(f'Tautulli integration requires Plex')
+            else:
+                log.error(f'Cannot remake cards from {media_server} - it is '
+                          f'not enabled')
             return None
 
-        # Get details for each rating key from Plex
-        entry_list = []
+        # Get details for each rating key from server, group by series
+        series_entries: dict[tuple[str, str], list] = {}
         for key in rating_keys:
-            if len(details := self.plex_interface.get_episode_details(key)) ==0:
+            if len(details := interface.get_episode_details(key)) == 0:
                 log.error(f'Rating key {key} has no associated episodes')
-            else:
-                log.debug(f'Rating key {key} -> {len(details)} item(s)')
-                entry_list += details
+                continue
 
-        # Go through every series in all series YAML files
-        for show in self.preferences.iterate_series_files():
-            # If no more entries, exit
-            if len(entry_list) == 0:
-                break
-
-            # Check if this show is one of the entries to update
-            is_found = False
-            for index, (series_info, episode_info, library_name) \
-                in enumerate(entry_list):
-                # Match the library and series name
-                full_match_name = show.series_info.full_match_name
-                if (show.valid
-                    and show.library_name == library_name
-                    and full_match_name == series_info.full_match_name):
-                    self.shows = [show]
-                    self.__run(serial=True)
-                    is_found = True
+            log.debug(f'Rating key {key} -> {len(details)} item(s)')
+            for series_info, episode_info, library_name in details:
+                series_entries.setdefault(
+                    (library_name, series_info.full_match_name), []
+                ).append((series_info, episode_info))
+
+        # Process each series found in the series index
+        unindexed = {}
+        for (library_name, match_name), entries in series_entries.items():
+            shows = self.preferences.get_indexed_shows(library_name, match_name)
+            if shows is None:
+                unindexed[(library_name, match_name)] = entries
+                continue
+
+            log.debug(f'Remaking {len(entries)} card(s) of indexed series '
+                      f'{shows[0]}')
+            self.shows = shows
+            self.__run(serial=True)
+
+        # Go through every series in all series YAML files for any remaining
+        if unindexed:
+            for show in self.preferences.iterate_series_files():
+                # If no more entries, exit
+                if len(unindexed) == 0:
                     break
 
-            # If an entry was found, delete from list
-            if is_found:
-                del entry_list[index] # pylint: disable=undefined-loop-variable
+                # Check if this show is one of the series to update
+                key = (show.library_name, show.series_info.full_match_name)
+                if show.valid and key in unindexed:
+                    del unindexed[key]
+                    self.shows = [show]
+                    self.__run(serial=True)
 
         # Warn for all entries not found
-        for series_info, episode_info, library_name in entry_list:
-            log.warning(f'Cannot update card for "{series_info}" {episode_info}'
-                        f' within library "{library_name}" - no matching YAML '
-                        f'entry was found')
+        for (library_name, _), entries in unindexed.items():
+            for series_info, episode_info in entries:
+                log.warning(f'Cannot update card for "{series_info}" '
+                            f'{episode_info} within library "{library_name}" - '
+                            f'no matching YAML entry was found')
+
+        return None
+
+
+    def remake_series(self,
+            series_files: set[Path],
+            source_directories: set[Path],
+        ) -> None:
+        """
+        Run the Manager for only the series defined in the given series
+        YAML files, or whose source directory is one of the given
+        directories.
+
+        Args:
+            series_files: Resolved paths of the changed series YAML
+                files.
+            source_directories: Resolved paths of the changed source
+                directories.
+        """
+
+        # Run every series of the changed series files
+        remaining = set(source_directories)
+        if series_files:
+            run_directories = set()
+            for show in self.preferences.iterate_series_files(series_files):
+                run_directories.add(show.source_directory.resolve())
+                self.__run_show(show)
+            remaining -= run_directories
+
+        # Run the series of any remaining changed source directories
+        if remaining:
+            for show in self.preferences.iterate_series_files():
+                if show.source_directory.resolve() in remaining:
+                    self.__run_show(show)
 
         return None
 
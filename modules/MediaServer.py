@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from threading import get_ident
 from typing import Any, Optional, Union
 from pathlib import Path
 
@@ -12,6 +13,7 @@ from modules.PersistentDatabase import PersistentDatabase
 from modules.SeasonPosterSet import SeasonPosterSet
 from modules.SeriesInfo import SeriesInfo
 from modules.StyleSet import StyleSet
+from modules.UploadScheduler import UploadScheduler
 
 SourceImage = Union[str, bytes, None]
 
@@ -41,15 +43,22 @@ class MediaServer(ABC):
 
 
     @abstractmethod
-    def __init__(self, filesize_limit: int) -> None:
+    def __init__(self,
+            filesize_limit: int,
+            upload_concurrency: int = UploadScheduler.DEFAULT_CONCURRENCY,
+        ) -> None:
         """
         Initialize an instance of this object. This stores creates an
         attribute loaded_db that is a PersistentDatabase of the
-        LOADED_DB file.
+        LOADED_DB file, and an upload_scheduler that is an
+        UploadScheduler for uploading assets into this server.
         """
 
         self.loaded_db = PersistentDatabase(self.LOADED_DB)
         self.filesize_limit = filesize_limit
+        self.upload_scheduler = UploadScheduler(
+            self.__class__.__name__, upload_concurrency,
+        )
 
 
     def __bool__(self) -> bool:
@@ -80,14 +89,21 @@ class MediaServer(ABC):
         quality = 95
         small_image = image
 
+        # Compress into a file unique to this thread, as uploads are parallel
+        temp_file = ImageMaker.TEMPORARY_COMPRESS_FILE
+        destination = temp_file.with_stem(f'{temp_file.stem}_{get_ident()}')
+
         # Compress the given image until below the filesize limit
         while small_image.stat().st_size > self.filesize_limit:
             # Process image, exit if cannot be reduced
             quality -= 5
-            small_image = ImageMaker.reduce_file_size(image, quality)
+            small_image = ImageMaker.reduce_file_size(
+                image, quality, destination
+            )
             if small_image is None:
                 log.warning(f'Cannot reduce filesize of "{image.resolve()}" '
                             f'below limit')
+                destination.unlink(missing_ok=True)
                 return None
 
         # Compression successful, log and return intermediate image
@@ -95,6 +111,21 @@ class MediaServer(ABC):
         return small_image
 
 
+    @staticmethod
+    def remove_compressed_image(image: Path, compressed: Path) -> None:
+        """
+        Delete the temporary image created by `compress_image()` for the
+        given image, if one was created.
+
+        Args:
+            image: Path to the original image.
+            compressed: Path to the image returned by `compress_image()`.
+        """
+
+        if Path(compressed) != Path(image):
+            Path(compressed).unlink(missing_ok=True)
+
+
     def _get_condition(self,
             library_name: str,
             series_info: SeriesInfo,
@@ -207,6 +238,49 @@ class MediaServer(ABC):
         return filtered
 
 
+    def _upsert_loaded_records(self,
+            database: PersistentDatabase,
+            library_name: str,
+            series_info: SeriesInfo,
+            records: list[dict[str, Any]],
+            *,
+            keys: tuple[str, ...] = ('season', 'episode'),
+        ) -> None:
+        """
+        Add or replace the given records for the given series in the
+        given database. All records are written at once, rather than
+        one write per record.
+
+        Args:
+            database: PersistentDatabase to add the records to.
+            library_name: Name of the library containing the series.
+            series_info: SeriesInfo of the series the records are for.
+            records: Records to add. Each record must contain every key
+                in keys.
+            keys: (Keyword) Keys which identify a unique record within
+                the series.
+        """
+
+        # Nothing to write
+        if not records:
+            return None
+
+        # Find existing records of this series which are being replaced
+        replaced = {tuple(record[key] for key in keys) for record in records}
+        doc_ids = [
+            document.doc_id for document in database.search(
+                self._get_condition(library_name, series_info)
+            ) if tuple(document.get(key) for key in keys) in replaced
+        ]
+
+        # Replace old records with new ones
+        if doc_ids:
+            database.remove(doc_ids=doc_ids)
+        database.insert_multiple(records)
+
+        return None
+
+
     def remove_records(self, library_name: str, series_info: SeriesInfo) ->None:
         """
         Remove all records for the given library and series from the
@@ -238,6 +312,18 @@ class MediaServer(ABC):
         raise NotImplementedError
 
 
+    @abstractmethod
+    def get_series_watermark(self,
+            library_name: str,
+            series_info: SeriesInfo,
+        ) -> Optional[tuple]:
+        """
+        Abstract method to get the episode count and watched-state
+        watermark of a series within this MediaServer.
+        """
+        raise NotImplementedError
+
+
     @abstractmethod
     def update_watched_statuses(self,
             library_name: str,
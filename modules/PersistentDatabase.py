@@ -1,4 +1,5 @@
 from pathlib import Path
+from threading import RLock
 from time import sleep
 from typing import Callable
 
@@ -17,10 +18,17 @@ class PersistentDatabase:
     underlying TinyDB object and any raised JSONDecodeError Exceptions
     are caught, the database is deleted, and the function is
     re-executed.
+
+    All functions on databases of the same file are serialized, so a
+    database can be used from multiple threads.
     """
 
     MAX_DB_RETRY_COUNT: int = 5
 
+    """Lock of each database file"""
+    __locks: dict[Path, RLock] = {}
+    __locks_lock = RLock()
+
 
     def __init__(self, filename: str) -> None:
         """
@@ -34,6 +42,8 @@ class PersistentDatabase:
         # Path to the file itself
         self.file: Path = global_objects.pp.database_directory / filename
         self.file.parent.mkdir(exist_ok=True, parents=True)
+        with self.__locks_lock:
+            self.lock = self.__locks.setdefault(self.file.resolve(), RLock())
 
         # Initialize TinyDB from file
         try:
@@ -66,7 +76,8 @@ class PersistentDatabase:
         def wrapper(*args, __retries: int = 0, **kwargs) -> None:
             try:
                 kwargs.pop('__retries', None)
-                return getattr(self.db, database_func)(*args, **kwargs)
+                with self.lock:
+                    return getattr(self.db, database_func)(*args, **kwargs)
             except (ValueError, JSONDecodeError) as e:
                 # If this function has been attempted too many times, just raise
                 if __retries > self.MAX_DB_RETRY_COUNT:
@@ -85,7 +96,8 @@ class PersistentDatabase:
     def __len__(self) -> int:
         """Call len() on this object's underlying TinyDB object."""
 
-        return len(self.db)
+        with self.lock:
+            return len(self.db)
 
 
     def reset(self) -> None:
@@ -95,9 +107,10 @@ class PersistentDatabase:
         """
 
         # Attempt to remove all records; if that fails delete and remake file
-        try:
-            self.db.truncate()
-        except Exception:
-            self.file.unlink(missing_ok=True)
-            self.file.parent.mkdir(exist_ok=True, parents=True)
-            self.db = TinyDB(self.file)
+        with self.lock:
+            try:
+                self.db.truncate()
+            except Exception:
+                self.file.unlink(missing_ok=True)
+                self.file.parent.mkdir(exist_ok=True, parents=True)
+                self.db = TinyDB(self.file)
@@ -0,0 +1,173 @@
+from collections import namedtuple
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+)
+from heapq import heappop, heappush
+from os import cpu_count
+from typing import Any, Callable, Literal, Optional
+
+from tqdm import tqdm
+
+from modules.Debug import log, TQDM_KWARGS
+
+
+StageType = Literal['io', 'render']
+PipelineStage = namedtuple(
+    'PipelineStage', ('name', 'type', 'function', 'maintenance'),
+    defaults=(False,),
+)
+PipelineResult = namedtuple(
+    'PipelineResult', ('completed', 'skipped', 'failed')
+)
+
+
+class PipelineExecutor:
+    """
+    This class describes an executor of a pipeline of stages over many
+    items. Each item passes through every stage in order, but different
+    items can be in different stages at once - e.g. one item can be
+    uploaded while another is rendered and a third is queried.
+
+    Stages are either I/O-bound or render stages, and each type executes
+    on its own pool with its own concurrency. Work that is further along
+    the pipeline is always started first, so items finish as early as
+    possible. An item whose stage raises an Exception is not processed
+    by any later stages, and does not affect any other items. A stage
+    can also return False to skip all later stages of its item.
+
+    Items can also be prioritized, in which case the work of higher
+    priority items is always started first. Maintenance stages yield to
+    all other ready work of their type.
+    """
+
+    """Default maximum number of concurrent I/O-bound stages"""
+    DEFAULT_IO_CONCURRENCY = 8
+
+    """Default maximum number of concurrent render stages"""
+    DEFAULT_RENDER_CONCURRENCY = max(1, (cpu_count() or 2) // 2)
+
+    __slots__ = ('stages', 'concurrency')
+
+
+    def __init__(self,
+            stages: list[PipelineStage],
+            io_concurrency: int = DEFAULT_IO_CONCURRENCY,
+            render_concurrency: int = DEFAULT_RENDER_CONCURRENCY,
+        ) -> None:
+        """
+        Initialize this executor.
+
+        Args:
+            stages: Ordered stages of the pipeline. The function of each
+                stage is called with each item.
+            io_concurrency: Maximum number of concurrent I/O stages.
+            render_concurrency: Maximum number of concurrent render
+                stages.
+        """
+
+        self.stages = list(stages)
+        self.concurrency: dict[StageType, int] = {
+            'io': max(1, int(io_concurrency)),
+            'render': max(1, int(render_concurrency)),
+        }
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return (f'<PipelineExecutor of {len(self.stages)} stages, '
+                f'concurrency={self.concurrency}>')
+
+
+    def run(self,
+            items: list[Any],
+            *,
+            label: Callable[[Any], str] = str,
+            priority: Optional[Callable[[Any], int]] = None,
+        ) -> PipelineResult:
+        """
+        Run every item through the pipeline.
+
+        Args:
+            items: Items to process.
+            label: (Keyword) Function to get the label (for logging) of
+                an item.
+            priority: (Keyword) Function to get the current priority of
+                an item - higher priorities are started first. This is
+                evaluated whenever a stage of the item becomes ready.
+
+        Returns:
+            PipelineResult of the number of items which completed every
+            stage, the number which were skipped by a stage, and the
+            number which failed a stage.
+        """
+
+        if not self.stages or not items:
+            return PipelineResult(len(items), 0, 0)
+
+        # Ready work of each type - (maintenance, -priority, -stage index,
+        # item index) so that non-maintenance work, then higher priority
+        # items, then later stages, then earlier items are started first
+        ready: dict[StageType, list[tuple[bool, int, int, int]]] = {
+            'io': [], 'render': [],
+        }
+
+        def make_ready(stage_index: int, index: int) -> None:
+            """Queue the given stage of the given item as ready."""
+            stage = self.stages[stage_index]
+            item_priority = 0 if priority is None else priority(items[index])
+            heappush(
+                ready[stage.type],
+                (bool(stage.maintenance), -item_priority, -stage_index, index),
+            )
+
+        for index in range(len(items)):
+            make_ready(0, index)
+
+        completed, skipped, failed = 0, 0, 0
+        pending: dict[Future, tuple[StageType, int, int]] = {}
+        in_flight = {'io': 0, 'render': 0}
+        with ThreadPoolExecutor(self.concurrency['io'],
+                                thread_name_prefix='PipelineIO') as io_pool, \
+                ThreadPoolExecutor(self.concurrency['render'],
+                                   thread_name_prefix='PipelineRender') \
+                    as render_pool, \
+                tqdm(total=len(items) * len(self.stages),
+                     **TQDM_KWARGS) as pbar:
+            pools = {'io': io_pool, 'render': render_pool}
+            while pending or any(ready.values()):
+                # Start ready work on each pool until its concurrency is full
+                for type_, pool in pools.items():
+                    while (ready[type_]
+                           and in_flight[type_] < self.concurrency[type_]):
+                        *_, stage_index, index = heappop(ready[type_])
+                        stage_index = -stage_index
+                        function = self.stages[stage_index].function
+                        future = pool.submit(function, items[index])
+                        pending[future] = (type_, stage_index, index)
+                        in_flight[type_] += 1
+
+                # Wait for any stage to finish, queue the next stage of its item
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    type_, stage_index, index = pending.pop(future)
+                    in_flight[type_] -= 1
+                    stage = self.stages[stage_index]
+                    pbar.set_description(f'{stage.name} for '
+                                         f'{label(items[index])}')
+                    pbar.update()
+                    if (exception := future.exception()) is not None:
+                        log.error(f'{stage.name} failed for '
+                                  f'{label(items[index])} - skipping',
+                                  exc_info=exception)
+                        pbar.update(len(self.stages) - stage_index - 1)
+                        failed += 1
+                    elif future.result() is False:
+                        pbar.update(len(self.stages) - stage_index - 1)
+                        skipped += 1
+                    elif stage_index + 1 < len(self.stages):
+                        make_ready(stage_index + 1, index)
+                    else:
+                        completed += 1
+
+        return PipelineResult(completed, skipped, failed)
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from functools import partial
 from os import environ
 from pathlib import Path
 from re import IGNORECASE, compile as re_compile
@@ -16,11 +17,14 @@ from plexapi.video import (
 from requests.exceptions import (
     ReadTimeout, ConnectionError as PlexConnectionError
 )
-from tenacity import retry, stop_after_attempt, wait_fixed, wait_exponential
+from tenacity import (
+    retry, retry_if_not_exception_type, stop_after_attempt, wait_fixed,
+    wait_exponential,
+)
 from tinydb import where
-from tqdm import tqdm
 
-from modules.Debug import log, TQDM_KWARGS
+from modules.CircuitBreaker import CircuitOpenError
+from modules.Debug import log
 from modules.Episode import Episode
 from modules.EpisodeDataSource import EpisodeDataSource
 from modules.EpisodeInfo import EpisodeInfo
@@ -31,6 +35,7 @@ from modules.SeasonPosterSet import SeasonPosterSet
 from modules.SeriesInfo import SeriesInfo
 from modules.StyleSet import StyleSet
 from modules.SyncInterface import SyncInterface
+from modules.UploadScheduler import UploadScheduler
 from modules.WebInterface import WebInterface
 
 
@@ -38,7 +43,8 @@ def catch_and_log(message: str, *, default: Any = None) -> Callable:
     """
     Return a decorator that logs (with the given log function) the given
     message if the decorated function raises an uncaught
-    PlexApiException.
+    PlexApiException. If Plex is unavailable (its circuit is open), the
+    default is returned without logging an error.
 
     Args:
         message: Message to log upon uncaught exception.
@@ -56,6 +62,9 @@ def catch_and_log(message: str, *, default: Any = None) -> Callable:
             except PlexApiException:
                 log.exception(message)
                 return default
+            except CircuitOpenError:
+                log.debug(f'{message} - Plex is unavailable')
+                return default
             except (ReadTimeout, PlexConnectionError) as exc:
                 log.exception(f'Plex API has timed out, DB might be busy')
                 raise exc
@@ -66,6 +75,91 @@ def catch_and_log(message: str, *, default: Any = None) -> Callable:
     return decorator
 
 
+class PlexSeriesSnapshot:
+    """
+    This class describes a snapshot of all the episodes of a single
+    series within Plex. All episodes - with their GUID's, thumbnails,
+    view states, and rating keys - are fetched in a single request and
+    indexed by their season and episode numbers, so that the separate
+    stages of a run do not each need to query Plex for the series'
+    episodes.
+    """
+
+    __slots__ = ('series', 'episodes', '__index')
+
+
+    def __init__(self, series: PlexShow) -> None:
+        """
+        Create a snapshot of the episodes of the given series.
+
+        Args:
+            series: The Show whose episodes are being snapshotted.
+        """
+
+        self.series = series
+
+        # Get all episodes (with their GUID's) in one request
+        self.episodes: list[PlexEpisode] = series.episodes(
+            params={'includeGuids': 1}
+        )
+
+        # Index episodes by their season and episode numbers
+        self.__index: dict[tuple[int, int], PlexEpisode] = {}
+        for episode in self.episodes:
+            # All attributes were loaded above, do not reload on access
+            episode._autoReload = False # pylint: disable=protected-access
+            if episode.parentIndex is not None and episode.index is not None:
+                self.__index[(episode.parentIndex, episode.index)] = episode
+
+
+    def __len__(self) -> int:
+        """Number of episodes in this snapshot."""
+
+        return len(self.episodes)
+
+
+    def get(self,
+            season_number: int,
+            episode_number: int,
+        ) -> Optional[PlexEpisode]:
+        """
+        Get the episode with the given index from this snapshot.
+
+        Args:
+            season_number: Season number of the episode to get.
+            episode_number: Episode number of the episode to get.
+
+        Returns:
+            The Plex Episode with the given index, None if the episode
+            is not in this snapshot.
+        """
+
+        return self.__index.get((season_number, episode_number))
+
+
+    @staticmethod
+    def get_ids(plex_episode: PlexEpisode) -> dict[str, str]:
+        """
+        Get the database ID's of the given episode from its GUID's.
+
+        Args:
+            plex_episode: Episode to get the ID's of.
+
+        Returns:
+            Dictionary of the IMDb, TMDb, and TVDb ID's of the episode
+            (as strings), keyed by their ID type (e.g. `imdb_id`).
+        """
+
+        ids = {}
+        for guid in plex_episode.guids:
+            for id_type in ('imdb', 'tmdb', 'tvdb'):
+                if (prefix := f'{id_type}://') in guid.id:
+                    ids[f'{id_type}_id'] = guid.id[len(prefix):]
+                    break
+
+        return ids
+
+
 class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
     """This class describes an interface to Plex."""
 
@@ -78,6 +172,12 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
     """Filepath to the database of the loaded season poster characteristics"""
     LOADED_POSTERS_DB = 'loaded_posters.json'
 
+    """Filepath to the database of library snapshots for incremental syncs"""
+    SYNC_DB = 'plex_sync.json'
+
+    """How many series to request at a time during an incremental sync"""
+    SYNC_PAGE_SIZE = 500
+
     """How many failed episodes result in skipping a series"""
     SKIP_SERIES_THRESHOLD = 3
 
@@ -98,6 +198,8 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
             integrate_with_kometa: bool = False,
             filesize_limit: int = 10485760,
             timeout: int = DEFAULT_TIMEOUT,
+            incremental_sync: bool = False,
+            upload_concurrency: int = UploadScheduler.DEFAULT_CONCURRENCY,
         ) -> None:
         """
         Constructs a new instance of a Plex Interface.
@@ -112,12 +214,15 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
             filesize_limit: Number of bytes to limit a single file to
                 during upload.
             timeout: How many seconds to allow for a timeout.
+            incremental_sync: Whether to only query Plex for series added
+                or updated since the last sync when syncing series.
+            upload_concurrency: Maximum number of simultaneous uploads.
 
         Raises:
             SystemExit: An Exception is raised while connecting to Plex.
         """
 
-        super().__init__(filesize_limit)
+        super().__init__(filesize_limit, upload_concurrency)
 
         # Get global MediaInfoSet objects
         self.info_set = global_objects.info_set
@@ -148,16 +253,100 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
         # Create/read loaded card database
         self.__posters = PersistentDatabase(self.LOADED_POSTERS_DB)
 
+        # Create/read library snapshot database if syncing incrementally
+        self.incremental_sync = incremental_sync
+        self.__sync_db = None
+        if incremental_sync:
+            self.__sync_db = PersistentDatabase(self.SYNC_DB)
+
         # List of "not found" warned series
         self.__warned = set()
 
+        # Caches of resolved libraries and series (including misses) for the
+        # duration of this run
+        self.__library_cache: dict[str, Optional[PlexLibrary]] = {}
+        self.__series_cache: dict[tuple, Optional[PlexShow]] = {}
+        self.__snapshots: dict[tuple, PlexSeriesSnapshot] = {}
+
+
+    @staticmethod
+    def __get_series_cache_key(
+            library: PlexLibrary,
+            series_info: SeriesInfo,
+        ) -> tuple[str, str, int, Optional[str], Optional[int], Optional[int]]:
+        """
+        Get the key used to cache the resolution of the given series
+        within the given library. Because the ID's of the series are
+        part of the key, a series whose ID's are updated is re-resolved.
+
+        Args:
+            library: The Library the series is being resolved in.
+            series_info: Series being resolved.
+
+        Returns:
+            Tuple of the library title, the series match name and year,
+            and the series IMDb, TVDb, and TMDb ID's.
+        """
+
+        return (
+            library.title, series_info.match_name, series_info.year,
+            series_info.imdb_id, series_info.tvdb_id, series_info.tmdb_id,
+        )
+
+
+    def clear_cache(self,
+            library_name: Optional[str] = None,
+            series_info: Optional[SeriesInfo] = None,
+            rating_key: Optional[int] = None,
+        ) -> None:
+        """
+        Clear the cached library and series resolutions of this
+        interface. If a library and series are provided, only the cached
+        resolutions of that series are cleared.
+
+        Args:
+            library_name: Name of the library whose series should be
+                cleared.
+            series_info: Series to clear. Entries are matched by the
+                same name and year they were cached under.
+            rating_key: Rating key of the series within Plex. Entries
+                which resolved to this series (e.g. under a different
+                name, or by ID) are also cleared.
+        """
+
+        # No series indicated, clear everything
+        if library_name is None or series_info is None:
+            self.__library_cache.clear()
+            self.__series_cache.clear()
+            self.__snapshots.clear()
+            return None
+
+        # Determine the keys of this series as cached by __get_series()
+        name_and_year = (series_info.match_name, series_info.year)
+        keys = [
+            key for key, series in self.__series_cache.items()
+            if key[0] == library_name
+            and (key[1:3] == name_and_year
+                 or (rating_key is not None and series is not None
+                     and series.ratingKey == rating_key))
+        ]
+
+        # Clear the resolutions and snapshots under those keys
+        for key in keys:
+            self.__series_cache.pop(key, None)
+            self.__snapshots.pop(key, None)
+
+        return None
+
 
     @retry(stop=stop_after_attempt(5),
            wait=wait_fixed(3)+wait_exponential(min=1, max=32),
+           retry=retry_if_not_exception_type(CircuitOpenError),
            reraise=True)
     def __get_library(self, library_name: str) -> Optional[PlexLibrary]:
         """
-        Get the Library object under the given name.
+        Get the Library object under the given name. Results are cached
+        for the duration of the run.
 
         Args:
             library_name: The name of the library to get.
@@ -166,23 +355,31 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
             The Library object if found, None otherwise.
         """
 
+        # Return cached library (or miss) if this library was resolved
+        if library_name in self.__library_cache:
+            return self.__library_cache[library_name]
+
         try:
-            return self.__server.library.section(library_name)
+            library = self.__server.library.section(library_name)
         except NotFound:
             log.error(f'Library "{library_name}" was not found in Plex')
-            return None
+            library = None
+
+        self.__library_cache[library_name] = library
+        return library
 
 
     @retry(stop=stop_after_attempt(5),
            wait=wait_fixed(3)+wait_exponential(min=1, max=32),
+           retry=retry_if_not_exception_type(CircuitOpenError),
            reraise=True)
     def __get_series(self,
             library: PlexLibrary,
             series_info: SeriesInfo) -> Optional[PlexShow]:
         """
         Get the Series object from within the given Library associated
-        with the given SeriesInfo. This tries to match by TVDb ID,
-        TMDb ID, name, and finally name.
+        with the given SeriesInfo. Results (including series that were
+        not found) are cached for the duration of the run.
 
         Args:
             library: The Library object to search for within Plex.
@@ -192,6 +389,35 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
             The Series associated with this SeriesInfo object.
         """
 
+        # Return cached series (or miss) if this series was resolved
+        key = self.__get_series_cache_key(library, series_info)
+        if key in self.__series_cache:
+            return self.__series_cache[key]
+
+        series = self.__find_series(library, series_info)
+        self.__series_cache[key] = series
+
+        return series
+
+
+    def __find_series(self,
+            library: PlexLibrary,
+            series_info: SeriesInfo,
+        ) -> Optional[PlexShow]:
+        """
+        Find the Series object from within the given Library associated
+        with the given SeriesInfo. This tries to match by IMDb ID, TVDb
+        ID, TMDb ID, name, and finally full name.
+
+        Args:
+            library: The Library object to search for within Plex.
+            series_info: Series to find.
+
+        Returns:
+            The Series associated with this SeriesInfo object. None if
+            the series cannot be found.
+        """
+
         # Try by IMDb ID
         if series_info.has_id('imdb_id'):
             try:
@@ -245,6 +471,44 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
 
         return None
 
+    @retry(stop=stop_after_attempt(5),
+           wait=wait_fixed(3)+wait_exponential(min=1, max=32),
+           retry=retry_if_not_exception_type(CircuitOpenError),
+           reraise=True)
+    def __get_snapshot(self,
+            library_name: str,
+            series_info: SeriesInfo,
+        ) -> Optional[PlexSeriesSnapshot]:
+        """
+        Get the snapshot of the episodes of the given series. Snapshots
+        are cached for the duration of the run.
+
+        Args:
+            library_name: The name of the library containing the series.
+            series_info: Series to get the snapshot of.
+
+        Returns:
+            The PlexSeriesSnapshot of the series. None if the library or
+            series cannot be found.
+        """
+
+        # If the given library cannot be found, exit
+        if not (library := self.__get_library(library_name)):
+            return None
+
+        # If the given series cannot be found in this library, exit
+        if not (series := self.__get_series(library, series_info)):
+            return None
+
+        # Return existing snapshot of this series if available
+        key = self.__get_series_cache_key(library, series_info)
+        if (snapshot := self.__snapshots.get(key)) is None:
+            snapshot = PlexSeriesSnapshot(series)
+            self.__snapshots[key] = snapshot
+
+        return snapshot
+
+
     @catch_and_log('Error getting library paths', default={})
     def get_library_paths(self,
             filter_libraries: list[str] = [],
@@ -280,6 +544,168 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
         return all_libraries
 
 
+    @staticmethod
+    def reset_sync_snapshots() -> None:
+        """
+        Delete all library snapshots and watermarks used by incremental
+        syncs, so that the next sync fully rescans each library.
+        """
+
+        PersistentDatabase(PlexInterface.SYNC_DB).truncate()
+        log.info(f'Reset Plex incremental sync snapshots')
+
+
+    def __parse_sync_show(self,
+            show: PlexShow,
+            *,
+            read_labels: bool,
+        ) -> Optional[dict[str, Any]]:
+        """
+        Parse the given Show into a snapshot record for syncing.
+
+        Args:
+            show: The Show to parse.
+            read_labels: (Keyword) Whether to read the labels of the
+                Show. If False, the labels of the record are None.
+
+        Returns:
+            Dictionary of the show's rating key, title, year, database
+            ID's, location, and labels. None if the Show cannot be
+            synced.
+        """
+
+        # Skip show if it has no year
+        if show.year is None:
+            log.warning(f'Series {show.title} has no year - skipping')
+            return None
+
+        # Skip show if it has no locations.. somehow..
+        if len(show.locations) == 0:
+            log.warning(f'Series {show.title} has no files - skipping')
+            return None
+
+        # Get all ID's for this series
+        ids = {}
+        for guid in show.guids:
+            for id_type in ('imdb', 'tmdb', 'tvdb'):
+                if (prefix := f'{id_type}://') in guid.id:
+                    ids[f'{id_type}_id'] = guid.id[len(prefix):]
+                    break
+
+        return {
+            'rating_key': show.ratingKey,
+            'title': show.title,
+            'year': show.year,
+            'ids': ids,
+            'location': show.locations[0],
+            'labels': (
+                [label.tag.lower() for label in show.labels]
+                if read_labels else None
+            ),
+        }
+
+
+    def __get_rating_keys(self, library: PlexLibrary) -> set[str]:
+        """
+        Get the rating keys of all series in the given library. Only the
+        keys are read from the response, so this is much cheaper than
+        loading every series.
+
+        Args:
+            library: The Library to get the series keys of.
+
+        Returns:
+            Set of the rating keys (as strings) of the library's series.
+        """
+
+        data = self.__server.query(
+            f'/library/sections/{library.key}/all',
+            params={'type': 2, 'includeGuids': 0},
+        )
+
+        return {
+            element.attrib['ratingKey'] for element in data
+            if 'ratingKey' in element.attrib
+        }
+
+
+    def __sync_library(self,
+            library: PlexLibrary,
+            required_tags: list[str],
+        ) -> list[dict[str, Any]]:
+        """
+        Incrementally sync the given library. Only series added or
+        updated since the library's last sync are requested from Plex;
+        all other series are taken from the local snapshot of the
+        library, and series no longer in the library are removed from
+        it. If no snapshot exists (or the snapshot cannot be filtered by
+        the given tags), the whole library is rescanned.
+
+        Args:
+            library: The Library to sync.
+            required_tags: List of tags the returned series will be
+                filtered by.
+
+        Returns:
+            List of the snapshot records of all series in the library.
+        """
+
+        condition = where('library') == library.title
+        snapshot = self.__sync_db.get(condition)
+
+        # Rescan if there is no snapshot, or it is missing required labels
+        if (snapshot is None
+            or (required_tags and any(
+                record['labels'] is None
+                for record in snapshot['series'].values()
+            ))):
+            log.debug(f'Fully scanning Plex library "{library.title}"')
+            watermark, records = 0, {}
+            shows = library.all(container_size=self.SYNC_PAGE_SIZE)
+            read_labels, incremental = bool(required_tags), False
+        # Only query for series added or updated since the last sync
+        else:
+            watermark, records = snapshot['watermark'], snapshot['series']
+            since = datetime.fromtimestamp(watermark)
+            shows = library.search(
+                libtype='show',
+                filters={'or': [{'addedAt>>': since}, {'updatedAt>>': since}]},
+                container_size=self.SYNC_PAGE_SIZE,
+            )
+            read_labels, incremental = True, True
+            log.debug(f'{len(shows)} series in Plex library "{library.title}" '
+                      f'changed since {since}')
+
+        # Update the snapshot records and watermark with these series
+        for show in shows:
+            for timestamp in (show.addedAt, show.updatedAt):
+                if timestamp is not None:
+                    watermark = max(watermark, timestamp.timestamp())
+
+            record = self.__parse_sync_show(show, read_labels=read_labels)
+            if record is None:
+                records.pop(str(show.ratingKey), None)
+            else:
+                records[str(show.ratingKey)] = record
+
+        # Remove series deleted from (or moved out of) the library
+        if incremental and records:
+            current_keys = self.__get_rating_keys(library)
+            for rating_key in set(records) - current_keys:
+                log.debug(f'Removing series "{records[rating_key]["title"]}" '
+                          f'from snapshot of Plex library "{library.title}"')
+                del records[rating_key]
+
+        # Write the updated snapshot
+        self.__sync_db.upsert({
+            'library': library.title,
+            'watermark': watermark,
+            'series': records,
+        }, condition)
+
+        return list(records.values())
+
+
     @catch_and_log('Error getting all series', default=[])
     def get_all_series(self,
             filter_libraries: list[str] = [],
@@ -287,6 +713,8 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
         ) -> list[tuple[SeriesInfo, str, str]]:
         """
         Get all series within Plex, as filtered by the given libraries.
+        If this interface syncs incrementally, then only series which
+        have been added or updated since the last sync are requested.
 
         Args:
             filter_libraries: Optional list of library names to filter
@@ -317,35 +745,34 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
                 and library.title not in filter_libraries):
                 continue
 
-            # Get all Shows in this library
-            for show in library.all():
-                # Skip show if tags provided and does not match
-                if required_tags:
-                    tags = [label.tag.lower() for label in show.labels]
-                    if not all(tag.lower() in tags for tag in required_tags):
-                        continue
-
-                # Skip show if it has no year
-                if show.year is None:
-                    log.warning(f'Series {show.title} has no year - skipping')
-                    continue
+            # Get the records of all Shows in this library
+            if self.incremental_sync:
+                records = self.__sync_library(library, required_tags)
+            else:
+                read_labels = bool(required_tags)
+                records = [
+                    self.__parse_sync_show(show, read_labels=read_labels)
+                    for show in library.all()
+                ]
 
-                # Skip show if it has no locations.. somehow..
-                if len(show.locations) == 0:
-                    log.warning(f'Series {show.title} has no files - skipping')
+            for record in records:
+                # Skip shows which could not be parsed
+                if record is None:
                     continue
 
-                # Get all ID's for this series
-                ids = {}
-                for guid in show.guids:
-                    for id_type in ('imdb', 'tmdb', 'tvdb'):
-                        if (prefix := f'{id_type}://') in guid.id:
-                            ids[f'{id_type}_id'] = guid.id[len(prefix):]
-                            break
+                # Skip show if tags provided and does not match
+                if required_tags:
+                    if not all(tag.lower() in record['labels']
+                               for tag in required_tags):
+                        continue
 
                 # Create SeriesInfo object for this show, add to return
-                series_info = SeriesInfo(show.title, show.year, **ids)
-                all_series.append((series_info,show.locations[0],library.title))
+                series_info = SeriesInfo(
+                    record['title'], record['year'], **record['ids']
+                )
+                all_series.append(
+                    (series_info, record['location'], library.title)
+                )
 
         # Reset request timeout
         self.REQUEST_TIMEOUT = 30
@@ -372,17 +799,13 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
             List of EpisodeInfo objects for this series.
         """
 
-        # If the given library cannot be found, exit
-        if not (library := self.__get_library(library_name)):
-            return []
-
-        # If the given series cannot be found in this library, exit
-        if not (series := self.__get_series(library, series_info)):
+        # If the given series cannot be found, exit
+        if not (snapshot := self.__get_snapshot(library_name, series_info)):
             return []
 
         # Create list of all episodes in Plex
         all_episodes = []
-        for plex_episode in series.episodes():
+        for plex_episode in snapshot.episodes:
             # Skip if episode has no season or episode number
             if (plex_episode.parentIndex is None
                 or plex_episode.index is None):
@@ -401,14 +824,7 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
                 continue
 
             # Get all ID's for this episode
-            ids = {}
-            for guid in plex_episode.guids:
-                if 'tvdb://' in guid.id:
-                    ids['tvdb_id'] = guid.id[len('tvdb://'):]
-                elif 'imdb://' in guid.id:
-                    ids['imdb_id'] = guid.id[len('imdb://'):]
-                elif 'tmdb://' in guid.id:
-                    ids['tmdb_id'] = guid.id[len('tmdb://'):]
+            ids = PlexSeriesSnapshot.get_ids(plex_episode)
 
             # Create either a new EpisodeInfo or get from the MediaInfoSet
             episode_info = self.info_set.get_episode_info(
@@ -450,6 +866,37 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
         return self.__get_series(library, series_info) is not None
 
 
+    @catch_and_log('Error getting series watermark')
+    def get_series_watermark(self,
+            library_name: str,
+            series_info: SeriesInfo,
+        ) -> Optional[tuple[int, int, Optional[float]]]:
+        """
+        Get the watermark of the given series within Plex. This changes
+        whenever an episode is added, removed, or (un)watched.
+
+        Args:
+            library_name: The name of the library containing the series.
+            series_info: The series to get the watermark of.
+
+        Returns:
+            Tuple of the number of episodes, the number of watched
+            episodes, and the timestamp of when the series was last
+            watched. None if the series cannot be found.
+        """
+
+        # If the given library or series cannot be found, exit
+        if (not (library := self.__get_library(library_name))
+            or not (series := self.__get_series(library, series_info))):
+            return None
+
+        last_viewed = series.lastViewedAt
+        return (
+            series.leafCount, series.viewedLeafCount,
+            None if last_viewed is None else last_viewed.timestamp(),
+        )
+
+
     @catch_and_log('Error updating watched statuses')
     def update_watched_statuses(self,
             library_name: str,
@@ -477,12 +924,8 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
         if len(episode_map) == 0:
             return None
 
-        # If the given library cannot be found, exit
-        if not (library := self.__get_library(library_name)):
-            return None
-
-        # If the given series cannot be found in this library, exit
-        if not (series := self.__get_series(library, series_info)):
+        # If the given series cannot be found, exit
+        if not (snapshot := self.__get_snapshot(library_name, series_info)):
             return None
 
         # Get loaded characteristics of the series
@@ -491,7 +934,7 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
         )
 
         # Go through each episode within Plex and update Episode spoiler status
-        for plex_episode in series.episodes():
+        for plex_episode in snapshot.episodes:
             # If this Plex episode doesn't have Episode object(?) skip
             ep_key = f'{plex_episode.parentIndex}-{plex_episode.index}'
             if not (episode := episode_map.get(ep_key)):
@@ -591,12 +1034,8 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
             inplace: Unused argument.
         """
 
-        # If the given library cannot be found, exit
-        if not (library := self.__get_library(library_name)):
-            return None
-
-        # If the given series cannot be found in this library, exit
-        if not (series := self.__get_series(library, series_info)):
+        # If the given series cannot be found, exit
+        if not (snapshot := self.__get_snapshot(library_name, series_info)):
             return None
 
         # Go through each provided EpisodeInfo and update the ID's
@@ -607,22 +1046,18 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
 
             # Get episode from Plex
             info.queried_plex = True
-            try:
-                plex_episode = series.episode(
-                    season=info.season_number,
-                    episode=info.episode_number,
-                )
-            except NotFound:
+            plex_episode = snapshot.get(info.season_number, info.episode_number)
+            if plex_episode is None:
                 continue
 
             # Set the ID's for this object
-            for guid in plex_episode.guids:
-                if 'imdb://' in guid.id:
-                    info.set_imdb_id(guid.id[len('imdb://'):])
-                elif 'tmdb://' in guid.id:
-                    info.set_tmdb_id(int(guid.id[len('tmdb://'):]))
-                elif 'tvdb://' in guid.id:
-                    info.set_tvdb_id(int(guid.id[len('tvdb://'):]))
+            ids = PlexSeriesSnapshot.get_ids(plex_episode)
+            if 'imdb_id' in ids:
+                info.set_imdb_id(ids['imdb_id'])
+            if 'tmdb_id' in ids:
+                info.set_tmdb_id(int(ids['tmdb_id']))
+            if 'tvdb_id' in ids:
+                info.set_tvdb_id(int(ids['tvdb_id']))
 
         return None
 
@@ -646,26 +1081,19 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
             episode DNE.
         """
 
-        # If the given library cannot be found, exit
-        if not (library := self.__get_library(library_name)):
+        # If the given series cannot be found, exit
+        if not (snapshot := self.__get_snapshot(library_name, series_info)):
             return None
 
-        # If the given series cannot be found in this library, exit
-        if not (series := self.__get_series(library, series_info)):
+        # Get Episode from within Plex, return if DNE or has no thumbnail
+        plex_episode = snapshot.get(
+            episode_info.season_number, episode_info.episode_number
+        )
+        if plex_episode is None or not plex_episode.thumb:
             return None
 
-        # Get Episode from within Plex
-        try:
-            plex_episode = series.episode(
-                season=episode_info.season_number,
-                episode=episode_info.episode_number
-            )
-
-            return (f'{self.__server._baseurl}{plex_episode.thumb}' # pylint: disable=protected-access
-                    f'?X-Plex-Token={self.__token}')
-        except NotFound:
-            # Episode DNE in Plex, return
-            return None
+        return (f'{self.__server._baseurl}{plex_episode.thumb}' # pylint: disable=protected-access
+                f'?X-Plex-Token={self.__token}')
 
 
     @catch_and_log('Error getting library names', default=[])
@@ -686,6 +1114,7 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
 
     @retry(stop=stop_after_attempt(5),
            wait=wait_fixed(3)+wait_exponential(min=1, max=32),
+           retry=retry_if_not_exception_type(CircuitOpenError),
            before_sleep=lambda _:log.warning('Cannot upload image, retrying..'),
            reraise=True)
     def __retry_upload(self,
@@ -722,6 +1151,54 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
         card_image.save(card.resolve(), exif=exif)
 
 
+    def __upload_image(self,
+            plex_object: Union[PlexEpisode, PlexSeason],
+            image: Path,
+            series_info: SeriesInfo,
+        ) -> bool:
+        """
+        Compress and upload the given image to the given Plex object.
+        This is executed by the UploadScheduler, so it might be called
+        from any thread.
+
+        Args:
+            plex_object: The plexapi object to upload the image to.
+            image: Path to the image to upload.
+            series_info: The series being updated (for logging).
+
+        Returns:
+            True if the image was uploaded, False if the image could not
+            be compressed.
+
+        Raises:
+            Exception: Any Exception raised while uploading the image.
+        """
+
+        # Shrink image if necessary, skip if cannot be compressed
+        if (compressed := self.compress_image(image)) is None:
+            return False
+
+        try:
+            # If integrating with Kometa, add EXIF data
+            if self.integrate_with_kometa:
+                self.__add_exif_tag(compressed)
+
+            # Upload image
+            self.__retry_upload(plex_object, compressed.resolve())
+
+            # If integrating with Kometa, remove label
+            if self.integrate_with_kometa:
+                plex_object.removeLabel(['Overlay'])
+        except Exception:
+            log.exception(f'Unable to upload {image.resolve()} to '
+                          f'{series_info}')
+            raise
+        finally:
+            self.remove_compressed_image(image, compressed)
+
+        return True
+
+
     @catch_and_log('Error uploading title cards')
     def set_title_cards(self,
             library_name: str,
@@ -750,69 +1227,50 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
         if len(filtered_episodes) == 0:
             return None
 
-        # If the given library cannot be found, exit
-        if not (library := self.__get_library(library_name)):
-            return None
-
-        # If the given series cannot be found in this library, exit
-        if not (series := self.__get_series(library, series_info)):
+        # If the given series cannot be found, exit
+        if not (snapshot := self.__get_snapshot(library_name, series_info)):
             return None
 
-        # Go through each episode within Plex, set title cards
-        error_count, loaded_count = 0, 0
-        for pl_episode in (pbar := tqdm(series.episodes(), **TQDM_KWARGS)):
+        # Determine which episodes within Plex have cards to upload
+        uploads, records = [], {}
+        for pl_episode in snapshot.episodes:
             pl_episode: PlexEpisode = pl_episode
-            # If error count is too high, skip this series
-            if error_count >= self.SKIP_SERIES_THRESHOLD:
-                log.error(f'Failed to upload {error_count} episodes, skipping '
-                          f'"{series_info}"')
-                break
-
             # Skip episodes that aren't in list of cards to update
             ep_key = f'{pl_episode.parentIndex}-{pl_episode.index}'
             if not (episode := filtered_episodes.get(ep_key)):
                 continue
 
-            # Update progress bar
-            pbar.set_description(f'Updating {pl_episode.seasonEpisode.upper()}')
-
-            # Shrink image if necessary, skip if cannot be compressed
-            if (card := self.compress_image(episode.destination)) is None:
-                continue
-
-            # Upload card to Plex
-            try:
-                # If integrating with Kometa, add EXIF data
-                if self.integrate_with_kometa:
-                    self.__add_exif_tag(card)
-
-                # Upload card
-                self.__retry_upload(pl_episode, card.resolve())
-
-                # If integrating with Kometa, remove label
-                if self.integrate_with_kometa:
-                    pl_episode.removeLabel(['Overlay'])
-            except Exception:
-                error_count += 1
-                log.exception(f'Unable to upload {card.resolve()} to '
-                              f'{series_info}')
-                continue
-            else:
-                loaded_count += 1
-
-            # Update/add loaded map with this entry
-            self.loaded_db.upsert({
+            key = pl_episode.seasonEpisode.upper()
+            uploads.append((key, partial(
+                self.__upload_image, pl_episode, episode.destination,
+                series_info,
+            )))
+            records[key] = {
                 'library': library_name,
                 'series': series_info.full_name,
                 'season': episode.episode_info.season_number,
                 'episode': episode.episode_info.episode_number,
                 'filesize': episode.destination.stat().st_size,
                 'spoiler': episode.spoil_type,
-            }, self._get_condition(library_name, series_info, episode))
+            }
+
+        # Upload cards to Plex, skipping series if error count is too high
+        uploaded, error_count, _ = self.upload_scheduler.run(
+            uploads, error_threshold=self.SKIP_SERIES_THRESHOLD,
+        )
+        if error_count >= self.SKIP_SERIES_THRESHOLD:
+            log.error(f'Failed to upload {error_count} episodes, skipping '
+                      f'"{series_info}"')
+
+        # Update/add loaded map with all uploaded entries
+        self._upsert_loaded_records(
+            self.loaded_db, library_name, series_info,
+            [records[key] for key in uploaded],
+        )
 
         # Log load operations to user
-        if loaded_count > 0:
-            log.info(f'Loaded {loaded_count} cards for "{series_info}"')
+        if uploaded:
+            log.info(f'Loaded {len(uploaded)} cards for "{series_info}"')
 
         return None
 
@@ -846,58 +1304,48 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
         if not (series := self.__get_series(library, series_info)):
             return None
 
-        # Condition for this series
-        loaded_count = 0
+        # Get the loaded details for all seasons of this series
+        loaded = {
+            details['season']: details for details in self.__posters.search(
+                (where('library') == library_name)
+                & (where('series') == series_info.full_name)
+            )
+        }
+
+        # Determine which seasons have posters to upload
+        uploads, records = [], {}
         for season in series.seasons():
             # Skip if no season poster for this seasons
             if (poster := season_poster_set.get_poster(season.index)) is None:
                 continue
 
-            # Get the loaded details for this season
-            condition = (
-                (where('library') == library_name)
-                & (where('series') == series_info.full_name)
-                & (where('season') == season.index)
-            )
-            details = self.__posters.get(condition)
-
             # Skip if this exact poster has been loaded
+            details = loaded.get(season.index)
             if (details is not None
                 and details['filesize'] == poster.stat().st_size):
                 continue
 
-            # Shrink image if necessary
-            if (resized_poster := self.compress_image(poster)) is None:
-                continue
-
-            # Upload this poster
-            try:
-                # If integrating with Kometa, add EXIF data
-                if self.integrate_with_kometa:
-                    self.__add_exif_tag(resized_poster)
-
-                # Upload poster
-                self.__retry_upload(season, resized_poster)
-
-                # If integrating with Kometa, remove label
-                if self.integrate_with_kometa:
-                    season.removeLabel(['Overlay'])
-            except Exception:
-                continue
-            else:
-                loaded_count += 1
-
-            # Update loaded database
-            self.__posters.upsert({
+            uploads.append((f'Season {season.index}', partial(
+                self.__upload_image, season, poster, series_info,
+            )))
+            records[f'Season {season.index}'] = {
                 'library': library_name,
                 'series': series_info.full_name,
                 'season': season.index,
                 'filesize': poster.stat().st_size,
-            }, condition)
+            }
+
+        # Upload posters, update loaded database with all uploaded posters
+        uploaded, _, _ = self.upload_scheduler.run(uploads)
+        self._upsert_loaded_records(
+            self.__posters, library_name, series_info,
+            [records[key] for key in uploaded], keys=('season',),
+        )
 
         # Log load operations to user
-        if loaded_count > 0:
-            log.info(f'Loaded {loaded_count} season posters for "{series_info}"')
+        if uploaded:
+            log.info(f'Loaded {len(uploaded)} season posters for '
+                     f'"{series_info}"')
 
         return None
 
@@ -933,6 +1381,11 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
                     entry.title, entry.year
                 )
 
+                # Series may have changed, invalidate its cached resolution
+                self.clear_cache(
+                    entry.librarySectionTitle, series_info, entry.ratingKey,
+                )
+
                 return [
                     (series_info,
                      EpisodeInfo(ep.title, ep.parentIndex, ep.index),
@@ -949,6 +1402,9 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
                 series_info = self.info_set.get_series_info(
                     entry.parentTitle, entry.year
                 )
+                self.clear_cache(
+                    series.librarySectionTitle, series_info, series.ratingKey,
+                )
 
                 return [
                     (series_info,
@@ -963,6 +1419,9 @@ class PlexInterface(EpisodeDataSource, MediaServer, SyncInterface):
                 series_info = self.info_set.get_series_info(
                     entry.grandparentTitle, series.year
                 )
+                self.clear_cache(
+                    entry.librarySectionTitle, series_info, series.ratingKey,
+                )
 
                 return [(
                     series_info,
@@ -1,4 +1,6 @@
+# pylint: disable=import-outside-toplevel
 from collections import namedtuple
+from copy import deepcopy
 from pathlib import Path
 from sys import exit as sys_exit
 from typing import Any, Iterator, Optional, Union
@@ -8,24 +10,25 @@ from tqdm import tqdm
 
 from modules.CleanPath import CleanPath
 from modules.Debug import log, TQDM_KWARGS
-from modules.EmbyInterface import EmbyInterface
 from modules.Font import Font
 from modules.ImageMagickInterface import ImageMagickInterface
 from modules.ImageMaker import ImageMaker
-from modules.JellyfinInterface import JellyfinInterface
 from modules.Manager import Manager
-from modules.PlexInterface import PlexInterface
+from modules.PipelineExecutor import PipelineExecutor
+from modules.RenderQueue import RenderQueue
+from modules.RequestScheduler import RequestScheduler
+from modules.SeriesIndex import SeriesIndex
 from modules.SeriesInfo import SeriesInfo
+from modules.SeriesYamlCache import SeriesYamlCache
 from modules.SeriesYamlWriter import SeriesYamlWriter
+from modules.ShowDigestKeeper import ShowDigestKeeper
 from modules.Show import Show
-from modules.SonarrInterface import SonarrInterface
 from modules.StandardSummary import StandardSummary
 from modules.StyleSet import StyleSet
 from modules.StylizedSummary import StylizedSummary
-from modules.TautulliInterface import TautulliInterface
 from modules.Template import Template
 from modules.TitleCard import TitleCard
-from modules.TMDbInterface import TMDbInterface
+from modules.UploadScheduler import UploadScheduler
 from modules.Version import Version
 from modules.YamlReader import YamlReader
 
@@ -80,6 +83,8 @@ class PreferenceParser(YamlReader):
         # Store and read file
         self.file = file
         self.read_file()
+        self.__series_index: Optional[SeriesIndex] = None
+        self.__series_yaml_cache: Optional[SeriesYamlCache] = None
 
         # Database object directory, create if DNE
         self.DEFAULT_TEMP_DIR.mkdir(parents=True, exist_ok=True)
@@ -109,6 +114,18 @@ class PreferenceParser(YamlReader):
         self.season_folder_format = self.DEFAULT_SEASON_FOLDER_FORMAT
         self.sync_specials = True
         self.supported_language_codes = ['en']
+        self.request_rate = RequestScheduler.DEFAULT_RATE
+        self.request_burst = RequestScheduler.DEFAULT_BURST
+        self.request_concurrency = RequestScheduler.DEFAULT_CONCURRENCY
+        self.io_concurrency = PipelineExecutor.DEFAULT_IO_CONCURRENCY
+        self.render_concurrency = PipelineExecutor.DEFAULT_RENDER_CONCURRENCY
+        self.skip_unchanged = False
+        self.verification_interval = \
+            ShowDigestKeeper.DEFAULT_VERIFICATION_INTERVAL
+        self.render_queue = None
+        self.render_lease = RenderQueue.DEFAULT_LEASE
+        self.card_type_directories = []
+        self.webhook_token = None
 
         self.archive_directory = None
         self.create_archive = False
@@ -125,9 +142,8 @@ class PreferenceParser(YamlReader):
         self.emby_api_key = None
         self.emby_username = None
         self.emby_verify_ssl = True
-        self.emby_filesize_limit = self.filesize_as_bytes(
-            EmbyInterface.DEFAULT_FILESIZE_LIMIT
-        )
+        self.emby_filesize_limit = None
+        self.emby_upload_concurrency = UploadScheduler.DEFAULT_CONCURRENCY
         self.emby_style_set = StyleSet()
         self.emby_yaml_writers = []
         self.emby_yaml_update_args = []
@@ -137,9 +153,8 @@ class PreferenceParser(YamlReader):
         self.jellyfin_api_key = None
         self.jellyfin_username = None
         self.jellyfin_verify_ssl = True
-        self.jellyfin_filesize_limit = self.filesize_as_bytes(
-            JellyfinInterface.DEFAULT_FILESIZE_LIMIT
-        )
+        self.jellyfin_filesize_limit = None
+        self.jellyfin_upload_concurrency = UploadScheduler.DEFAULT_CONCURRENCY
         self.jellyfin_style_set = StyleSet()
         self.jellyfin_yaml_writers = []
         self.jellyfin_yaml_update_args = []
@@ -149,10 +164,10 @@ class PreferenceParser(YamlReader):
         self.plex_token = 'NA'
         self.plex_verify_ssl = True
         self.integrate_with_kometa = False
-        self.plex_filesize_limit = self.filesize_as_bytes(
-            PlexInterface.DEFAULT_FILESIZE_LIMIT
-        )
-        self.plex_timeout = PlexInterface.DEFAULT_TIMEOUT
+        self.plex_filesize_limit = None
+        self.plex_timeout = None
+        self.plex_incremental_sync = False
+        self.plex_upload_concurrency = UploadScheduler.DEFAULT_CONCURRENCY
         self.plex_style_set = StyleSet()
         self.plex_yaml_writers = []
         self.plex_yaml_update_args = []
@@ -162,7 +177,7 @@ class PreferenceParser(YamlReader):
 
         self.use_tmdb = False
         self.tmdb_api_key = None
-        self.tmdb_retry_count = TMDbInterface.BLACKLIST_THRESHOLD
+        self.tmdb_retry_count = None
         self.tmdb_minimum_resolution = {'width': 0, 'height': 0}
         self.tmdb_skip_localized_images = False
         self.tmdb_logo_language_priority = ['en']
@@ -173,11 +188,13 @@ class PreferenceParser(YamlReader):
         self.tautulli_verify_ssl = True
         self.tautulli_username = None
         self.tautulli_update_script = None
-        self.tautulli_agent_name = TautulliInterface.DEFAULT_AGENT_NAME
-        self.tautulli_script_timeout = TautulliInterface.DEFAULT_SCRIPT_TIMEOUT
+        self.tautulli_agent_name = None
+        self.tautulli_script_timeout = None
 
         self.imagemagick_container = None
         self.imagemagick_timeout = ImageMagickInterface.COMMAND_TIMEOUT_SECONDS
+        self.imagemagick_memory_budget = None
+        self.imagemagick_threads = None
 
         # Determine default media server
         if (not self._is_specified('emby')
@@ -298,6 +315,7 @@ class PreferenceParser(YamlReader):
                 if (value := sync_yaml.get('downloaded_only', type_=bool)) is not None:
                     update_args['downloaded_only'] = value
                 if (value := sync_yaml.get('series_type', type_=str)) is not None:
+                    from modules.SonarrInterface import SonarrInterface
                     if value in SonarrInterface.VALID_SERIES_TYPES:
                         update_args['series_type'] = value
                     else:
@@ -496,6 +514,82 @@ class PreferenceParser(YamlReader):
                 log.info(f'Must be one of {codes}')
                 self.valid = False
 
+        if (value := self.get('options', 'request_rate', type_=float)) is not None:
+            if value > 0:
+                self.request_rate = value
+            else:
+                log.critical(f'Request rate must be greater than 0')
+                self.valid = False
+
+        if (value := self.get('options', 'request_burst', type_=int)) is not None:
+            if value >= 1:
+                self.request_burst = value
+            else:
+                log.critical(f'Request burst must be at least 1')
+                self.valid = False
+
+        if (value := self.get('options', 'request_concurrency',
+                               type_=int)) is not None:
+            if value >= 1:
+                self.request_concurrency = value
+            else:
+                log.critical(f'Request concurrency must be at least 1')
+                self.valid = False
+
+        if (value := self.get('options', 'io_concurrency',
+                               type_=int)) is not None:
+            if value >= 1:
+                self.io_concurrency = value
+            else:
+                log.critical(f'I/O concurrency must be at least 1')
+                self.valid = False
+
+        if (value := self.get('options', 'render_concurrency',
+                               type_=int)) is not None:
+            if value >= 1:
+                self.render_concurrency = value
+            else:
+                log.critical(f'Render concurrency must be at least 1')
+                self.valid = False
+
+        if (value := self.get('options', 'skip_unchanged',
+                               type_=bool)) is not None:
+            self.skip_unchanged = value
+
+        if (value := self.get('options', 'verification_interval',
+                               type_=float)) is not None:
+            if value >= 0:
+                self.verification_interval = value
+            else:
+                log.critical(f'Verification interval must be at least 0 days')
+                self.valid = False
+
+        if (value := self.get('options', 'render_queue',
+                               type_=CleanPath)) is not None:
+            self.render_queue = value.sanitize()
+
+        if (value := self.get('options', 'render_lease',
+                               type_=float)) is not None:
+            if value >= 1:
+                self.render_lease = value
+            else:
+                log.critical(f'Render lease must be at least 1 second')
+                self.valid = False
+
+        if (value := self.get('options', 'card_type_directories',
+                               type_=list)) is not None:
+            self.card_type_directories = [
+                CleanPath(directory).sanitize() for directory in value
+            ]
+
+        if (value := self.get('options', 'webhook_token',
+                               type_=str)) is not None:
+            if len(value) >= 16:
+                self.webhook_token = value
+            else:
+                log.critical(f'Webhook token must be at least 16 characters')
+                self.valid = False
+
         return None
 
 
@@ -552,6 +646,31 @@ class PreferenceParser(YamlReader):
         return None
 
 
+    def __get_upload_concurrency(self, section: str) -> int:
+        """
+        Get the upload concurrency of the given media server section.
+
+        Args:
+            section: Name of the section to parse.
+
+        Returns:
+            Maximum number of simultaneous uploads. The default value is
+            returned if unspecified or invalid.
+        """
+
+        value = self.get(section, 'upload_concurrency', type_=int)
+        if value is None:
+            return UploadScheduler.DEFAULT_CONCURRENCY
+
+        if value < 1:
+            log.critical(f'{section.title()} upload_concurrency must be at '
+                         f'least 1')
+            self.valid = False
+            return UploadScheduler.DEFAULT_CONCURRENCY
+
+        return value
+
+
     def __parse_yaml_emby(self) -> None:
         """
         Parse the 'emby' section of the raw YAML dictionary into
@@ -562,6 +681,12 @@ class PreferenceParser(YamlReader):
         if not self._is_specified('emby'):
             return None
 
+        # Interface (and its defaults) are only imported if specified
+        from modules.EmbyInterface import EmbyInterface
+        self.emby_filesize_limit = self.filesize_as_bytes(
+            EmbyInterface.DEFAULT_FILESIZE_LIMIT
+        )
+
         if (not self._is_specified('emby', 'url')
             or not  self._is_specified('emby', 'api_key')
             or not  self._is_specified('emby', 'username')):
@@ -585,6 +710,8 @@ class PreferenceParser(YamlReader):
                                type_=self.filesize_as_bytes)) is not None:
             self.emby_filesize_limit = value
 
+        self.emby_upload_concurrency = self.__get_upload_concurrency('emby')
+
         self.emby_style_set = StyleSet(
             self.get('emby', 'watched_style', type_=str, default='unique'),
             self.get('emby', 'unwatched_style', type_=str, default='unique'),
@@ -604,6 +731,12 @@ class PreferenceParser(YamlReader):
         if not self._is_specified('jellyfin'):
             return None
 
+        # Interface (and its defaults) are only imported if specified
+        from modules.JellyfinInterface import JellyfinInterface
+        self.jellyfin_filesize_limit = self.filesize_as_bytes(
+            JellyfinInterface.DEFAULT_FILESIZE_LIMIT
+        )
+
         if (not self._is_specified('jellyfin', 'url')
             or not  self._is_specified('jellyfin', 'api_key')
             or not  self._is_specified('jellyfin', 'username')):
@@ -628,6 +761,10 @@ class PreferenceParser(YamlReader):
                                type_=self.filesize_as_bytes)) is not None:
             self.jellyfin_filesize_limit = value
 
+        self.jellyfin_upload_concurrency = self.__get_upload_concurrency(
+            'jellyfin'
+        )
+
         self.jellyfin_style_set = StyleSet(
             self.get('jellyfin', 'watched_style', type_=str, default='unique'),
             self.get('jellyfin', 'unwatched_style', type_=str, default='unique'),
@@ -647,6 +784,13 @@ class PreferenceParser(YamlReader):
         if not self._is_specified('plex'):
             return None
 
+        # Interface (and its defaults) are only imported if specified
+        from modules.PlexInterface import PlexInterface
+        self.plex_filesize_limit = self.filesize_as_bytes(
+            PlexInterface.DEFAULT_FILESIZE_LIMIT
+        )
+        self.plex_timeout = PlexInterface.DEFAULT_TIMEOUT
+
         if (value := self.get('plex', 'url', type_=str)) is not None:
             self.plex_url = value
             self.use_plex = True
@@ -675,6 +819,11 @@ class PreferenceParser(YamlReader):
         if (value := self.get('plex', 'timeout', type_=int)) is not None:
             self.plex_timeout = value
 
+        if (value := self.get('plex', 'incremental_sync', type_=bool)) is not None:
+            self.plex_incremental_sync = value
+
+        self.plex_upload_concurrency = self.__get_upload_concurrency('plex')
+
         self.plex_style_set = StyleSet(
             self.get('plex', 'watched_style', type_=str, default='unique'),
             self.get('plex', 'unwatched_style', type_=str, default='unique'),
@@ -739,6 +888,10 @@ class PreferenceParser(YamlReader):
         if not self._is_specified('tmdb'):
             return None
 
+        # Interface (and its defaults) are only imported if specified
+        from modules.TMDbInterface import TMDbInterface
+        self.tmdb_retry_count = TMDbInterface.BLACKLIST_THRESHOLD
+
         if (value := self.get('tmdb', 'api_key', type_=str)) is not None:
             self.tmdb_api_key = value
             self.use_tmdb = True
@@ -787,6 +940,11 @@ class PreferenceParser(YamlReader):
         if not self._is_specified('tautulli'):
             return None
 
+        # Interface (and its defaults) are only imported if specified
+        from modules.TautulliInterface import TautulliInterface
+        self.tautulli_agent_name = TautulliInterface.DEFAULT_AGENT_NAME
+        self.tautulli_script_timeout = TautulliInterface.DEFAULT_SCRIPT_TIMEOUT
+
         # Parse required attributes
         if ((url := self.get('tautulli', 'url', type_=str)) is not None
             and (api_key := self.get('tautulli', 'api_key', type_=str)) is not None
@@ -826,18 +984,33 @@ class PreferenceParser(YamlReader):
         if not self._is_specified('imagemagick'):
             return None
 
-        # Warn if ImageMagick provided in a Docker environment
-        if self.is_docker:
-            log.warning(f'Specifying the "imagemagick" section is not '
-                        f'recommended when using TitleCardMaker in Docker')
-
         if (value := self.get('imagemagick', 'container',
                                type_=str)) is not None:
+            # Warn if ImageMagick provided in a Docker environment
+            if self.is_docker:
+                log.warning(f'Specifying an ImageMagick container is not '
+                            f'recommended when using TitleCardMaker in Docker')
             self.imagemagick_container = value
 
         if (value := self.get('imagemagick', 'timeout',type_=int)) is not None:
             self.imagemagick_timeout = value
 
+        if (value := self.get('imagemagick', 'memory_budget',
+                               type_=float)) is not None:
+            if value > 0:
+                self.imagemagick_memory_budget = value
+            else:
+                log.critical(f'ImageMagick memory budget must be greater than '
+                             f'0 MiB')
+                self.valid = False
+
+        if (value := self.get('imagemagick', 'threads', type_=int)) is not None:
+            if value >= 1:
+                self.imagemagick_threads = value
+            else:
+                log.critical(f'ImageMagick threads must be at least 1')
+                self.valid = False
+
         return None
 
 
@@ -1092,17 +1265,243 @@ class PreferenceParser(YamlReader):
         log.info(f'Read preference file "{self.file.resolve()}"')
 
 
-    def iterate_series_files(self) -> Iterator[Show]:
+    @property
+    def series_index(self) -> SeriesIndex:
+        """Index of the series defined in the series YAML files."""
+
+        if self.__series_index is None:
+            self.__series_index = SeriesIndex()
+
+        return self.__series_index
+
+
+    @property
+    def series_yaml_cache(self) -> SeriesYamlCache:
+        """Cache of the parsed and finalized YAML of the series files."""
+
+        if self.__series_yaml_cache is None:
+            self.__series_yaml_cache = SeriesYamlCache(
+                self.database_directory,
+                # Finalized entries depend on these
+                (str(self.version), self.default_media_server,
+                 self.is_docker, str(Path.cwd())),
+            )
+
+        return self.__series_yaml_cache
+
+
+    def __read_series_file(self,
+            file: Path,
+        ) -> Optional[tuple[dict, dict, dict, dict[str, Template]]]:
+        """
+        Read and validate the given series YAML file.
+
+        Args:
+            file: Series YAML file to read.
+
+        Returns:
+            Tuple of the file's series, library map, font map, and
+            templates. None if the file does not exist, has no series,
+            or is invalid.
+        """
+
+        # If the file doesn't exist, error and skip
+        if not file.exists():
+            log.error(f'Series file "{file.resolve()}" does not exist')
+
+            # If on Docker and missing file was relative, warn first
+            if (self.is_docker
+                and len(file.parts) > 1 and file.parts[1] == 'maker'):
+                log.warning(f'Did you mean "/config/{file.name}"?')
+            return None
+
+        # Read file (if modified since last read), parse yaml
+        if ((file_yaml := self.series_yaml_cache.read(file)) == {}
+            or file_yaml is None or file_yaml.get('series', None) is None):
+            log.warning(f'Series file "{file.resolve()}" has no entries')
+            return None
+
+        # Validate the libraries provided in this file
+        library_map = file_yaml.get('libraries', {})
+        if not self.__validate_libraries(library_map, file):
+            return None
+
+        # Get font map for this file
+        font_map = file_yaml.get('fonts', {})
+        if not self.__validate_fonts(font_map, file):
+            return None
+
+        # Construct Template objects for this file
+        templates = {}
+        value = file_yaml.get('templates', {})
+        if isinstance(value, dict):
+            for name, template in value.items():
+                # If not specified as dictionary, error and skip
+                if not isinstance(template, dict):
+                    log.error(f'Invalid template specification for "{name}"'
+                              f' in series file "{file.resolve()}"')
+                    continue
+                templates[name] = Template(name, template)
+
+        return file_yaml['series'], library_map, font_map, templates
+
+
+    def __finalize_entry(self,
+            show_name: str,
+            series_yaml: dict,
+            library_map: dict,
+            font_map: dict,
+            templates: dict[str, Template],
+            file: Path,
+        ) -> Optional[tuple[dict, list[dict]]]:
+        """
+        Finalize the YAML of the given series entry and each of its
+        archive variations. Entries which finalize without error are
+        cached.
+
+        Args:
+            show_name: Name of the series entry.
+            series_yaml: YAML of the series entry.
+            library_map: Library map of the entry's series file.
+            font_map: Font map of the entry's series file.
+            templates: Templates of the entry's series file.
+            file: Series file the entry is from.
+
+        Returns:
+            Tuple of the finalized YAML of the entry, and of each of its
+            valid archive variations. None if the entry is invalid.
+        """
+
+        # Skip if not a dictionary
+        if not isinstance(series_yaml, dict):
+            log.error(f'Skipping "{show_name}" from "{file}"')
+            return None
+
+        # Apply template and merge libraries+font maps
+        show_yaml = self.__finalize_show_yaml(
+            series_yaml.get('name', show_name),
+            series_yaml,
+            templates,
+            library_map,
+            font_map,
+            default_media_server=self.default_media_server,
+        )
+
+        # If returned YAML is None (invalid) skip series
+        if show_yaml is None:
+            log.error(f'Skipping "{show_name}" from "{file}"')
+            return None
+
+        # Get all specified variations for this show
+        variations = deepcopy(show_yaml.get('archive_variations', []))
+        if not isinstance(variations, list):
+            log.error(f'Invalid archive variations for {show_name}')
+            return show_yaml, []
+
+        # Apply template and merge libraries+font maps to each variation
+        finalized = []
+        for variation in variations:
+            variation = self.__finalize_show_yaml(
+                show_name, variation, templates, library_map, font_map,
+                default_media_server=self.default_media_server,
+            )
+
+            # Skip if finalization failed
+            if variation is None:
+                log.error(f'Skipping archive variation of "{show_name}"'
+                          f' from "{file}"')
+            else:
+                finalized.append(variation)
+
+        # Only cache entries without errors, so errors are always logged
+        if len(finalized) == len(variations):
+            self.series_yaml_cache.set_entry(
+                file, show_name, show_yaml, finalized
+            )
+
+        return show_yaml, finalized
+
+
+    def __iterate_entry(self,
+            show_name: str,
+            series_yaml: dict,
+            library_map: dict,
+            font_map: dict,
+            templates: dict[str, Template],
+            file: Path,
+        ) -> Iterator[Show]:
+        """
+        Iterate through the Show objects of the given series entry -
+        i.e. the series and each of its archive variations.
+
+        Args:
+            show_name: Name of the series entry.
+            series_yaml: YAML of the series entry.
+            library_map: Library map of the entry's series file.
+            font_map: Font map of the entry's series file.
+            templates: Templates of the entry's series file.
+            file: Series file the entry is from.
+
+        Returns:
+            An iterable of the Show objects created by this entry.
+        """
+
+        # Use the cached finalized YAML if the file is unchanged
+        if (entry := self.series_yaml_cache.get_entry(file, show_name)) is None:
+            entry = self.__finalize_entry(
+                show_name, series_yaml, library_map, font_map, templates, file
+            )
+            if entry is None:
+                return None
+        show_yaml, variations = entry
+
+        yield Show(show_name, show_yaml, self.source_directory, self)
+
+        # Yield each variation
+        show_yaml.pop('archive_variations', None)
+        show_yaml.pop('archive_name', None)
+        show_yaml.pop('archive', None)
+        for variation in variations:
+            # Get priority union of variation and base series
+            Template.recurse_priority_union(variation, show_yaml)
+
+            # Remove any library-specific details
+            variation.pop('media_directory', None)
+            variation.pop('library', None)
+
+            yield Show(show_name, variation, self.source_directory, self)
+
+
+    def iterate_series_files(self,
+            files: Optional[set[Path]] = None,
+        ) -> Iterator[Show]:
         """
         Iterate through all series file listed in the preferences. For
         each series encountered in each file, yield a Show object. Files
-        that do not exist or have invalid YAML are skipped.
+        that do not exist or have invalid YAML are skipped. The series
+        of each completely read file are added to the series index.
+
+        Args:
+            files: Resolved paths of the series files to read. If
+                omitted, all series files are read.
 
         Returns:
             An iterable of Show objects created by the entry listed in
             all the known (valid) series files.
         """
 
+        # Parse the modified series files in parallel
+        paths = []
+        for file_ in self.series_files:
+            try:
+                paths.append(CleanPath(file_).sanitize())
+            except Exception:
+                continue
+        self.series_yaml_cache.prefetch(
+            path for path in paths
+            if files is None or path.resolve() in files
+        )
+
         # Reach each file in the list of series YAML files
         for file_ in (pbar := tqdm(self.series_files, **TQDM_KWARGS)):
             # Create Path object for this file
@@ -1112,103 +1511,82 @@ class PreferenceParser(YamlReader):
                 log.exception(f'Invalid series file "{file_}"')
                 continue
 
+            # Skip if not a requested file
+            if files is not None and file.resolve() not in files:
+                continue
+
             # Update progress bar for this file
             pbar.set_description(f'Reading {file.name}')
             log.info(f'Reading series YAML file "{file.resolve()}"..')
 
-            # If the file doesn't exist, error and skip
-            if not file.exists():
-                log.error(f'Series file "{file.resolve()}" does not exist')
-
-                # If on Docker and missing file was relative, warn first
-                if (self.is_docker
-                    and len(file.parts) > 1 and file.parts[1] == 'maker'):
-                    log.warning(f'Did you mean "/config/{file.name}"?')
-                continue
-
-            # Read file, parse yaml
-            if ((file_yaml := self._read_file(file, critical=False)) == {}
-                or file_yaml is None or file_yaml.get('series', None) is None):
-                log.warning(f'Series file "{file.resolve()}" has no entries')
-                continue
-
-            # Validate the libraries provided in this file
-            library_map = file_yaml.get('libraries', {})
-            if not self.__validate_libraries(library_map, file):
+            # Read and validate this file, skip if invalid
+            if (series_file := self.__read_series_file(file)) is None:
                 continue
-
-            # Get font map for this file
-            font_map = file_yaml.get('fonts', {})
-            if not self.__validate_fonts(font_map, file):
-                continue
-
-            # Construct Template objects for this file
-            templates = {}
-            value = file_yaml.get('templates', {})
-            if isinstance(value, dict):
-                for name, template in value.items():
-                    # If not specified as dictionary, error and skip
-                    if not isinstance(template, dict):
-                        log.error(f'Invalid template specification for "{name}"'
-                                  f' in series file "{file.resolve()}"')
-                        continue
-                    templates[name] = Template(name, template)
+            series, library_map, font_map, templates = series_file
 
             # Go through each series in this file
-            for show_name in tqdm(file_yaml['series'], desc='Reading entries',
+            entries = []
+            for show_name in tqdm(series, desc='Reading entries',
                                   **TQDM_KWARGS):
-                # Skip if not a dictionary
-                if not isinstance(file_yaml['series'][show_name], dict):
-                    log.error(f'Skipping "{show_name}" from "{file_}"')
-                    continue
-
-                # Apply template and merge libraries+font maps
-                show_yaml = self.__finalize_show_yaml(
-                    file_yaml['series'][show_name].get('name', show_name),
-                    file_yaml['series'][show_name],
-                    templates,
-                    library_map,
-                    font_map,
-                    default_media_server=self.default_media_server,
-                )
-
-                # If returned YAML is None (invalid) skip series
-                if show_yaml is None:
-                    log.error(f'Skipping "{show_name}" from "{file_}"')
-                    continue
+                for show in self.__iterate_entry(
+                        show_name, series[show_name], library_map, font_map,
+                        templates, file):
+                    if show.library_name is not None:
+                        entries.append((
+                            show.library_name,
+                            show.series_info.full_match_name,
+                            show_name,
+                        ))
+                    yield show
+
+            # All series of this file were read, update index and cache
+            self.series_index.index_file(file, entries)
+            self.series_yaml_cache.save()
+
+
+    def get_indexed_shows(self,
+            library_name: str,
+            full_match_name: str,
+        ) -> Optional[list[Show]]:
+        """
+        Get the Show objects of the given series from the series index.
+        Only the files and entries which define the series are read.
 
-                yield Show(show_name, show_yaml, self.source_directory, self)
+        Args:
+            library_name: Name of the library of the series.
+            full_match_name: Full match name of the series.
 
-                # Get all specified variations for this show
-                variations = show_yaml.pop('archive_variations', [])
-                if not isinstance(variations, list):
-                    log.error(f'Invalid archive variations for {show_name}')
-                    continue
+        Returns:
+            List of valid Show objects of the given series in the given
+            library. None if the series is not (or no longer) indexed,
+            and all series files must be searched instead.
+        """
 
-                # Yield each variation
-                show_yaml.pop('archive_name', None)
-                show_yaml.pop('archive', None)
-                for variation in variations:
-                    # Apply template and merge libraries+font maps to variation
-                    variation = self.__finalize_show_yaml(
-                        show_name, variation, templates, library_map, font_map,
-                        default_media_server=self.default_media_server,
-                    )
+        if (locations := self.series_index.get(
+                library_name, full_match_name)) is None:
+            return None
 
-                    # Skip if finalization failed
-                    if variation is None:
-                        log.error(f'Skipping archive variation of "{show_name}"'
-                                  f' from "{file_}"')
-                        continue
+        shows = []
+        for file, show_name in locations:
+            # Re-read this file, verify entry still exists
+            if ((series_file := self.__read_series_file(file)) is None
+                or show_name not in series_file[0]):
+                return None
+            series, library_map, font_map, templates = series_file
 
-                    # Get priority union of variation and base series
-                    Template.recurse_priority_union(variation, show_yaml)
+            shows.extend(
+                show for show in self.__iterate_entry(
+                    show_name, series[show_name], library_map, font_map,
+                    templates, file,
+                )
+                if (show.valid
+                    and show.library_name == library_name
+                    and show.series_info.full_match_name == full_match_name)
+            )
 
-                    # Remove any library-specific details
-                    variation.pop('media_directory', None)
-                    variation.pop('library', None)
+        self.series_yaml_cache.save()
 
-                    yield Show(show_name, variation, self.source_directory,self)
+        return shows if shows else None
 
 
     @property
@@ -1242,6 +1620,7 @@ class PreferenceParser(YamlReader):
             'username': self.emby_username,
             'verify_ssl': self.emby_verify_ssl,
             'filesize_limit': self.emby_filesize_limit,
+            'upload_concurrency': self.emby_upload_concurrency,
         }
 
     @property
@@ -1254,6 +1633,7 @@ class PreferenceParser(YamlReader):
             'username': self.jellyfin_username,
             'verify_ssl': self.jellyfin_verify_ssl,
             'filesize_limit': self.jellyfin_filesize_limit,
+            'upload_concurrency': self.jellyfin_upload_concurrency,
         }
 
     @property
@@ -1266,7 +1646,9 @@ class PreferenceParser(YamlReader):
             'verify_ssl': self.plex_verify_ssl,
             'integrate_with_kometa': self.integrate_with_kometa,
             'filesize_limit': self.plex_filesize_limit,
-            'timeout': self.plex_timeout
+            'timeout': self.plex_timeout,
+            'incremental_sync': self.plex_incremental_sync,
+            'upload_concurrency': self.plex_upload_concurrency,
         }
 
     @property
@@ -1,9 +1,9 @@
+# pylint: disable=import-outside-toplevel
 import sys
 from importlib.util import spec_from_file_location, module_from_spec
 
 from pathlib import Path
 from typing import Optional
-from requests import get
 from tinydb import where
 from modules.BaseCardType import BaseCardType
 
@@ -72,7 +72,9 @@ class RemoteCardType:
             # Only request and write file if not loaded this run
             if (not self.loaded.get(where('remote') == url)
                 or not file_name.exists()):
-                # Make GET request for the contents of the specified value
+                # Make GET request for the contents of the specified value -
+                # requests is only imported once a remote card is downloaded
+                from requests import get
                 if (response := get(url, timeout=30)).status_code >= 400:
                     log.error(f'Cannot identify remote Card Type "{remote}"')
                     self.valid = False
@@ -1,12 +1,16 @@
+# pylint: disable=import-outside-toplevel
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from requests import Response, get
 from tenacity import retry, stop_after_attempt, wait_fixed, wait_exponential
 from tinydb import where
 
 from modules.Debug import log
 from modules.PersistentDatabase import PersistentDatabase
 
+if TYPE_CHECKING:
+    from requests import Response
+
 
 class RemoteFile:
     """
@@ -112,7 +116,7 @@ class RemoteFile:
 
     @retry(stop=stop_after_attempt(3),
            wait=wait_fixed(3)+wait_exponential(min=1, max=16))
-    def __get_remote_content(self) -> Response:
+    def __get_remote_content(self) -> 'Response':
         """
         Get the content at the remote source.
 
@@ -120,6 +124,8 @@ class RemoteFile:
             Response object from this object's remote source.
         """
 
+        # requests is only imported once a remote file is downloaded
+        from requests import get
         return get(self.remote_source, timeout=10)
 
 
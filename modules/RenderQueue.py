@@ -0,0 +1,489 @@
+from contextlib import contextmanager
+from importlib.util import module_from_spec, spec_from_file_location
+from inspect import getfile
+from json import dumps, loads
+from os import getpid
+from pathlib import Path
+from socket import gethostname
+import sqlite3
+from threading import Event, Lock, Thread
+from time import monotonic, sleep, time
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from modules.BaseCardType import BaseCardType
+from modules.Debug import log
+
+
+class RenderQueue:
+    """
+    This class describes a queue of title cards to render, shared by any
+    number of processes - potentially on different hosts - through a
+    SQLite database on a shared volume. The coordinator (the Manager)
+    submits the fully built parameters of each card, and workers lease,
+    render, and complete them. The coordinator also renders jobs while
+    it waits for them, so a queue without workers still makes progress.
+
+    A leased job is kept alive by its worker's heartbeats. If a worker
+    crashes its lease expires and the job is leased again, up to the
+    maximum number of attempts.
+
+    All processes must see the source, card, and font files at the same
+    paths - e.g. by mounting the shared volume at the same location - and
+    the volume must support file locking. Card types which are not built
+    in are only loaded from the card type directories - so a queue
+    database cannot be used to run arbitrary files.
+    """
+
+    """Default seconds a leased job is reserved without a heartbeat"""
+    DEFAULT_LEASE = 60.0
+
+    """Maximum number of times a job is attempted before it fails"""
+    MAX_ATTEMPTS = 3
+
+    """How often (in seconds) to check for new or completed jobs"""
+    POLL_INTERVAL = 0.5
+
+    """Seconds to wait for a locked database"""
+    DATABASE_TIMEOUT = 60.0
+
+    """Seconds after which finished jobs nobody waited for are removed"""
+    FINISHED_JOB_EXPIRATION = 24 * 60 * 60
+
+    """Directory RemoteCardType downloads card types to"""
+    REMOTE_CARD_TYPE_DIRECTORY = Path(__file__).parent / '.objects'
+
+    """Schema of the job table"""
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS jobs ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'card_type TEXT NOT NULL, '
+            'parameters TEXT NOT NULL, '
+            'destination TEXT NOT NULL, '
+            "status TEXT NOT NULL DEFAULT 'pending', "
+            'worker TEXT, '
+            'lease_expires REAL, '
+            'attempts INTEGER NOT NULL DEFAULT 0, '
+            'error TEXT, '
+            'updated REAL NOT NULL'
+        ')',
+        'CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id)',
+        'CREATE INDEX IF NOT EXISTS jobs_destination ON jobs (destination)',
+    )
+
+    __slots__ = (
+        'file', 'lease', 'worker', 'card_type_directories', '__submitted',
+        '__lock', '__card_types',
+    )
+
+
+    def __init__(self,
+            file: Path,
+            lease: float = DEFAULT_LEASE,
+            card_type_directories: Iterable[Path] = (),
+        ) -> None:
+        """
+        Initialize this queue, creating the database if it does not
+        exist.
+
+        Args:
+            file: SQLite database file of the queue.
+            lease: Number of seconds a leased job is reserved for a
+                worker without a heartbeat.
+            card_type_directories: Directories (in addition to that of
+                remote card types) which card type files can be loaded
+                from.
+        """
+
+        self.file = Path(file)
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        self.lease = max(1.0, float(lease))
+        self.worker = f'{gethostname()}-{getpid()}'
+        self.card_type_directories = [
+            Path(directory).resolve() for directory in
+            (self.REMOTE_CARD_TYPE_DIRECTORY, *card_type_directories)
+        ]
+
+        # Jobs submitted by this process, and loaded card types
+        self.__submitted: set[int] = set()
+        self.__lock = Lock()
+        self.__card_types: dict[str, type[BaseCardType]] = {}
+
+        with self.__connect() as connection:
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return f'<RenderQueue "{self.file.resolve()}" as {self.worker}>'
+
+
+    @contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Get a new connection to the queue database, which is closed (and
+        any open transaction rolled back) on exit. Connections are not
+        shared between threads, so one is made for each operation.
+        """
+
+        connection = sqlite3.connect(
+            self.file, timeout=self.DATABASE_TIMEOUT, isolation_level=None,
+        )
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+
+    @staticmethod
+    def __encode(value: Any) -> Any:
+        """Encode Path objects (not JSON serializable) for JSON."""
+
+        if isinstance(value, Path):
+            return {'__path__': str(value)}
+
+        raise TypeError(f'{type(value).__name__} is not serializable')
+
+
+    @staticmethod
+    def __decode(value: dict) -> Union[dict, Path]:
+        """Decode any Path objects encoded for JSON."""
+
+        if set(value) == {'__path__'}:
+            return Path(value['__path__'])
+
+        return value
+
+
+    @staticmethod
+    def get_card_type(card_class: type[BaseCardType]) -> str:
+        """
+        Get the identifier workers can load the given card type from.
+
+        Args:
+            card_class: Card type class to identify.
+
+        Returns:
+            The card type identifier of built-in card types, otherwise
+            the file and name of the class (e.g. for remote card types).
+        """
+
+        from modules.TitleCard import TitleCard # pylint: disable=import-outside-toplevel
+        if (identifier := TitleCard.CARD_TYPES.get_identifier(card_class)):
+            return identifier
+
+        return f'{getfile(card_class)}::{card_class.__name__}'
+
+
+    def __load_card_type(self, card_type: str) -> type[BaseCardType]:
+        """
+        Load the card type class with the given identifier. Card type
+        files must be within one of the card type directories.
+
+        Raises:
+            ValueError if the card type cannot be loaded.
+        """
+
+        if (card_class := self.__card_types.get(card_type)) is not None:
+            return card_class
+
+        from modules.TitleCard import TitleCard # pylint: disable=import-outside-toplevel
+        if card_type in TitleCard.CARD_TYPES:
+            card_class = TitleCard.CARD_TYPES[card_type]
+        else:
+            file, _, class_name = card_type.rpartition('::')
+            file = Path(file).resolve()
+            if (file.suffix != '.py'
+                or not any(file.is_relative_to(directory)
+                           for directory in self.card_type_directories)):
+                raise ValueError(f'Card type file "{file}" is not in a card '
+                                 f'type directory')
+            if not file.exists():
+                raise ValueError(f'Card type file "{file}" does not exist')
+            spec = spec_from_file_location(class_name, file)
+            module = module_from_spec(spec)
+            spec.loader.exec_module(module)
+            card_class = module.__dict__[class_name]
+
+        self.__card_types[card_type] = card_class
+        return card_class
+
+
+    def submit(self,
+            card_class: type[BaseCardType],
+            parameters: dict[str, Any],
+            destination: Path,
+        ) -> int:
+        """
+        Submit a card to be rendered. If the card is already queued, its
+        existing job is returned.
+
+        Args:
+            card_class: Card type class of the card.
+            parameters: Keyword arguments to initialize the card type
+                with.
+            destination: Path of the card to render.
+
+        Returns:
+            ID of the job of the card.
+
+        Raises:
+            TypeError if the parameters are not serializable.
+        """
+
+        card_type = self.get_card_type(card_class)
+        encoded = dumps(parameters, default=self.__encode)
+
+        # This process can always render the card types it submits
+        with self.__lock:
+            self.__card_types.setdefault(card_type, card_class)
+        destination = str(destination)
+
+        with self.__connect() as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            existing = connection.execute(
+                'SELECT id, status FROM jobs WHERE destination = ? '
+                "AND status IN ('pending', 'leased')", (destination,)
+            ).fetchone()
+            if existing is None:
+                job_id = connection.execute(
+                    'INSERT INTO jobs (card_type, parameters, destination, '
+                    'updated) VALUES (?, ?, ?, ?)',
+                    (card_type, encoded, destination, time()),
+                ).lastrowid
+            else:
+                job_id = existing[0]
+                if existing[1] == 'pending':
+                    connection.execute(
+                        'UPDATE jobs SET card_type = ?, parameters = ?, '
+                        'updated = ? WHERE id = ?',
+                        (card_type, encoded, time(), job_id),
+                    )
+            connection.execute('COMMIT')
+
+        with self.__lock:
+            self.__submitted.add(job_id)
+
+        return job_id
+
+
+    def lease_job(self) -> Optional[dict[str, Any]]:
+        """
+        Lease the oldest pending job, or a job whose lease has expired.
+
+        Returns:
+            Dictionary of the leased job. None if there are no jobs to
+            lease.
+        """
+
+        now = time()
+        with self.__connect() as connection:
+            connection.execute('BEGIN IMMEDIATE')
+
+            # Remove old finished jobs, fail jobs abandoned too many times
+            connection.execute(
+                "DELETE FROM jobs WHERE status IN ('done', 'failed') "
+                'AND updated < ?', (now - self.FINISHED_JOB_EXPIRATION,)
+            )
+            connection.execute(
+                "UPDATE jobs SET status = 'failed', updated = ?, "
+                "error = 'Abandoned by worker ' || worker WHERE "
+                "status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, now, self.MAX_ATTEMPTS),
+            )
+
+            row = connection.execute(
+                'SELECT id, card_type, parameters, destination, attempts '
+                "FROM jobs WHERE status = 'pending' OR (status = 'leased' "
+                'AND lease_expires < ?) ORDER BY id LIMIT 1', (now,)
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE jobs SET status = 'leased', worker = ?, "
+                    'lease_expires = ?, attempts = attempts + 1, updated = ? '
+                    'WHERE id = ?',
+                    (self.worker, now + self.lease, now, row[0]),
+                )
+            connection.execute('COMMIT')
+
+        if row is None:
+            return None
+
+        return {
+            'id': row[0], 'card_type': row[1], 'parameters': row[2],
+            'destination': Path(row[3]), 'attempt': row[4] + 1,
+        }
+
+
+    def heartbeat(self, job_id: int) -> None:
+        """Extend the lease of the given job held by this worker."""
+
+        with self.__connect() as connection:
+            connection.execute(
+                'UPDATE jobs SET lease_expires = ?, updated = ? WHERE id = ? '
+                "AND status = 'leased' AND worker = ?",
+                (time() + self.lease, time(), job_id, self.worker),
+            )
+
+
+    def finish(self, job_id: int, error: Optional[str] = None) -> None:
+        """
+        Finish the given job, if it is still leased by this worker.
+
+        Args:
+            job_id: ID of the job to finish.
+            error: Why the job failed. None if the job succeeded. Failed
+                jobs are retried until their maximum attempts.
+        """
+
+        with self.__connect() as connection:
+            if error is None:
+                connection.execute(
+                    "UPDATE jobs SET status = 'done', error = NULL, "
+                    "updated = ? WHERE id = ? AND status = 'leased' "
+                    'AND worker = ?', (time(), job_id, self.worker),
+                )
+            else:
+                connection.execute(
+                    'UPDATE jobs SET status = CASE WHEN attempts >= ? THEN '
+                    "'failed' ELSE 'pending' END, error = ?, updated = ? "
+                    "WHERE id = ? AND status = 'leased' AND worker = ?",
+                    (self.MAX_ATTEMPTS, error, time(), job_id, self.worker),
+                )
+
+
+    def render(self, job: dict[str, Any]) -> Optional[str]:
+        """
+        Render the card of the given (leased) job, sending heartbeats
+        while it renders.
+
+        Args:
+            job: Leased job to render.
+
+        Returns:
+            Why the card could not be rendered. None if it was rendered.
+        """
+
+        # Keep lease alive while rendering
+        rendering = Event()
+
+        def send_heartbeats() -> None:
+            """Extend the lease until rendering is finished."""
+            while not rendering.wait(self.lease / 3):
+                try:
+                    self.heartbeat(job['id'])
+                except sqlite3.Error as exc:
+                    log.warning(f'Cannot send heartbeat - {exc}')
+        Thread(target=send_heartbeats, daemon=True).start()
+
+        try:
+            card_class = self.__load_card_type(job['card_type'])
+            card = card_class(
+                **loads(job['parameters'], object_hook=self.__decode)
+            )
+            if not card.valid:
+                return 'Card is invalid'
+
+            job['destination'].parent.mkdir(parents=True, exist_ok=True)
+            card.create()
+            if not job['destination'].exists():
+                card.image_magick.print_command_history()
+                return 'Card was not created'
+        except Exception as exc:
+            log.exception(f'Error rendering "{job["destination"]}" - {exc}')
+            return f'{type(exc).__name__}: {exc}'
+        finally:
+            rendering.set()
+
+        log.debug(f'Created card "{job["destination"].resolve()}"')
+        return None
+
+
+    def work(self, *, exit_when_empty: bool = False) -> int:
+        """
+        Lease and render jobs until stopped.
+
+        Args:
+            exit_when_empty: (Keyword) Whether to return once there are
+                no jobs to lease, rather than waiting for more.
+
+        Returns:
+            Number of jobs rendered.
+        """
+
+        rendered = 0
+        while True:
+            if (job := self.lease_job()) is None:
+                if exit_when_empty:
+                    return rendered
+                sleep(self.POLL_INTERVAL)
+                continue
+
+            error = self.render(job)
+            self.finish(job['id'], error)
+            if error is None:
+                rendered += 1
+            else:
+                log.warning(f'Attempt {job["attempt"]} to render '
+                            f'"{job["destination"]}" failed - {error}')
+
+
+    def wait(self, job_ids: Optional[set[int]] = None) -> tuple[int, int]:
+        """
+        Wait for the given jobs to finish, rendering any leasable jobs
+        while waiting. Finished jobs are removed from the queue.
+
+        Args:
+            job_ids: IDs of the jobs to wait for. None to wait for all
+                jobs submitted by this process.
+
+        Returns:
+            Tuple of the number of jobs which succeeded and failed.
+        """
+
+        with self.__lock:
+            if job_ids is None:
+                job_ids = set(self.__submitted)
+            self.__submitted -= job_ids
+        if not job_ids:
+            return 0, 0
+
+        start, done, failed = monotonic(), 0, 0
+        remaining = set(job_ids)
+        while remaining:
+            # Remove finished jobs
+            with self.__connect() as connection:
+                ids = list(remaining)
+                for index in range(0, len(ids), 500):
+                    batch = ids[index:index+500]
+                    placeholders = ', '.join('?' * len(batch))
+                    finished = connection.execute(
+                        f'SELECT id, status, destination, error FROM jobs '
+                        f'WHERE id IN ({placeholders}) '
+                        f"AND status IN ('done', 'failed')", batch,
+                    ).fetchall()
+                    for job_id, status, destination, error in finished:
+                        remaining.discard(job_id)
+                        if status == 'done':
+                            done += 1
+                        else:
+                            failed += 1
+                            log.error(f'Could not render "{destination}" - '
+                                      f'{error}')
+                    connection.executemany(
+                        'DELETE FROM jobs WHERE id = ?',
+                        [(job_id,) for job_id, *_ in finished],
+                    )
+            if not remaining:
+                break
+
+            # Render a job while waiting, or wait for workers
+            if (job := self.lease_job()) is None:
+                sleep(self.POLL_INTERVAL)
+            else:
+                self.finish(job['id'], self.render(job))
+
+        log.debug(f'Rendered {done} cards ({failed} failed) through the render '
+                  f'queue in {monotonic() - start:.1f}s')
+        return done, failed
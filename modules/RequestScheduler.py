@@ -0,0 +1,361 @@
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from threading import BoundedSemaphore, Lock
+from time import monotonic, sleep
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+from modules import global_objects
+from modules.CircuitBreaker import CircuitBreaker
+from modules.Debug import log
+from modules.HTTPCassette import HTTPCassette
+
+
+class RequestScheduler:
+    """
+    This class describes a scheduler for all requests made to a single
+    host. Requests are admitted with a token bucket - allowing short
+    bursts, but limiting the sustained rate of requests - and a ceiling
+    on the number of concurrent requests. If the host responds with a
+    429 (Too Many Requests) or 503 (Service Unavailable), all requests
+    to that host are paused for the duration the host indicated in its
+    Retry-After header. One scheduler exists per host, and is shared by
+    all interfaces.
+    """
+
+    """Default sustained requests per second, burst, and concurrency"""
+    DEFAULT_RATE = 50.0
+    DEFAULT_BURST = 100
+    DEFAULT_CONCURRENCY = 8
+
+    """Default pause (in seconds) if a throttled response has no Retry-After"""
+    DEFAULT_RETRY_AFTER = 5.0
+
+    """Maximum pause (in seconds) to honor from a Retry-After header"""
+    MAX_RETRY_AFTER = 120.0
+
+    """Status code which indicates the host is throttling requests"""
+    TOO_MANY_REQUESTS = 429
+
+    """Status code which indicates throttling if sent with a Retry-After"""
+    SERVICE_UNAVAILABLE = 503
+
+    """Schedulers for each host"""
+    _schedulers: dict[str, 'RequestScheduler'] = {}
+    __schedulers_lock = Lock()
+
+    __slots__ = (
+        'host', 'rate', 'burst', 'concurrency', '__lock', '__slots',
+        '__tokens', '__last_refill', '__paused_until', 'requests',
+        'throttled', 'total_wait', 'max_wait',
+    )
+
+
+    def __init__(self,
+            host: str,
+            rate: float = DEFAULT_RATE,
+            burst: int = DEFAULT_BURST,
+            concurrency: int = DEFAULT_CONCURRENCY,
+        ) -> None:
+        """
+        Initialize a scheduler for the given host.
+
+        Args:
+            host: Host (for logging) whose requests are being scheduled.
+            rate: Sustained number of requests per second to allow.
+            burst: Number of requests which can be made at once before
+                the rate is applied.
+            concurrency: Maximum number of simultaneous requests.
+        """
+
+        self.host = host
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.concurrency = max(1, int(concurrency))
+
+        self.__lock = Lock()
+        self.__slots = BoundedSemaphore(self.concurrency)
+        self.__tokens = float(self.burst)
+        self.__last_refill = monotonic()
+        self.__paused_until = 0.0
+
+        # Metrics
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return (f'<RequestScheduler for {self.host}, rate={self.rate}/s, '
+                f'burst={self.burst}, concurrency={self.concurrency}>')
+
+
+    def __str__(self) -> str:
+        """Returns a string summary of the metrics of this scheduler."""
+
+        average = self.total_wait / self.requests if self.requests else 0.0
+
+        return (f'{self.host}: {self.requests} requests, {self.throttled} '
+                f'throttled, {average:.2f}s average / {self.max_wait:.2f}s '
+                f'maximum queue wait')
+
+
+    @classmethod
+    def for_url(cls, url: str) -> 'RequestScheduler':
+        """
+        Get the scheduler for the host of the given URL. The scheduler
+        is created (with the limits of the global PreferenceParser) if
+        it does not already exist.
+
+        Args:
+            url: URL whose host to get the scheduler of.
+
+        Returns:
+            The RequestScheduler of the URL's host.
+        """
+
+        host = urlparse(url).netloc.lower()
+        with cls.__schedulers_lock:
+            if (scheduler := cls._schedulers.get(host)) is None:
+                pp = global_objects.pp
+                scheduler = cls._schedulers[host] = cls(
+                    host,
+                    rate=getattr(pp, 'request_rate', cls.DEFAULT_RATE),
+                    burst=getattr(pp, 'request_burst', cls.DEFAULT_BURST),
+                    concurrency=getattr(
+                        pp, 'request_concurrency', cls.DEFAULT_CONCURRENCY
+                    ),
+                )
+
+        return scheduler
+
+
+    @classmethod
+    def log_statistics(cls) -> None:
+        """Log the metrics of all schedulers which have made requests."""
+
+        for scheduler in cls._schedulers.values():
+            if scheduler.requests:
+                log.debug(f'Request statistics - {scheduler}')
+
+
+    def __reserve(self) -> float:
+        """
+        Reserve a token from the bucket (refilling it first).
+
+        Returns:
+            How many seconds to wait before the reserved token may be
+            used. 0 if it can be used immediately.
+        """
+
+        with self.__lock:
+            now = monotonic()
+            self.__tokens = min(
+                self.burst,
+                self.__tokens + (now - self.__last_refill) * self.rate,
+            )
+            self.__last_refill = now
+
+            # Tokens may go negative - the debt is repaid by waiting
+            self.__tokens -= 1
+            return 0.0 if self.__tokens >= 0 else -self.__tokens / self.rate
+
+
+    def acquire(self) -> None:
+        """
+        Wait until a request to this host is admitted. Every call must
+        be followed by a call to `release()`.
+        """
+
+        start = monotonic()
+        self.__slots.acquire() # pylint: disable=consider-using-with
+
+        # Wait for a token, then for any pause by the host to elapse
+        sleep(self.__reserve())
+        while (pause := self.__paused_until - monotonic()) > 0:
+            sleep(pause)
+
+        waited = monotonic() - start
+        with self.__lock:
+            self.requests += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+
+    def release(self) -> None:
+        """Release the concurrency slot of an admitted request."""
+
+        self.__slots.release()
+
+
+    @staticmethod
+    def get_retry_after(response: Response) -> Optional[float]:
+        """
+        Get the number of seconds the given response requested clients
+        wait before retrying.
+
+        Args:
+            response: Response to parse the Retry-After header of.
+
+        Returns:
+            Number of seconds to wait, None if the header is missing or
+            cannot be parsed.
+        """
+
+        if (value := response.headers.get('Retry-After')) is None:
+            return None
+
+        # Header is either a number of seconds, or an HTTP date
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            delay = parsedate_to_datetime(value) - datetime.now(timezone.utc)
+            return max(0.0, delay.total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+
+    def is_throttled(self, response: Response) -> bool:
+        """
+        Determine whether the given response indicates the host is
+        throttling requests.
+
+        Args:
+            response: Response to evaluate.
+
+        Returns:
+            True if the response is a 429, or is a 503 with a
+            Retry-After header. False otherwise.
+        """
+
+        return (
+            response.status_code == self.TOO_MANY_REQUESTS
+            or (response.status_code == self.SERVICE_UNAVAILABLE
+                and 'Retry-After' in response.headers)
+        )
+
+
+    def pause(self, response: Response) -> float:
+        """
+        Pause all requests to this host as indicated by the given
+        throttled response.
+
+        Args:
+            response: The throttled Response.
+
+        Returns:
+            How many seconds requests are paused for.
+        """
+
+        if (delay := self.get_retry_after(response)) is None:
+            delay = self.DEFAULT_RETRY_AFTER
+        delay = min(delay, self.MAX_RETRY_AFTER)
+
+        with self.__lock:
+            self.throttled += 1
+            self.__paused_until = max(self.__paused_until, monotonic() + delay)
+
+        log.debug(f'{self.host} returned {response.status_code} - pausing '
+                  f'requests for {delay:.1f}s')
+        return delay
+
+
+class ScheduledHTTPAdapter(HTTPAdapter):
+    """
+    This class describes an HTTPAdapter which sends every request
+    through the RequestScheduler of its host, and transparently retries
+    requests which were throttled. If given a CircuitBreaker, requests
+    are rejected while that circuit is open, and connection errors and
+    server errors are recorded as failures.
+    """
+
+    """How many times to retry a throttled request"""
+    MAX_THROTTLE_RETRIES = 3
+
+
+    def __init__(self,
+            *args: Any,
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            **kwargs: Any,
+        ) -> None:
+        """
+        Initialize this adapter.
+
+        Args:
+            args: Positional arguments to pass to HTTPAdapter.
+            circuit_breaker: (Keyword) CircuitBreaker of the interface
+                using this adapter.
+            kwargs: Keyword arguments to pass to HTTPAdapter.
+        """
+
+        super().__init__(*args, **kwargs)
+        self.circuit_breaker = circuit_breaker
+
+
+    def send(self, request: PreparedRequest, *args, **kwargs) -> Response:
+        """
+        Send the given request once admitted by its host's scheduler.
+        Throttled requests are retried after the indicated delay, unless
+        the request body is a stream (which cannot be re-sent).
+
+        Raises:
+            CircuitOpenError: The circuit of this adapter is open.
+        """
+
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+
+        try:
+            response = self.__send(request, *args, **kwargs)
+        except Exception:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure()
+            raise
+
+        if self.circuit_breaker is not None:
+            if response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
+        return response
+
+
+    def __send(self, request: PreparedRequest, *args, **kwargs) -> Response:
+        """Send the given request, retrying if throttled."""
+
+        scheduler = RequestScheduler.for_url(request.url)
+        can_retry = request.body is None or isinstance(request.body,(bytes,str))
+
+        for attempt in range(self.MAX_THROTTLE_RETRIES + 1):
+            scheduler.acquire()
+            try:
+                if (cassette := HTTPCassette.active) is None:
+                    response = super().send(request, *args, **kwargs)
+                elif cassette.mode == 'replay':
+                    response = cassette.replay(request)
+                else:
+                    response = super().send(request, *args, **kwargs)
+                    cassette.record(request, response)
+            finally:
+                scheduler.release()
+
+            # Not throttled, return response
+            if not scheduler.is_throttled(response):
+                return response
+
+            # Throttled, pause host; retry if possible
+            scheduler.pause(response)
+            if not can_retry or attempt == self.MAX_THROTTLE_RETRIES:
+                break
+            response.close()
+
+        return response
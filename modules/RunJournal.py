@@ -0,0 +1,215 @@
+from datetime import datetime
+from hashlib import sha256
+from json import dumps, loads
+from threading import Lock
+from typing import TYPE_CHECKING, Optional, TextIO, Union
+
+from modules.Debug import log
+from modules import global_objects
+from modules.ShowArchive import ShowArchive
+
+if TYPE_CHECKING:
+    from modules.Show import Show
+
+
+class RunJournal:
+    """
+    This class describes a checkpoint journal of a single run of the
+    Manager. Whenever a show (or archive) completes a stage of the run,
+    that is appended to the journal. If the run is interrupted - e.g. it
+    crashes, or the container is restarted - then the next run can
+    resume it, skipping the stages (and shows) which were completed.
+
+    Completed stages are only skipped if the YAML of the show and the
+    preference file are unchanged since they were completed. The journal
+    is deleted when a run finishes cleanly.
+
+    The journal is an append-only file of JSON lines, so recording a
+    stage is a single small write regardless of the size of the run, and
+    a write cut short by a crash only loses that one line.
+    """
+
+    """File of the journal within the database directory"""
+    JOURNAL_FILE = 'run_journal.jsonl'
+
+    """Stage recorded once a show has completed every stage"""
+    COMPLETE = 'Complete'
+
+
+    def __init__(self, resume: bool = False) -> None:
+        """
+        Initialize this journal, starting a new run or resuming the last
+        interrupted run.
+
+        Args:
+            resume: Whether to resume the last (interrupted) run. If
+                False, any existing journal is discarded.
+        """
+
+        self.file = global_objects.pp.database_directory / self.JOURNAL_FILE
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        self.__lock = Lock()
+
+        # Hash of the preference file, which affects every show
+        try:
+            preferences = global_objects.pp.file.read_bytes()
+        except (AttributeError, OSError):
+            preferences = b''
+        self.__preference_hash = sha256(preferences).hexdigest()
+
+        # Completed stages (and the fingerprint they were completed with)
+        self.__completed: dict[str, tuple[str, set[str]]] = {}
+        if resume:
+            self.__read()
+
+        # Start a new journal if not resuming an existing one
+        self.__journal: Optional[TextIO] = None
+        if resume and self.file.exists():
+            self.__journal = self.file.open('a', encoding='utf-8')
+        else:
+            self.__journal = self.file.open('w', encoding='utf-8')
+            self.__write({'started': datetime.now().timestamp()})
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return f'<RunJournal of {len(self.__completed)} shows>'
+
+
+    def __read(self) -> None:
+        """Read the completed stages of the existing journal."""
+
+        try:
+            lines = self.file.read_text(encoding='utf-8').splitlines()
+        except FileNotFoundError:
+            log.info(f'No interrupted run to resume')
+            return None
+        except OSError:
+            log.exception(f'Cannot read run journal "{self.file.resolve()}"')
+            return None
+
+        started = None
+        for line in lines:
+            # The last line may have been cut short by a crash
+            try:
+                entry = loads(line)
+            except ValueError:
+                continue
+
+            if 'started' in entry:
+                started = datetime.fromtimestamp(entry['started'])
+            elif (entry.get('key') is not None
+                  and entry.get('stage') is not None):
+                fingerprint, stages = self.__completed.get(
+                    entry['key'], (entry.get('fingerprint'), set())
+                )
+                # Stages completed with an older fingerprint are outdated
+                if fingerprint != entry.get('fingerprint'):
+                    fingerprint, stages = entry.get('fingerprint'), set()
+                stages.add(entry['stage'])
+                self.__completed[entry['key']] = (fingerprint, stages)
+
+        log.info(f'Resuming run started {started or "at an unknown time"} - '
+                 f'{len(self.__completed)} shows have completed stages')
+        return None
+
+
+    def __write(self, entry: dict) -> None:
+        """Append the given entry to the journal."""
+
+        if self.__journal is None:
+            return None
+
+        try:
+            self.__journal.write(dumps(entry) + '\n')
+            self.__journal.flush()
+        except OSError:
+            log.exception(f'Cannot write to run journal - disabling journal')
+            self.close()
+
+        return None
+
+
+    def __get_identity(self,
+            show: Union['Show', ShowArchive],
+        ) -> tuple[str, str]:
+        """
+        Get the key and fingerprint of the given Show or ShowArchive.
+        The fingerprint changes whenever the show's YAML or the
+        preference file changes.
+        """
+
+        if isinstance(show, ShowArchive):
+            key = f'archive|{show.series_info.full_name}'
+            yaml = show.shows[0]._base_yaml if show.shows else None
+        else:
+            key = f'{show.series_info.full_name}|{show.media_directory}'
+            yaml = show._base_yaml
+
+        fingerprint = sha256(dumps(
+            [self.__preference_hash, yaml], sort_keys=True, default=str,
+        ).encode()).hexdigest()
+
+        return key, fingerprint
+
+
+    def is_complete(self,
+            show: Union['Show', ShowArchive],
+            stage: str,
+        ) -> bool:
+        """
+        Determine whether the given show completed the given stage in
+        the resumed run (and is unchanged since).
+
+        Args:
+            show: Show or ShowArchive being evaluated.
+            stage: Name of the stage.
+
+        Returns:
+            True if the stage can be skipped, False otherwise.
+        """
+
+        key, fingerprint = self.__get_identity(show)
+        with self.__lock:
+            if (completed := self.__completed.get(key)) is None:
+                return False
+
+        return completed[0] == fingerprint and stage in completed[1]
+
+
+    def complete(self, show: Union['Show', ShowArchive], stage: str) -> None:
+        """
+        Record that the given show completed the given stage.
+
+        Args:
+            show: Show or ShowArchive which completed the stage.
+            stage: Name of the completed stage.
+        """
+
+        key, fingerprint = self.__get_identity(show)
+        with self.__lock:
+            completed = self.__completed.get(key)
+            if completed is None or completed[0] != fingerprint:
+                completed = (fingerprint, set())
+                self.__completed[key] = completed
+            completed[1].add(stage)
+            self.__write(
+                {'key': key, 'fingerprint': fingerprint, 'stage': stage}
+            )
+
+
+    def close(self) -> None:
+        """Stop writing to this journal, keeping it so it can be resumed."""
+
+        if self.__journal is not None:
+            self.__journal.close()
+            self.__journal = None
+
+
+    def clear(self) -> None:
+        """Delete this journal, as its run finished cleanly."""
+
+        self.close()
+        self.file.unlink(missing_ok=True)
+        self.__completed = {}
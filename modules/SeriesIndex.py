@@ -0,0 +1,104 @@
+from pathlib import Path
+from typing import Iterable, Optional
+
+from tinydb import where
+
+from modules.Debug import log
+from modules.PersistentDatabase import PersistentDatabase
+
+
+class SeriesIndex:
+    """
+    This class describes an index of where each series is defined. The
+    index maps a series' library and full match name to the series YAML
+    file (and the entry within that file) which defines it, so that a
+    single series can be found without reading every series file.
+
+    Each file is indexed along with its modification time when it was
+    read; lookups into files which have since been modified are treated
+    as missing, so an outdated index is never used.
+    """
+
+    """Database of indexed series"""
+    INDEX_DATABASE = 'series_index.json'
+
+
+    def __init__(self) -> None:
+        """Initialize this object, reading the index database."""
+
+        self.index = PersistentDatabase(self.INDEX_DATABASE)
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return f'<SeriesIndex with {len(self.index)} series>'
+
+
+    @staticmethod
+    def __get_mtime(file: Path) -> Optional[float]:
+        """Get the modification time of the given file, None if DNE."""
+
+        try:
+            return file.stat().st_mtime
+        except OSError:
+            return None
+
+
+    def index_file(self,
+            file: Path,
+            entries: Iterable[tuple[str, str, str]],
+        ) -> None:
+        """
+        Index the series defined in the given file, replacing any
+        existing index of that file.
+
+        Args:
+            file: Series YAML file which was read.
+            entries: Library name, full match name, and series entry
+                name of each series defined in the file.
+        """
+
+        file = str(file.resolve())
+        mtime = self.__get_mtime(Path(file))
+
+        self.index.remove(where('file') == file)
+        self.index.insert_multiple([
+            {'library': library_name, 'full_match_name': full_match_name,
+             'file': file, 'entry': entry, 'mtime': mtime}
+            for library_name, full_match_name, entry in entries
+        ])
+
+
+    def get(self,
+            library_name: Optional[str],
+            full_match_name: str,
+        ) -> Optional[list[tuple[Path, str]]]:
+        """
+        Get where the given series is defined.
+
+        Args:
+            library_name: Name of the library of the series.
+            full_match_name: Full match name of the series.
+
+        Returns:
+            List of series YAML files and entry names which define the
+            given series. None if the series is not indexed, or any of
+            the files it is defined within have since been modified.
+        """
+
+        documents = self.index.search(
+            (where('library') == library_name)
+            & (where('full_match_name') == full_match_name)
+        )
+        if not documents:
+            return None
+
+        # If any file has been modified, the index of this series is outdated
+        for document in documents:
+            if self.__get_mtime(Path(document['file'])) != document['mtime']:
+                log.debug(f'Index of "{document["file"]}" is outdated')
+                return None
+
+        return [(Path(document['file']), document['entry'])
+                for document in documents]
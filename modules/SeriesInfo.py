@@ -1,11 +1,12 @@
 from re import compile as re_compile, match, sub as re_sub, IGNORECASE
-from typing import Optional, Union
-
-from plexapi.video import Show as PlexShow
+from typing import TYPE_CHECKING, Optional, Union
 
 from modules.CleanPath import CleanPath
 from modules.DatabaseInfoContainer import DatabaseInfoContainer
 
+if TYPE_CHECKING:
+    from plexapi.video import Show as PlexShow
+
 
 class SeriesInfo(DatabaseInfoContainer):
     """
@@ -116,7 +117,7 @@ class SeriesInfo(DatabaseInfoContainer):
 
 
     @staticmethod
-    def from_plex_show(plex_show: PlexShow) -> 'SeriesInfo':
+    def from_plex_show(plex_show: 'PlexShow') -> 'SeriesInfo':
         """
         Create a SeriesInfo object from a plexapi Show object.
 
@@ -0,0 +1,283 @@
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from os import cpu_count
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from typing import Any, Iterable, Optional
+
+from yaml import load
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from modules.Debug import log
+from modules.YamlReader import YamlReader
+
+
+CachedEntry = tuple[dict[str, Any], list[dict[str, Any]]]
+
+
+class SeriesYamlCache:
+    """
+    This class describes a cache of parsed series YAML files. Parsing
+    (and applying the templates of) large series files is slow, so the
+    parsed YAML of each file - and each of its finalized series entries
+    - are kept in memory and in a binary cache file, and are only
+    re-parsed once the file is modified.
+
+    Each file is cached along with its modification time, its size, and
+    a hash of the context its entries were finalized in (e.g. the
+    executing version); if any of these differ, the cache of that file
+    is discarded.
+
+    YAML is stored pickled, so that every read returns an independent
+    copy which can be freely modified. Files which cannot be parsed are
+    never cached.
+    """
+
+    """Directory of the cache files within the database directory"""
+    CACHE_DIRECTORY = 'series_yaml_cache'
+
+    """Maximum number of processes to parse files with"""
+    MAX_PROCESSES = max(1, min(4, cpu_count() or 1))
+
+
+    def __init__(self, directory: Path, context: Iterable[Any] = ()) -> None:
+        """
+        Initialize this cache.
+
+        Args:
+            directory: Database directory to store the cache files in.
+            context: Values which affect finalized entries, and so
+                invalidate the cache when changed.
+        """
+
+        self.directory = directory / self.CACHE_DIRECTORY
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.context = sha256(repr(tuple(context)).encode()).hexdigest()
+
+        # Cached records of each file, and which have unsaved changes
+        self.__records: dict[Path, dict[str, Any]] = {}
+        self.__modified: set[Path] = set()
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return f'<SeriesYamlCache of {len(self.__records)} files>'
+
+
+    def __get_key(self, file: Path) -> Optional[tuple[int, int, str]]:
+        """Get the cache key of the given file, None if it DNE."""
+
+        try:
+            stat = file.stat()
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size, self.context
+
+
+    def __get_cache_file(self, file: Path) -> Path:
+        """Get the cache file of the given (resolved) series file."""
+
+        name = sha256(str(file).encode()).hexdigest()[:16]
+
+        return self.directory / f'{file.stem}.{name}.pickle'
+
+
+    def __get_record(self, file: Path) -> Optional[dict[str, Any]]:
+        """
+        Get the cached record of the given file if it is up to date,
+        loading it from its cache file if not already loaded.
+
+        Args:
+            file: Resolved series file whose record to get.
+
+        Returns:
+            Cached record. None if the file has not been cached, or has
+            been modified since.
+        """
+
+        if (key := self.__get_key(file)) is None:
+            return None
+
+        # Load from the cache file if not cached in memory (or outdated)
+        record = self.__records.get(file)
+        if record is None or record['key'] != key:
+            try:
+                record = loads(self.__get_cache_file(file).read_bytes())
+            except FileNotFoundError:
+                return None
+            except Exception: # pylint: disable=broad-except
+                log.debug(f'Cannot load YAML cache of "{file}" - ignoring')
+                return None
+
+        if record.get('key') != key:
+            return None
+
+        self.__records[file] = record
+        return record
+
+
+    @staticmethod
+    def _parse_file(file: Path) -> tuple[bool, Any]:
+        """
+        Parse the given file. Unlike YamlReader._read_file, errors are
+        not logged - so this can be run in another process.
+
+        Args:
+            file: Series YAML file to parse.
+
+        Returns:
+            Whether the file was parsed, and its YAML.
+        """
+
+        try:
+            with file.open('r', encoding='utf-8') as file_handle:
+                return True, load(file_handle, Loader=SafeLoader)
+        except Exception: # pylint: disable=broad-except
+            return False, None
+
+
+    def __store(self, file: Path, key: tuple, file_yaml: Any) -> None:
+        """Store the parsed YAML of the given file as a new record."""
+
+        self.__records[file] = {
+            'key': key,
+            'yaml': dumps(file_yaml, protocol=HIGHEST_PROTOCOL),
+            'entries': {},
+        }
+        self.__modified.add(file)
+
+
+    def prefetch(self, files: Iterable[Path]) -> None:
+        """
+        Parse all the given files which are not cached (or outdated),
+        in parallel across processes.
+
+        Args:
+            files: Series files to parse.
+        """
+
+        # Determine which files must be parsed
+        stale = {}
+        for file in {file.resolve() for file in files}:
+            if ((key := self.__get_key(file)) is not None
+                and self.__get_record(file) is None):
+                stale[file] = key
+
+        # Parsing a single file is not worth starting processes
+        if len(stale) < 2:
+            return None
+
+        log.debug(f'Parsing {len(stale)} series files')
+        try:
+            with ProcessPoolExecutor(min(self.MAX_PROCESSES, len(stale))) \
+                    as executor:
+                parsed = executor.map(self._parse_file, stale)
+                for (file, key), (success, file_yaml) in zip(stale.items(),
+                                                             parsed):
+                    # Files which failed are read (and logged) when read
+                    if success:
+                        self.__store(file, key, file_yaml)
+        except Exception: # pylint: disable=broad-except
+            log.exception(f'Cannot parse series files in parallel')
+
+        return None
+
+
+    def read(self, file: Path) -> Optional[dict]:
+        """
+        Read the YAML of the given series file, parsing it only if not
+        cached or modified since.
+
+        Args:
+            file: Series YAML file to read.
+
+        Returns:
+            Copy of the YAML of the file, which can be freely modified.
+        """
+
+        file = file.resolve()
+        if (key := self.__get_key(file)) is None:
+            return YamlReader._read_file(file, critical=False)
+
+        if (record := self.__get_record(file)) is None:
+            # Read with the YamlReader if not parsed, so the error is logged
+            success, file_yaml = self._parse_file(file)
+            if not success:
+                return YamlReader._read_file(file, critical=False)
+
+            self.__store(file, key, file_yaml)
+            return file_yaml
+
+        return loads(record['yaml'])
+
+
+    def get_entry(self, file: Path, name: str) -> Optional[CachedEntry]:
+        """
+        Get the cached finalized YAML of the given series entry.
+
+        Args:
+            file: Series YAML file of the entry.
+            name: Name of the series entry.
+
+        Returns:
+            Copy of the finalized YAML of the entry, and of each of its
+            archive variations. None if the entry is not cached.
+        """
+
+        if (record := self.__get_record(file.resolve())) is None:
+            return None
+
+        if (entry := record['entries'].get(name)) is None:
+            return None
+
+        return loads(entry)
+
+
+    def set_entry(self,
+            file: Path,
+            name: str,
+            show_yaml: dict[str, Any],
+            variations: list[dict[str, Any]],
+        ) -> None:
+        """
+        Cache the finalized YAML of the given series entry. This is
+        ignored if the file itself is not cached.
+
+        Args:
+            file: Series YAML file of the entry.
+            name: Name of the series entry.
+            show_yaml: Finalized YAML of the entry.
+            variations: Finalized YAML of each archive variation.
+        """
+
+        file = file.resolve()
+        if (record := self.__get_record(file)) is not None:
+            record['entries'][name] = dumps(
+                (show_yaml, variations), protocol=HIGHEST_PROTOCOL
+            )
+            self.__modified.add(file)
+
+
+    def save(self) -> None:
+        """Write the records of all modified files to their cache files."""
+
+        for file in self.__modified:
+            if (record := self.__records.get(file)) is None:
+                continue
+
+            cache_file = self.__get_cache_file(file)
+            temporary_file = cache_file.with_suffix('.tmp')
+            try:
+                temporary_file.write_bytes(
+                    dumps(record, protocol=HIGHEST_PROTOCOL)
+                )
+                temporary_file.replace(cache_file)
+            except OSError:
+                log.exception(f'Cannot write YAML cache of "{file}"')
+
+        self.__modified = set()
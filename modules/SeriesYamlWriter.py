@@ -1,7 +1,7 @@
 # pylint: disable=dangerous-default-value
 from pathlib import Path
 from sys import exit as sys_exit
-from typing import Iterable, Literal, Optional
+from typing import TYPE_CHECKING, Iterable, Literal, Optional
 
 from ruamel.yaml import YAML, round_trip_dump, comments
 from ruamel.yaml.constructor import DuplicateKeyError
@@ -9,12 +9,14 @@ from yaml import add_representer, dump
 
 from modules.CleanPath import CleanPath
 from modules.Debug import log
-from modules.EmbyInterface import EmbyInterface
-from modules.JellyfinInterface import JellyfinInterface
-from modules.PlexInterface import PlexInterface
-from modules.SonarrInterface import SonarrInterface
 from modules.SyncInterface import SyncInterface
 
+if TYPE_CHECKING:
+    from modules.EmbyInterface import EmbyInterface
+    from modules.JellyfinInterface import JellyfinInterface
+    from modules.PlexInterface import PlexInterface
+    from modules.SonarrInterface import SonarrInterface
+
 SeriesYaml = dict[str, dict[str, str]]
 SyncMode = Literal['append', 'match']
 
@@ -369,7 +371,7 @@ class SeriesYamlWriter:
 
 
     def __get_yaml_from_sonarr(self,
-            sonarr_interface: SonarrInterface,
+            sonarr_interface: 'SonarrInterface',
             plex_libraries: dict[str, str],
             required_tags: list[str],
             monitored_only: bool,
@@ -564,7 +566,7 @@ class SeriesYamlWriter:
 
 
     def update_from_sonarr(self,
-            sonarr_interface: SonarrInterface,
+            sonarr_interface: 'SonarrInterface',
             plex_libraries: dict[str, str] = {},
             required_tags: list[str] = [],
             monitored_only: bool = False,
@@ -603,7 +605,7 @@ class SeriesYamlWriter:
 
 
     def update_from_plex(self,
-            plex_interface: PlexInterface,
+            plex_interface: 'PlexInterface',
             filter_libraries: Iterable[str] = [],
             required_tags: list[str] = [],
             exclusions: list[dict[str, str]] = [],
@@ -641,7 +643,7 @@ class SeriesYamlWriter:
 
 
     def update_from_emby(self,
-            emby_interface: EmbyInterface,
+            emby_interface: 'EmbyInterface',
             filter_libraries: list[str] = [],
             required_tags: list[str] = [],
             exclusions: list[dict[str, str]] = [],
@@ -675,7 +677,7 @@ class SeriesYamlWriter:
 
 
     def update_from_jellyfin(self,
-            jellyfin_interface: JellyfinInterface,
+            jellyfin_interface: 'JellyfinInterface',
             filter_libraries: list[str] = [],
             required_tags: list[str] = [],
             exclusions: list[dict[str, str]] = [],
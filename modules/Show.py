@@ -7,27 +7,28 @@ from tqdm import tqdm
 from modules.CleanPath import CleanPath
 from modules.DataFileInterface import DataFileInterface
 from modules.Debug import log, TQDM_KWARGS
-from modules.EmbyInterface import EmbyInterface
 from modules.Episode import Episode, MultiEpisode
 from modules.EpisodeInfo import EpisodeInfo
 from modules.EpisodeMap import EpisodeMap
 from modules.Font import Font
 from modules import global_objects
-from modules.JellyfinInterface import JellyfinInterface
-from modules.PlexInterface import PlexInterface
 from modules.Profile import Profile
 from modules.SeasonPosterSet import SeasonPosterSet
 from modules.SeriesInfo import SeriesInfo
-from modules.SonarrInterface import SonarrInterface
 from modules.StyleSet import StyleSet
 from modules.TitleCard import TitleCard
 from modules.Title import Title
-from modules.TMDbInterface import TMDbInterface
 from modules.WebInterface import WebInterface
 from modules.YamlReader import YamlReader
 
 if TYPE_CHECKING:
+    from modules.EmbyInterface import EmbyInterface
+    from modules.JellyfinInterface import JellyfinInterface
+    from modules.PlexInterface import PlexInterface
     from modules.PreferenceParser import PreferenceParser
+    from modules.RenderQueue import RenderQueue
+    from modules.SonarrInterface import SonarrInterface
+    from modules.TMDbInterface import TMDbInterface
 
 
 MediaServer = Literal['emby', 'jellyfin', 'plex']
@@ -57,7 +58,8 @@ class Show(YamlReader):
         'logo', 'backdrop', 'file_interface', 'profile', 'season_poster_set',
         'episodes', 'emby_interface', 'jellyfin_interface', 'plex_interface',
         'sonarr_interface', 'tmdb_interface', '__is_archive', 'media_server',
-        'image_source_priority', '_auto_hide_seasons',
+        'image_source_priority', '_auto_hide_seasons', 'render_queue',
+        'translated_keys',
     )
 
     def __init__(self,
@@ -194,9 +196,13 @@ class Show(YamlReader):
         self.plex_interface = None
         self.sonarr_interface = None
         self.tmdb_interface = None
+        self.render_queue = None
         self._auto_hide_seasons = False
         self.__is_archive = False
 
+        # Keys of Episodes whose cards were deleted for new translations
+        self.translated_keys: set[str] = set()
+
         return None
 
 
@@ -369,11 +375,12 @@ class Show(YamlReader):
 
 
     def assign_interfaces(self,
-            emby_interface: Optional[EmbyInterface] = None,
-            jellyfin_interface: Optional[JellyfinInterface] = None,
-            plex_interface: Optional[PlexInterface] = None,
-            sonarr_interfaces: list[SonarrInterface] = [],
-            tmdb_interface: Optional[TMDbInterface] = None,
+            emby_interface: Optional['EmbyInterface'] = None,
+            jellyfin_interface: Optional['JellyfinInterface'] = None,
+            plex_interface: Optional['PlexInterface'] = None,
+            sonarr_interfaces: list['SonarrInterface'] = [],
+            tmdb_interface: Optional['TMDbInterface'] = None,
+            render_queue: Optional['RenderQueue'] = None,
         ) -> None:
         """
         Assign the given interfaces to attributes of this object for
@@ -391,6 +398,7 @@ class Show(YamlReader):
                 series will be stored.
             tmdb_interface: Optional TMDbInterface to store if required
                 by this show.
+            render_queue: Optional RenderQueue to render cards with.
         """
 
         # If Emby is required, and an interface was provided, assign
@@ -435,6 +443,9 @@ class Show(YamlReader):
         if self.tmdb_sync and tmdb_interface is not None:
             self.tmdb_interface = tmdb_interface
 
+        # Render cards with the queue, if provided
+        self.render_queue = render_queue
+
 
     def set_series_ids(self) -> None:
         """Set the series ID's for this show."""
@@ -569,6 +580,38 @@ class Show(YamlReader):
             self.hide_seasons = True
 
 
+    def _share_episodes(self, base_show: 'Show') -> None:
+        """
+        Recreate this archive's Episode objects from those of the given
+        base Show, rather than reading (and updating) the source file
+        again. The EpisodeInfo - i.e. the titles and ID's - of each
+        Episode is shared with the base Show; only the destinations and
+        styles of the Episodes are unique to this archive.
+
+        Args:
+            base_show: Show whose Episodes to share.
+        """
+
+        # Reset episodes dictionary
+        self.episodes = {}
+
+        # Go through each Episode of the base show, MultiEpisodes are re-found
+        for key, episode in base_show.episodes.items():
+            if isinstance(episode, MultiEpisode):
+                continue
+
+            self.episodes[key] = Episode(
+                base_source=self.source_directory,
+                destination=self.__get_destination(episode.episode_info),
+                card_class=self.card_class,
+                given_keys=episode.given_keys,
+                episode_info=episode.episode_info,
+                **episode.extra_characteristics,
+            )
+
+        self.find_multipart_episodes()
+
+
     def add_new_episodes(self) -> None:
         """
         Query the provided interfaces, checking for any new episodes
@@ -695,17 +738,25 @@ class Show(YamlReader):
     def add_translations(self) -> None:
         """
         Add translated episode titles to the Episodes of this series.
-        This  show's source file is re-read if any translations are
-        added.
+        Translations are looked up season by season, collected, and
+        then written to this show's source file at once. This show's
+        source file is re-read if any translations are added, and the
+        keys of the modified episodes are recorded so that any archives
+        can delete their cards as well.
         """
 
         # If no translations were specified, or TMDb syncing isn't enabled, skip
         if not self.tmdb_interface or not self.title_languages:
             return None
 
-        # Go through every episode and look for translations
-        modified = False
-        for episode in (pbar := tqdm(self.episodes.values(), **TQDM_KWARGS)):
+        # Go through every episode (in season order) and look for translations
+        translations: dict[str, dict[str, str]] = {}
+        episodes = sorted(
+            self.episodes.items(),
+            key=lambda item: (item[1].episode_info.season_number,
+                              item[1].episode_info.episode_number),
+        )
+        for key, episode in (pbar := tqdm(episodes, **TQDM_KWARGS)):
             # Get each translation for this series
             for translation in self.title_languages:
                 # If the key already exists, skip this episode
@@ -727,21 +778,35 @@ class Show(YamlReader):
                     or language_title == episode.episode_info.title.full_title):
                     continue
 
-                # Modify data file entry with new title
-                modified = True
-                self.file_interface.add_data_to_entry(
-                    episode.episode_info,
-                    **{translation['key']: language_title},
-                )
+                # Store new title to add to the data file
+                new_titles = translations.setdefault(key, {})
+                new_titles[translation['key']] = language_title
 
                 # Adding translated title, log it
                 log.debug(f'Added "{language_title}" to "{translation["key"]}" '
                           f'for {self} {episode}')
 
-                # Delete old card
-                episode.delete_card(reason='adding translation')
+        # If no translations were found, exit
+        if not translations:
+            return None
+
+        # Modify data file entries with all new titles at once
+        modified = {
+            (info.season_number, info.episode_number) for info in
+            self.file_interface.add_data_to_entries(
+                (self.episodes[key].episode_info, data)
+                for key, data in translations.items()
+            )
+        }
+
+        # Delete old cards of the modified episodes
+        for key in translations:
+            info = self.episodes[key].episode_info
+            if (info.season_number, info.episode_number) in modified:
+                self.episodes[key].delete_card(reason='adding translation')
+                self.translated_keys.add(key)
 
-        # If any translations were added, re-read source
+        # Translations were added, re-read source
         if modified:
             self.read_source()
 
@@ -762,20 +827,19 @@ class Show(YamlReader):
         if (url := self.tmdb_interface.get_series_logo(self.series_info)):
             # SVG logos need to be converted first
             if url.endswith('.svg'):
-                # Download .svgs to temporary location pre-conversion
-                success = self.tmdb_interface.download_image(
-                    url, self.card_class.TEMPORARY_SVG_FILE
-                )
+                # Download .svgs to a (unique) temporary location pre-conversion
+                svg_file = self.card_class.get_temporary_file('temp_logo.svg')
+                success = self.tmdb_interface.download_image(url, svg_file)
 
                 # If failed to download, skip
                 if not success:
                     log.error(f'Error downloading .svg logo for {self}')
+                    svg_file.unlink(missing_ok=True)
                     return None
 
                 # Convert temporary SVG to PNG at logo filepath
-                logo = self.card_class.convert_svg_to_png(
-                    self.card_class.TEMPORARY_SVG_FILE, self.logo,
-                )
+                logo = self.card_class.convert_svg_to_png(svg_file, self.logo)
+                svg_file.unlink(missing_ok=True)
 
                 if logo is None:
                     log.warning(f'SVG to PNG conversion failed for {self}')
@@ -893,6 +957,18 @@ class Show(YamlReader):
             if url and self.tmdb_interface.download_image(url, self.backdrop):
                 log.debug(f'Downloaded backdrop for {self} from tmdb')
 
+        # Get the episodes which need a (downloadable) source that DNE
+        episodes = [
+            episode for episode in self.episodes.values()
+            if (select_only is None or episode is select_only)
+            and episode.downloadable_source and not episode.source.exists()
+        ]
+
+        # Skip querying interfaces if no sources are needed - e.g. archives
+        # whose sources were all downloaded by their base show
+        if not episodes:
+            return None
+
         # Whether to always check each interface
         always_check_emby = (
             bool(self.emby_interface)
@@ -914,15 +990,7 @@ class Show(YamlReader):
                                                self.series_info))
 
         # For each episode, query interfaces (in priority order) for source
-        for episode in (pbar := tqdm(self.episodes.values(), **TQDM_KWARGS)):
-            # If only selecting a specific episode, skip others
-            if select_only is not None and episode is not select_only:
-                continue
-
-            # Skip this episode if not downloadable, or source exists
-            if not episode.downloadable_source or episode.source.exists():
-                continue
-
+        for episode in (pbar := tqdm(episodes, **TQDM_KWARGS)):
             # Update progress bar
             pbar.set_description(f'Selecting {episode}')
 
@@ -1048,8 +1116,15 @@ class Show(YamlReader):
             self.episodes[f'0{mp.season_number}-{mp.episode_start}'] = mp
 
 
-    def create_missing_title_cards(self) -> None:
-        """Create any missing title cards for each episode."""
+    def create_missing_title_cards(self, wait: bool = True) -> None:
+        """
+        Create any missing title cards for each episode. If this show
+        has a RenderQueue, the cards are submitted to that queue.
+
+        Args:
+            wait: Whether to wait for the cards submitted to the render
+                queue to be rendered.
+        """
 
         # If the media directory is unspecified, exit
         if self.media_directory is None:
@@ -1062,6 +1137,7 @@ class Show(YamlReader):
                 episode.delete_card(reason='new config')
 
         # Go through each episode for this show
+        jobs = set()
         for episode in (pbar := tqdm(self.episodes.values(), **TQDM_KWARGS)):
             # Skip episodes without a destination or that already exist
             if not episode.destination or episode.destination.exists():
@@ -1092,8 +1168,17 @@ class Show(YamlReader):
                 log.warning(f'Invalid font for {episode} of {self}')
                 continue
 
-            # Source exists, create the title card
-            title_card.create()
+            # Source exists, create the title card (or submit to queue)
+            if self.render_queue is None:
+                title_card.create()
+            elif (job_id := title_card.submit(self.render_queue)) is None:
+                title_card.create()
+            else:
+                jobs.add(job_id)
+
+        # Wait for all submitted cards to be rendered
+        if jobs and wait:
+            self.render_queue.wait(jobs)
 
         # Update record keeeper
         global_objects.show_record_keeper.add_config(self)
@@ -42,7 +42,10 @@ class ShowArchive:
         'hidden-generic':  'No Season Titles, Generic Font',
     }
 
-    __slots__ = ('series_info', 'shows', 'summaries')
+    __slots__ = (
+        'series_info', 'base_show', 'shows', 'summaries', '__shared',
+        '__translated',
+    )
 
 
     def __init__(self,
@@ -61,6 +64,12 @@ class ShowArchive:
 
         # If the base show for this object has archiving disabled, exit
         self.series_info = base_show.series_info
+        self.base_show = base_show
+
+        # Episodes of the base show (and their count) last shared, and keys of
+        # the translated episodes whose cards have been deleted
+        self.__shared = (None, 0)
+        self.__translated: set[str] = set()
 
         # Empty lists to be populated with modified Show and Summary objects
         self.shows = []
@@ -134,6 +143,11 @@ class ShowArchive:
         version of the given function that calls that function on all
         Show objects within this Archive.
 
+        The source file, episodes, ID's, translations, and logo of each
+        Show are identical to those of the base Show, so those stages
+        are not run on this Archive - the Episodes of the base Show are
+        shared instead (see `select_source_images()`).
+
         Args:
             show_function: The function to wrap.
 
@@ -168,3 +182,54 @@ class ShowArchive:
             # If the summary exists, log that
             if summary.output.exists():
                 log.debug(f'Created Summary {summary.output.resolve()}')
+
+
+    def __share_episodes(self) -> None:
+        """
+        Share the Episodes of the base Show with each Show within this
+        Archive, if they have been (re-)read since last shared. The
+        cards of any episodes newly translated by the base Show are
+        deleted, so they are remade with the new titles.
+        """
+
+        episodes = self.base_show.episodes
+        translated = self.base_show.translated_keys - self.__translated
+        if (not translated and self.__shared[0] is episodes
+            and self.__shared[1] == len(episodes)):
+            return None
+
+        for show in self.shows:
+            show._share_episodes(self.base_show)
+            for key in translated:
+                if (episode := show.episodes.get(key)) is not None:
+                    episode.delete_card(reason='adding translation')
+        self.__shared = (episodes, len(episodes))
+        self.__translated |= translated
+
+        return None
+
+
+    def select_source_images(self) -> None:
+        """
+        Select the source images of each Show within this Archive, using
+        the Episodes of the base Show. Only sources which the base Show
+        did not already download are downloaded.
+        """
+
+        self.__share_episodes()
+        for show in self.shows:
+            show.select_source_images()
+
+
+    def create_missing_title_cards(self, wait: bool = True) -> None:
+        """
+        Create any missing title cards for each Show within this Archive.
+
+        Args:
+            wait: Whether to wait for the cards submitted to the render
+                queue to be rendered.
+        """
+
+        self.__share_episodes()
+        for show in self.shows:
+            show.create_missing_title_cards(wait=wait)
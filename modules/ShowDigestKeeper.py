@@ -0,0 +1,195 @@
+from datetime import datetime, timedelta
+from hashlib import sha256
+from json import dumps
+from os import scandir
+from typing import TYPE_CHECKING, Optional, Union
+
+from tinydb import where, Query
+
+from modules.Debug import log
+from modules import global_objects
+from modules.PersistentDatabase import PersistentDatabase
+
+if TYPE_CHECKING:
+    from modules.Show import Show
+
+
+class ShowDigestKeeper:
+    """
+    This class describes a keeper of the state digests of Show objects,
+    used to skip shows which have not changed since they were last
+    processed. A show's digest combines the hash of its YAML (and the
+    preference file), the modification time of its datafile, a listing
+    of its source directory, and the episode count and watched-state
+    watermark of the series within its media server.
+
+    A show is only skipped if its digest matches the digest recorded
+    after it was last processed, and it has been processed (verified)
+    within the verification interval - so every show is still fully
+    processed periodically.
+    """
+
+    """Database of show digests"""
+    DIGEST_DATABASE = 'show_digests.json'
+
+    """Default number of days between forced full processing of a show"""
+    DEFAULT_VERIFICATION_INTERVAL = 7
+
+
+    def __init__(self,
+            verification_interval: float = DEFAULT_VERIFICATION_INTERVAL,
+        ) -> None:
+        """
+        Initialize this object, reading the digest database.
+
+        Args:
+            verification_interval: Maximum number of days to skip a
+                show before it is fully processed again.
+        """
+
+        self.digests = PersistentDatabase(self.DIGEST_DATABASE)
+        self.verification_interval = timedelta(days=verification_interval)
+
+        # Hash of the preference file, which affects the digest of all shows
+        try:
+            preferences = global_objects.pp.file.read_bytes()
+        except (AttributeError, OSError):
+            preferences = b''
+        self.__preference_hash = sha256(preferences).hexdigest()
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return f'<ShowDigestKeeper with {len(self.digests)} digests>'
+
+
+    @staticmethod
+    def reset() -> None:
+        """Delete all digests, so every show is processed on the next run."""
+
+        PersistentDatabase(ShowDigestKeeper.DIGEST_DATABASE).truncate()
+        log.info(f'Reset show digests')
+
+
+    @staticmethod
+    def __get_condition(show: 'Show') -> Query:
+        """Get the condition to find the digest of the given Show."""
+
+        return (
+            (where('series') == show.series_info.full_name)
+            & (where('directory') == str(show.media_directory))
+        )
+
+
+    @staticmethod
+    def __get_watermark(show: 'Show') -> Union[list, bool, None]:
+        """
+        Get the watermark of the given Show within its media server.
+
+        Returns:
+            Watermark of the show, or None if the show has no media
+            server. False if the watermark cannot be determined.
+        """
+
+        interface = {
+            'emby': show.emby_interface,
+            'jellyfin': show.jellyfin_interface,
+            'plex': show.plex_interface,
+        }.get(show.media_server)
+        if not interface or show.library_name is None:
+            return None
+
+        if (watermark := interface.get_series_watermark(
+                show.library_name, show.series_info)) is None:
+            return False
+
+        return list(watermark)
+
+
+    def get_digest(self, show: 'Show') -> Optional[str]:
+        """
+        Get the current digest of the given Show.
+
+        Args:
+            show: Show to get the digest of.
+
+        Returns:
+            Hex digest of the show's state. None if the state of the
+            show within its media server cannot be determined.
+        """
+
+        # Skip shows whose media server watermark cannot be determined
+        if (watermark := self.__get_watermark(show)) is False:
+            return None
+
+        # Modification time of the datafile
+        try:
+            datafile = show.file_interface.file.stat().st_mtime_ns
+        except OSError:
+            datafile = None
+
+        # Name, size, and modification time of each source file
+        try:
+            sources = sorted(
+                (entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+                for entry in scandir(show.source_directory)
+                if entry.is_file()
+            )
+        except OSError:
+            sources = []
+
+        return sha256(dumps({
+            'preferences': self.__preference_hash,
+            'yaml': show._base_yaml,
+            'datafile': datafile,
+            'sources': sources,
+            'watermark': watermark,
+        }, sort_keys=True, default=str).encode()).hexdigest()
+
+
+    def is_unchanged(self, show: 'Show') -> bool:
+        """
+        Determine whether the given Show is unchanged since it was last
+        processed, and has been verified recently enough to be skipped.
+
+        Args:
+            show: Show being evaluated.
+
+        Returns:
+            True if the show can be skipped, False otherwise.
+        """
+
+        if (record := self.digests.get(self.__get_condition(show))) is None:
+            return False
+
+        # Force a full verification if not verified recently
+        verified = datetime.fromtimestamp(record['verified'])
+        if datetime.now() - verified > self.verification_interval:
+            log.debug(f'Verifying {show} - last verified {verified}')
+            return False
+
+        return self.get_digest(show) == record['digest']
+
+
+    def add_digest(self, show: 'Show') -> None:
+        """
+        Record the current digest of the given (processed) Show.
+
+        Args:
+            show: Show which was processed.
+        """
+
+        condition = self.__get_condition(show)
+        if (digest := self.get_digest(show)) is None:
+            self.digests.remove(condition)
+            return None
+
+        self.digests.upsert({
+            'series': show.series_info.full_name,
+            'directory': str(show.media_directory),
+            'digest': digest,
+            'verified': datetime.now().timestamp(),
+        }, condition)
+
+        return None
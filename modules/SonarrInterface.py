@@ -102,6 +102,17 @@ class SonarrInterface(EpisodeDataSource, WebInterface, SyncInterface):
         )
 
 
+    def clear_cache(self) -> None:
+        """
+        Clear the cached requests of this interface, and re-map all
+        Sonarr series - e.g. between runs.
+        """
+
+        super().clear_cache()
+        self.__series_data.clear()
+        self.__map_all_series_data()
+
+
     def __map_all_series_data(self) -> None:
         """
         Map all Sonarr series to their Sonarr and TVDb ID's. This
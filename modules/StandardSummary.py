@@ -26,14 +26,11 @@ class StandardSummary(BaseSummary):
     HEADER_FONT = BaseSummary.REF_DIRECTORY.parent / 'Proxima Nova Regular.otf'
     HEADER_FONT_COLOR = '#CFCFCF'
 
-    """Paths to intermediate images created by this object"""
-    __MONTAGE_PATH = BaseSummary.TEMP_DIR / 'montage.png'
-    __MONTAGE_WITH_HEADER_PATH = BaseSummary.TEMP_DIR / 'header.png'
-    __RESIZED_LOGO_PATH = BaseSummary.TEMP_DIR / 'resized_logo.png'
-    __LOGO_AND_HEADER_PATH = BaseSummary.TEMP_DIR / 'logo_and_header.png'
-    __TRANSPARENT_MONTAGE = BaseSummary.TEMP_DIR / 'transparent_montage.png'
-
-    __slots__ = ('background', '__background_is_image')
+    __slots__ = (
+        'background', '__background_is_image', '__montage_path',
+        '__montage_with_header_path', '__resized_logo_path',
+        '__logo_and_header_path', '__transparent_montage',
+    )
 
 
     def __init__(self,
@@ -57,6 +54,15 @@ class StandardSummary(BaseSummary):
         # Initialize parent Summary object
         super().__init__(show, created_by)
 
+        # Paths to intermediate images created by this object
+        self.__montage_path = self.get_temporary_file('montage.png')
+        self.__montage_with_header_path = self.get_temporary_file('header.png')
+        self.__resized_logo_path = self.get_temporary_file('resized_logo.png')
+        self.__logo_and_header_path = \
+            self.get_temporary_file('logo_and_header.png')
+        self.__transparent_montage = \
+            self.get_temporary_file('transparent_montage.png')
+
         # If background is default, use that
         if background == 'default':
             background = self.BACKGROUND_COLOR
@@ -99,12 +105,12 @@ class StandardSummary(BaseSummary):
             f'-geometry +80+80',
             f'-shadow',
             f'"'+'" "'.join(self.inputs)+'"', # Wrap each filename in ""
-            f'"{self.__MONTAGE_PATH.resolve()}"',
+            f'"{self.__montage_path.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__MONTAGE_PATH
+        return self.__montage_path
 
 
     def _add_header(self, montage: Path) -> Path:
@@ -143,12 +149,12 @@ class StandardSummary(BaseSummary):
             f'-splice 0x{80+int(80*self.number_rows/3)}',
             f'-gravity west',
             f'-splice 80x0',
-            f'"{self.__MONTAGE_WITH_HEADER_PATH.resolve()}"'
+            f'"{self.__montage_with_header_path.resolve()}"'
         ])
 
         self.image_magick.run(command)
 
-        return self.__MONTAGE_WITH_HEADER_PATH
+        return self.__montage_with_header_path
 
 
     def _resize_logo(self) -> Path:
@@ -166,12 +172,12 @@ class StandardSummary(BaseSummary):
             f'"{self.logo.resolve()}"',
             f'-resize x500',
             f'-resize 3400x500\>',
-            f'"{self.__RESIZED_LOGO_PATH.resolve()}"',
+            f'"{self.__resized_logo_path.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__RESIZED_LOGO_PATH
+        return self.__resized_logo_path
 
 
     def _add_logo(self, montage: Path, logo: Path) -> Path:
@@ -194,12 +200,12 @@ class StandardSummary(BaseSummary):
             f'-geometry +0+{150+(500-height)//2}',
             f'"{logo.resolve()}"',
             f'"{montage.resolve()}"',
-            f'"{self.__LOGO_AND_HEADER_PATH.resolve()}"'
+            f'"{self.__logo_and_header_path.resolve()}"'
         ])
 
         self.image_magick.run(command)
 
-        return self.__LOGO_AND_HEADER_PATH
+        return self.__logo_and_header_path
 
 
     def _add_created_by(self,
@@ -258,14 +264,14 @@ class StandardSummary(BaseSummary):
             f'-geometry +0+{35+y_offset}',
             f'"{created_by.resolve()}"',
             f'"{montage_and_logo.resolve()}"',
-            f'"{self.__TRANSPARENT_MONTAGE.resolve()}"',
+            f'"{self.__transparent_montage.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
         # Get dimensions of transparent montage to fit background
         width, height = self.image_magick.get_image_dimensions(
-            self.__TRANSPARENT_MONTAGE
+            self.__transparent_montage
         )
 
         # Add background behind transparent montage
@@ -274,7 +280,7 @@ class StandardSummary(BaseSummary):
             f'"{self.background.resolve()}"',
             f'-gravity center',
             f'-resize "{width}x{height}"^',
-            f'"{self.__TRANSPARENT_MONTAGE.resolve()}"',
+            f'"{self.__transparent_montage.resolve()}"',
             f'-composite',
             f'"{self.output.resolve()}"',
         ])
@@ -328,7 +334,7 @@ class StandardSummary(BaseSummary):
         if self.created_by is not None:
             images.append(created_by)
         if self.__background_is_image:
-            images.append(self.__TRANSPARENT_MONTAGE)
+            images.append(self.__transparent_montage)
 
         self.image_magick.delete_intermediate_images(*images)
         return None
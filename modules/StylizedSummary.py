@@ -22,10 +22,6 @@ class StylizedSummary(BaseSummary):
     """Default (and only allowed) background color for this Summary"""
     BACKGROUND_COLOR = 'black'
 
-    """Paths to intermediate images created by this object"""
-    __MONTAGE_PATH = BaseSummary.TEMP_DIR / 'montage.png'
-    __RESIZED_LOGO_PATH = BaseSummary.TEMP_DIR / 'resized_logo.png'
-
 
     def __init__(self,
             show: 'Show',
@@ -46,6 +42,10 @@ class StylizedSummary(BaseSummary):
         # Initialize parent BaseSummary object
         super().__init__(show, created_by)
 
+        # Paths to intermediate images created by this object
+        self.__montage_path = self.get_temporary_file('montage.png')
+        self.__resized_logo_path = self.get_temporary_file('resized_logo.png')
+
 
     def __create_montage(self) -> Path:
         """
@@ -62,12 +62,12 @@ class StylizedSummary(BaseSummary):
             f'-tile 3x{self.number_rows}',
             f'-geometry 800x450\>+5+5',
             f'"'+'" "'.join(self.inputs)+'"',
-            f'"{self.__MONTAGE_PATH.resolve()}"',
+            f'"{self.__montage_path.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__MONTAGE_PATH
+        return self.__montage_path
 
 
     def __resize_logo(self, max_width: int) -> Path:
@@ -85,12 +85,12 @@ class StylizedSummary(BaseSummary):
             f'"{self.logo.resolve()}"',
             f'-resize x350',
             f'-resize {max_width}x350\>',
-            f'"{self.__RESIZED_LOGO_PATH.resolve()}"',
+            f'"{self.__resized_logo_path.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__RESIZED_LOGO_PATH
+        return self.__resized_logo_path
 
 
     def create(self) -> None:
@@ -172,8 +172,8 @@ class StylizedSummary(BaseSummary):
 
         # Delete intermediate images
         if self.created_by is None:
-            images = [montage]
+            images = [montage, resized_logo]
         else:
-            images = [montage, created_by]
+            images = [montage, resized_logo, created_by]
         self.image_magick.delete_intermediate_images(*images)
         return None
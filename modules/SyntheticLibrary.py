@@ -0,0 +1,301 @@
+from io import BytesIO
+from pathlib import Path
+from random import Random
+from typing import Any
+
+from PIL import Image
+from yaml import dump
+
+from modules.CleanPath import CleanPath
+from modules.DataFileInterface import DataFileInterface
+from modules.Debug import log
+from modules.PreferenceParser import PreferenceParser
+from modules.TitleCard import TitleCard
+
+
+class SyntheticLibrary:
+    """
+    This class describes a synthetic library of series, for measuring
+    how TitleCardMaker scales to large libraries without needing a real
+    one. Generating a library writes a preference file, series YAML
+    files (with libraries, fonts, templates, translations, and archive
+    variations), a datafile of episodes for each series, tiny source
+    images, and some pre-existing title cards. The library is generated
+    deterministically from the given seed.
+    """
+
+    """Words that synthetic series and episode titles are made from"""
+    WORDS = (
+        'Amber', 'Beacon', 'Canyon', 'Delta', 'Echo', 'Falcon', 'Garden',
+        'Harbor', 'Island', 'Jasper', 'Kingdom', 'Lantern', 'Meadow',
+        'Night', 'Ocean', 'Pioneer', 'Quartz', 'River', 'Signal', 'Tower',
+        'Utopia', 'Valley', 'Winter', 'Yonder', 'Zephyr',
+    )
+
+    """Name of the library all series are assigned to"""
+    LIBRARY_NAME = 'TV Shows'
+
+    """Font file used by the custom font of the series YAML files"""
+    FONT_FILE = Path(__file__).parent / 'ref' / 'Sequel-Neue.otf'
+
+    """Translation specified by the translated template"""
+    TRANSLATION = {'language': 'es', 'key': 'spanish_title'}
+
+    __slots__ = (
+        'directory', 'series_count', 'episodes_per_series', 'season_length',
+        'series_per_file', 'multipart_rate', 'card_rate', 'source_rate',
+        'translation_rate', 'variation_rate', '__random', '__image',
+    )
+
+
+    def __init__(self,
+            directory: Path,
+            series_count: int,
+            *,
+            episodes_per_series: int = 50,
+            season_length: int = 12,
+            series_per_file: int = 500,
+            multipart_rate: float = 0.05,
+            card_rate: float = 0.5,
+            source_rate: float = 0.5,
+            translation_rate: float = 0.1,
+            variation_rate: float = 0.05,
+            seed: int = 0,
+        ) -> None:
+        """
+        Initialize a synthetic library. Nothing is written until the
+        library is generated.
+
+        Args:
+            directory: Directory to generate the library within.
+            series_count: Number of series in the library.
+            episodes_per_series: (Keyword) Number of episodes of each
+                series.
+            season_length: (Keyword) Number of episodes in each season.
+            series_per_file: (Keyword) Maximum number of series to write
+                to each series YAML file.
+            multipart_rate: (Keyword) Fraction of episodes which begin a
+                two-part episode.
+            card_rate: (Keyword) Fraction of episodes which already have
+                a title card.
+            source_rate: (Keyword) Fraction of episodes which already
+                have a source image.
+            translation_rate: (Keyword) Fraction of series which request
+                a translation.
+            variation_rate: (Keyword) Fraction of series which have an
+                archive variation.
+            seed: (Keyword) Seed that the library is generated from.
+        """
+
+        self.directory = Path(directory)
+        self.series_count = max(1, int(series_count))
+        self.episodes_per_series = max(1, int(episodes_per_series))
+        self.season_length = max(1, int(season_length))
+        self.series_per_file = max(1, int(series_per_file))
+        self.multipart_rate = multipart_rate
+        self.card_rate = card_rate
+        self.source_rate = source_rate
+        self.translation_rate = translation_rate
+        self.variation_rate = variation_rate
+        self.__random = Random(seed)
+
+        # Encode the (tiny) image used for all source images and cards
+        image = BytesIO()
+        Image.new('RGB', (16, 9), (40, 40, 40)).save(image, format='JPEG')
+        self.__image = image.getvalue()
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return (f'<SyntheticLibrary of {self.series_count} series, '
+                f'{self.episodes_per_series} episodes each, in '
+                f'"{self.directory.resolve()}">')
+
+
+    @property
+    def preference_file(self) -> Path:
+        """Preference file of this library."""
+
+        return self.directory / 'preferences.yml'
+
+
+    @property
+    def episode_count(self) -> int:
+        """Total number of episodes in this library."""
+
+        return self.series_count * self.episodes_per_series
+
+
+    def __get_title(self, word_count: int) -> str:
+        """Get a random title of the given number of words."""
+
+        return ' '.join(self.__random.choices(self.WORDS, k=word_count))
+
+
+    def __write_yaml(self, file: Path, yaml: dict[str, Any]) -> None:
+        """Write the given YAML to the given file."""
+
+        file.parent.mkdir(parents=True, exist_ok=True)
+        with file.open('w', encoding='utf-8') as file_handle:
+            dump(yaml, file_handle, allow_unicode=True, width=100)
+
+
+    def __write_image(self, file: Path) -> None:
+        """Write the synthetic image to the given file."""
+
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_bytes(self.__image)
+
+
+    def __generate_series(self,
+            name: str,
+            year: int,
+            translated: bool,
+        ) -> None:
+        """
+        Generate the datafile, source images, and title cards of the
+        given series.
+
+        Args:
+            name: Name of the series.
+            year: Year of the series.
+            translated: Whether the series requests translations.
+        """
+
+        full_name = CleanPath.sanitize_name(f'{name} ({year})')
+        source_directory = self.directory / 'source' / full_name
+        media_directory = self.directory / 'media' / full_name
+
+        data = {}
+        multipart = None
+        for index in range(1, self.episodes_per_series + 1):
+            season = 1 + (index - 1) // self.season_length
+            episode = 1 + (index - 1) % self.season_length
+
+            # Finish the preceding multi-part episode, or maybe start one
+            if multipart is not None:
+                title, multipart = f'{multipart} (2)', None
+            elif (index < self.episodes_per_series
+                  and self.__random.random() < self.multipart_rate):
+                multipart = self.__get_title(2)
+                title = f'{multipart} (1)'
+            else:
+                title = self.__get_title(self.__random.randint(1, 4))
+            entry = {'title': title, 'abs_number': index}
+
+            # Some episodes have all ID's, some have translations
+            if self.__random.random() < 0.5:
+                entry['imdb_id'] = f'tt{year}{index:05}'
+                entry['tmdb_id'] = index
+                entry['tvdb_id'] = index
+            if translated and self.__random.random() < 0.5:
+                entry[self.TRANSLATION['key']] = self.__get_title(2)
+            data.setdefault(f'Season {season}', {})[episode] = entry
+
+            # Write source image and card
+            if self.__random.random() < self.source_rate:
+                self.__write_image(
+                    source_directory
+                    / f's{season}e{episode}{TitleCard.INPUT_CARD_EXTENSION}'
+                )
+            if self.__random.random() < self.card_rate:
+                filename = CleanPath.sanitize_name(
+                    TitleCard.DEFAULT_FILENAME_FORMAT.format(
+                        full_name=f'{name} ({year})', season=season,
+                        episode=episode,
+                    )
+                )
+                season_folder = PreferenceParser.DEFAULT_SEASON_FOLDER_FORMAT
+                self.__write_image(
+                    media_directory / season_folder.format(season=season)
+                    / f'{filename}{TitleCard.DEFAULT_CARD_EXTENSION}'
+                )
+
+        self.__write_yaml(
+            source_directory / DataFileInterface.GENERIC_DATA_FILE_NAME,
+            {'data': data},
+        )
+
+
+    def generate(self) -> Path:
+        """
+        Generate this library.
+
+        Returns:
+            Path to the preference file of the generated library.
+        """
+
+        log.info(f'Generating {self!r}..')
+
+        # Generate each series, grouped into series YAML files
+        series_files, series_yaml = [], {}
+        for index in range(self.series_count):
+            name = f'{self.__get_title(2)} {index:05}'
+            year = 1950 + index % 75
+            translated = self.__random.random() < self.translation_rate
+            self.__generate_series(name, year, translated)
+
+            # Series YAML uses the templates, fonts, and library maps
+            series = {
+                'year': year,
+                'template': {
+                    'name': 'Translated' if translated else 'Standard',
+                    'font_name': 'Custom' if index % 4 == 0 else 'Default',
+                },
+            }
+            if self.__random.random() < self.variation_rate:
+                series['archive_variations'] = [
+                    {'watched_style': 'blur unique'},
+                ]
+            series_yaml[name] = series
+
+            # Write file once full, or the last series is reached
+            if (len(series_yaml) == self.series_per_file
+                or index == self.series_count - 1):
+                file = self.directory / 'series' / f'{len(series_files):03}.yml'
+                self.__write_yaml(file, {
+                    'libraries': {
+                        self.LIBRARY_NAME: {
+                            'path': str((self.directory / 'media').resolve()),
+                            'media_server': 'plex',
+                        },
+                    },
+                    'fonts': {
+                        'Custom': {
+                            'file': str(self.FONT_FILE.resolve()),
+                            'size': '110%',
+                        },
+                        'Default': {'size': '100%'},
+                    },
+                    'templates': {
+                        'Standard': {
+                            'library': self.LIBRARY_NAME,
+                            'font': '<<font_name>>',
+                        },
+                        'Translated': {
+                            'library': self.LIBRARY_NAME,
+                            'font': '<<font_name>>',
+                            'translation': self.TRANSLATION,
+                        },
+                    },
+                    'series': series_yaml,
+                })
+                series_files.append(str(file.resolve()))
+                series_yaml = {}
+
+        # Write preferences which reference the series YAML files
+        self.__write_yaml(self.preference_file, {
+            'options': {
+                'source': str((self.directory / 'source').resolve()),
+                'series': series_files,
+                'execution_mode': 'batch',
+                'validate_fonts': False,
+            },
+            'archive': {
+                'path': str((self.directory / 'archive').resolve()),
+                'summary': {'create': False},
+            },
+        })
+
+        return self.preference_file
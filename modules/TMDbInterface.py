@@ -5,7 +5,9 @@ from typing import Any, Callable, Iterable, Optional
 
 from tinydb import Query, where
 from tmdbapis import TMDbAPIs, NotFound, Unauthorized, TMDbException
-from tmdbapis.objs.reload import Episode as TMDbEpisode
+from tmdbapis.objs.reload import (
+    Episode as TMDbEpisode, Season as TMDbSeasonObj, TVShow as TMDbShow
+)
 from tmdbapis.objs.image import Still as TMDbStill
 
 from modules import global_objects
@@ -50,6 +52,91 @@ def catch_and_log(
     return decorator
 
 
+class TMDbSeason:
+    """
+    This class describes a cached season of a series on TMDb. The
+    season - with the ID's, titles, and airdates of all its episodes -
+    is fetched in a single request, and episodes are indexed by their
+    episode number. The details of an episode (its external ID's,
+    stills, and translations) are only fetched when first accessed, and
+    are then reused by all later lookups.
+    """
+
+    """Endpoints to append to an episode when loading its details"""
+    EPISODE_DETAILS = 'external_ids,images,translations'
+
+    __slots__ = ('season', 'episodes', '__index', '__details')
+
+
+    def __init__(self, api: TMDbAPIs, tv_id: int, season_number: int) -> None:
+        """
+        Fetch the given season from TMDb.
+
+        Args:
+            api: TMDbAPIs object to query TMDb with.
+            tv_id: TMDb ID of the series.
+            season_number: Number of the season to fetch.
+
+        Raises:
+            NotFound: The season does not exist on TMDb.
+        """
+
+        self.season: TMDbSeasonObj = api.tv_season(
+            tv_id, season_number, partial='external_ids'
+        )
+        self.episodes: list[TMDbEpisode] = self.season.episodes
+
+        # Index episodes by episode number, no details are loaded yet
+        self.__index = {ep.episode_number: ep for ep in self.episodes}
+        self.__details: dict[int, TMDbEpisode] = {}
+
+
+    def __len__(self) -> int:
+        """Number of episodes in this season."""
+
+        return len(self.episodes)
+
+
+    def get(self, episode_number: int) -> Optional[TMDbEpisode]:
+        """
+        Get the episode with the given number from this season. The
+        details of the returned episode are not loaded.
+
+        Args:
+            episode_number: Episode number of the episode to get.
+
+        Returns:
+            The TMDb Episode with the given number, None if the episode
+            is not in this season.
+        """
+
+        return self.__index.get(episode_number)
+
+
+    def get_details(self, episode: TMDbEpisode) -> TMDbEpisode:
+        """
+        Get the given episode (of this season) with all its details
+        loaded. Details are only loaded the first time an episode is
+        requested.
+
+        Args:
+            episode: Episode whose details are being loaded.
+
+        Returns:
+            The TMDb Episode with its external ID's, stills, and
+            translations loaded.
+
+        Raises:
+            NotFound: The episode does not exist on TMDb.
+        """
+
+        if (detailed := self.__details.get(episode.episode_number)) is None:
+            episode.reload(partial=self.EPISODE_DETAILS)
+            detailed = self.__details[episode.episode_number] = episode
+
+        return detailed
+
+
 class TMDbInterface(EpisodeDataSource, WebInterface):
     """
     This class defines an interface to TheMovieDatabase (TMDb). Once
@@ -184,6 +271,11 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
             log.critical(f'TMDb API key "{api_key}" is invalid')
             sys_exit(1)
 
+        # Caches of series, seasons, and found episodes for this run
+        self.__series: dict[int, Optional[TMDbShow]] = {}
+        self.__seasons: dict[tuple[int, int], Optional[TMDbSeason]] = {}
+        self.__episodes: dict[tuple, Optional[TMDbEpisode]] = {}
+
 
     def __repr__(self) -> str:
         """Returns an unambiguous string representation of the object."""
@@ -191,6 +283,18 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
         return f'<TMDbInterface {self.api=}>'
 
 
+    def clear_cache(self) -> None:
+        """
+        Clear the cached requests, series, seasons, and episodes of this
+        interface - e.g. between runs.
+        """
+
+        super().clear_cache()
+        self.__series.clear()
+        self.__seasons.clear()
+        self.__episodes.clear()
+
+
     def __get_condition(self,
             query_type: str,
             series_info: SeriesInfo,
@@ -338,6 +442,81 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
         return entry['failures'] > self.preferences.tmdb_retry_count
 
 
+    def __get_series(self, tmdb_id: int) -> Optional[TMDbShow]:
+        """
+        Get the series with the given TMDb ID. Series are cached for the
+        duration of this run.
+
+        Args:
+            tmdb_id: TMDb ID of the series to get.
+
+        Returns:
+            The TMDb TVShow, None if the series does not exist.
+
+        Raises:
+            TMDbException: Any non-NotFound error is raised while
+                querying TMDb. These are not cached.
+        """
+
+        if tmdb_id not in self.__series:
+            try:
+                self.__series[tmdb_id] = self.api.tv_show(tmdb_id)
+            except NotFound:
+                self.__series[tmdb_id] = None
+
+        return self.__series[tmdb_id]
+
+
+    def __get_season(self,
+            tmdb_id: int,
+            season_number: int,
+        ) -> Optional[TMDbSeason]:
+        """
+        Get the given season of the series with the given TMDb ID.
+        Seasons are cached for the duration of this run.
+
+        Args:
+            tmdb_id: TMDb ID of the series.
+            season_number: Number of the season to get.
+
+        Returns:
+            The TMDbSeason, None if the season does not exist.
+
+        Raises:
+            TMDbException: Any non-NotFound error is raised while
+                querying TMDb. These are not cached.
+        """
+
+        if (key := (tmdb_id, season_number)) not in self.__seasons:
+            try:
+                self.__seasons[key] = TMDbSeason(self.api, *key)
+            except NotFound:
+                self.__seasons[key] = None
+
+        return self.__seasons[key]
+
+
+    def __load_episode(self, episode: TMDbEpisode) -> TMDbEpisode:
+        """
+        Load the details of the given episode, reusing the details of
+        the cached season if possible.
+
+        Args:
+            episode: Episode to load the details of.
+
+        Returns:
+            The TMDb Episode with its details loaded.
+        """
+
+        season = self.__get_season(episode.tv_id, episode.season_number)
+        if season is not None:
+            if (cached := season.get(episode.episode_number)) is not None:
+                return season.get_details(cached)
+
+        episode.reload()
+        return episode
+
+
     @catch_and_log('Error setting series ID')
     def set_series_ids(self,
             library_name: Optional[str],
@@ -445,26 +624,26 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
             return []
 
         # Get all seasons on TMDb
-        try:
-            seasons = self.api.tv_show(series_info.tmdb_id).seasons
-        except NotFound:
+        if (series := self.__get_series(series_info.tmdb_id)) is None:
             log.error(f'Cannot source episodes from TMDb for {series_info}')
             return []
 
         # Go through each season, getting episodes from each
         all_episodes = []
-        for season in seasons:
+        for season in series.seasons:
             # Load episodes, now iterate through them
-            season.reload()
-            for episode in season.episodes:
+            if (cached := self.__get_season(series_info.tmdb_id,
+                                            season.season_number)) is None:
+                continue
+            for episode in cached.episodes:
                 # Skip episodes until they've aired
                 if (episode.air_date is not None
                     and episode.air_date > datetime.now()):
                     continue
 
-                # Create either a new EpisodeInfo or get from the MediaInfoSet
+                # Load episode details (for ID's)
                 try:
-                    episode.reload()
+                    episode = cached.get_details(episode)
                 except NotFound:
                     log.error(f'TMDb error - skipping {episode}')
                     continue
@@ -508,8 +687,47 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
             title_match: bool = True
         ) -> Optional[TMDbEpisode]:
         """
-        Finds the episode index for the given entry. Searching is done
-        in the following priority:
+        Find the given episode on TMDb. Results (including misses) are
+        cached for the duration of this run, so the source image and
+        title lookups of an episode only search TMDb once. Misses where
+        any request to TMDb failed are not cached, so the episode is
+        searched for again.
+
+        Args:
+            series_info: The series information.
+            episode_info: The episode information.
+            title_match: Whether to require the title within
+                episode_info to match the title on TMDb.
+
+        Returns:
+            The found Episode (or Movie), None if the entry cannot be
+            found.
+        """
+
+        key = (
+            series_info.full_name, episode_info.season_number,
+            episode_info.episode_number, episode_info.abs_number, title_match,
+        )
+        if key in self.__episodes:
+            return self.__episodes[key]
+
+        episode, failed = self.__search_episode(
+            series_info, episode_info, title_match
+        )
+        if episode is not None or not failed:
+            self.__episodes[key] = episode
+
+        return episode
+
+
+    def __search_episode(self,
+            series_info: SeriesInfo,
+            episode_info: EpisodeInfo,
+            title_match: bool = True
+        ) -> tuple[Optional[TMDbEpisode], bool]:
+        """
+        Search TMDb for the given entry. Searching is done in the
+        following priority:
 
           1. Episode TVDb ID
           2. Episode IMDb ID (as episode)
@@ -520,6 +738,9 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
           7. Series TMDb ID and season+absolute episode index with title match
           8. Series TMDb ID and title match on any episode
 
+        Episodes are matched against cached seasons, so each season is
+        only fetched once.
+
         Args:
             series_info: The series information.
             episode_info: The episode information.
@@ -527,19 +748,23 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
                 episode_info to match the title on TMDb.
 
         Returns:
-            Dictionary of the index for the given entry. This dictionary
-            has keys 'season' and 'episode'. None if returned if the
-            entry cannot be found.
+            Tuple of the found Episode (or Movie) - None if the entry
+            cannot be found - and whether any request to TMDb failed
+            (other than by not finding the requested object).
         """
 
+        # Whether any request failed (e.g. timed out), not just found nothing
+        failed = False
+
         # Query with TVDb ID first
         if episode_info.has_id('tvdb_id'):
             try:
                 results = self.api.find_by_id(tvdb_id=episode_info.tvdb_id)
-                (episode := results.tv_episode_results[0]).reload()
-                return episode
-            except (NotFound, IndexError, TMDbException):
+                return self.__load_episode(results.tv_episode_results[0]), False
+            except (NotFound, IndexError):
                 pass
+            except TMDbException:
+                failed = True
 
         # Query with IMDb ID
         if episode_info.has_id('imdb_id'):
@@ -547,14 +772,18 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
                 results = self.api.find_by_id(imdb_id=episode_info.imdb_id)
                 # Check for an episode, then check for a movie
                 if len(results.tv_episode_results) > 0:
-                    (episode := results.tv_episode_results[0]).reload()
-                elif len(results.movie_results) > 0:
+                    return (
+                        self.__load_episode(results.tv_episode_results[0]),
+                        False,
+                    )
+                if len(results.movie_results) > 0:
                     (episode := results.movie_results[0]).reload()
-                else:
-                    raise NotFound
-                return episode
-            except (NotFound, IndexError, TMDbException):
+                    return episode, False
+                raise NotFound
+            except (NotFound, IndexError):
                 pass
+            except TMDbException:
+                failed = True
 
         # Query with TVRage ID
         if episode_info.has_id('tvrage_id'):
@@ -562,17 +791,22 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
                 results = self.api.find_by_id(tvrage_id=episode_info.tvrage_id)
                 # Check for an episode, then check for a movie
                 if len(results.tv_episode_results) > 0:
-                    (episode := results.tv_episode_results[0]).reload()
-                elif len(results.movie_results) > 0:
+                    return (
+                        self.__load_episode(results.tv_episode_results[0]),
+                        False,
+                    )
+                if len(results.movie_results) > 0:
                     (episode := results.movie_results[0]).reload()
-                else:
-                    raise NotFound
-                return episode
-            except (NotFound, IndexError, TMDbException):
+                    return episode, False
+                raise NotFound
+            except (NotFound, IndexError):
                 pass
+            except TMDbException:
+                failed = True
 
         # Search for movie with this episode title
         def _find_episode_as_movie(episode_info):
+            nonlocal failed
             try:
                 # Search for movies with this title
                 results = self.api.movie_search(episode_info.title.full_title)
@@ -602,72 +836,84 @@ class TMDbInterface(EpisodeDataSource, WebInterface):
                 log.info(f'Matched {episode_info} of "{series_info}" to TMDb '
                          f'Movie {movie}')
                 return movie
-            except (NotFound, IndexError, AssertionError, TMDbException):
+            except (NotFound, IndexError, AssertionError):
+                return None
+            except TMDbException:
+                failed = True
                 return None
 
         # If series TMDb ID is not present, try as movie, no other attempts
         if not series_info.has_id('tmdb_id'):
-            return _find_episode_as_movie(episode_info)
+            return _find_episode_as_movie(episode_info), failed
 
         # Verify series ID is valid
         try:
-            series = self.api.tv_show(series_info.tmdb_id)
-        except (NotFound, TMDbException):
-            return None
+            series = self.__get_series(series_info.tmdb_id)
+        except TMDbException:
+            return None, True
+        if series is None:
+            return None, failed
 
         def _match_by_index(episode_info, season_number, episode_number):
-            # Find episode with series TMDb ID and given index
+            # Find episode with given index in the cached season
+            nonlocal failed
             try:
-                episode = self.api.tv_episode(
-                    series_info.tmdb_id, season_number, episode_number
-                )
-                episode.reload()
-            except (NotFound, TMDbException):
-                return None
+                season = self.__get_season(series_info.tmdb_id, season_number)
+                if season is None:
+                    return None
+                if (episode := season.get(episode_number)) is None:
+                    return None
 
-            # If TMDb ID matches, or title matches
-            id_match = (episode_info.has_id('tmdb_id')
-                        and episode_info.tmdb_id == episode.id)
-            does_match = (not title_match or (title_match and
-                          episode_info.title.matches(episode.name)))
-            return episode if id_match or does_match else None
+                # If TMDb ID matches, or title matches
+                id_match = (episode_info.has_id('tmdb_id')
+                            and episode_info.tmdb_id == episode.id)
+                does_match = (not title_match or (title_match and
+                              episode_info.title.matches(episode.name)))
+                if id_match or does_match:
+                    return season.get_details(episode)
+            except NotFound:
+                pass
+            except TMDbException:
+                failed = True
+
+            return None
 
         # Try and match by index
         indices = episode_info.season_number, episode_info.episode_number
         if (episode := _match_by_index(episode_info, *indices)) is not None:
-            episode.reload()
-            return episode
+            return episode, False
 
         # Match by absolute number
         if episode_info.abs_number is not None:
             # Try for this season
             indices = episode_info.season_number, episode_info.abs_number
             if (ep := _match_by_index(episode_info, *indices)) is not None:
-                ep.reload()
-                return ep
+                return ep, False
 
             # Try for all seasons
             for season in series.seasons:
                 indices = season.season_number, episode_info.abs_number
                 if (ep := _match_by_index(episode_info, *indices)) is not None:
-                    ep.reload()
-                    return ep
+                    return ep, False
 
         # If title match is disabled, cannot identify
         if not title_match:
-            return _find_episode_as_movie(episode_info)
+            return _find_episode_as_movie(episode_info), failed
 
         # Try every episode
         for season in series.seasons:
-            season.reload()
-            for episode in season.episodes:
+            cached = self.__get_season(
+                series_info.tmdb_id, season.season_number
+            )
+            if cached is None:
+                continue
+            for episode in cached.episodes:
                 if ((episode_info.has_id('tmdb_id') and
                     episode_info.tmdb_id == episode.id)
                     or episode_info.title.matches(episode.name)):
-                    episode.reload()
-                    return episode
+                    return cached.get_details(episode), False
 
-        return _find_episode_as_movie(episode_info)
+        return _find_episode_as_movie(episode_info), failed
 
 
     @catch_and_log('Error setting episode IDs')
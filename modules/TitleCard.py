@@ -1,48 +1,20 @@
 from pathlib import Path
 from re import match, sub, IGNORECASE
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from modules import global_objects
 from modules.BaseCardType import BaseCardType
+from modules.CardTypeRegistry import CardTypeRegistry
 from modules.CleanPath import CleanPath
 from modules.Debug import log
 from modules.EpisodeInfo import EpisodeInfo
 from modules.SeriesInfo import SeriesInfo
 
-# Built-in BaseCardType classes
-from modules.cards.AnimeTitleCard import AnimeTitleCard
-from modules.cards.BannerTitleCard import BannerTitleCard
-from modules.cards.CalligraphyTitleCard import CalligraphyTitleCard
-from modules.cards.ComicBookTitleCard import ComicBookTitleCard
-from modules.cards.CutoutTitleCard import CutoutTitleCard
-from modules.cards.DividerTitleCard import DividerTitleCard
-from modules.cards.FadeTitleCard import FadeTitleCard
-from modules.cards.FormulaOneTitleCard import FormulaOneTitleCard
-from modules.cards.FrameTitleCard import FrameTitleCard
-from modules.cards.GraphTitleCard import GraphTitleCard
-from modules.cards.InsetTitleCard import InsetTitleCard
-from modules.cards.LandscapeTitleCard import LandscapeTitleCard
-from modules.cards.LogoTitleCard import LogoTitleCard
-from modules.cards.MarvelTitleCard import MarvelTitleCard
-from modules.cards.MusicTitleCard import MusicTitleCard
-from modules.cards.NotificationTitleCard import NotificationTitleCard
-from modules.cards.OlivierTitleCard import OlivierTitleCard
-from modules.cards.OverlineTitleCard import OverlineTitleCard
-from modules.cards.PosterTitleCard import PosterTitleCard
-from modules.cards.RomanNumeralTitleCard import RomanNumeralTitleCard
-from modules.cards.ShapeTitleCard import ShapeTitleCard
-from modules.cards.StandardTitleCard import StandardTitleCard
-from modules.cards.StarWarsTitleCard import StarWarsTitleCard
-from modules.cards.StripedTitleCard import StripedTitleCard
-from modules.cards.TextlessTitleCard import TextlessTitleCard
-from modules.cards.TintedFrameTitleCard import TintedFrameTitleCard
-from modules.cards.TintedGlassTitleCard import TintedGlassTitleCard
-from modules.cards.WhiteBorderTitleCard import WhiteBorderTitleCard
-
 
 if TYPE_CHECKING:
     from modules.Episode import Episode, MultiEpisode
     from modules.Profile import Profile
+    from modules.RenderQueue import RenderQueue
 
 
 class TitleCard:
@@ -72,54 +44,56 @@ class TitleCard:
     """Default card type identifier to utilize if unspecified"""
     DEFAULT_CARD_TYPE = 'standard'
 
-    """Mapping of card type identifiers to CardType classes"""
-    CARD_TYPES = {
-        '4x3': FadeTitleCard,
-        'anime': AnimeTitleCard,
-        'banner': BannerTitleCard,
-        'blurred border': TintedFrameTitleCard,
-        'calligraphy': CalligraphyTitleCard,
-        'comic book': ComicBookTitleCard,
-        'cutout': CutoutTitleCard,
-        'divider': DividerTitleCard,
-        'fade': FadeTitleCard,
-        'formula 1': FormulaOneTitleCard,
-        'frame': FrameTitleCard,
-        'generic': StandardTitleCard,
-        'graph': GraphTitleCard,
-        'gundam': PosterTitleCard,
-        'import': TextlessTitleCard,
-        'inset': InsetTitleCard,
-        'ishalioh': OlivierTitleCard,
-        'landscape': LandscapeTitleCard,
-        'logo': LogoTitleCard,
-        'marvel': MarvelTitleCard,
-        'music': MusicTitleCard,
-        'musikmann': WhiteBorderTitleCard,
-        'notification': NotificationTitleCard,
-        'olivier': OlivierTitleCard,
-        'overline': OverlineTitleCard,
-        'phendrena': CutoutTitleCard,
-        'photo': FrameTitleCard,
-        'polygon': StripedTitleCard,
-        'polymath': StandardTitleCard,
-        'poster': PosterTitleCard,
-        'reality tv': LogoTitleCard,
-        'roman': RomanNumeralTitleCard,
-        'roman numeral': RomanNumeralTitleCard,
-        'shape': ShapeTitleCard,
-        'sherlock': TintedGlassTitleCard,
-        'spotify': MusicTitleCard,
-        'standard': StandardTitleCard,
-        'star wars': StarWarsTitleCard,
-        'striped': StripedTitleCard,
-        'textless': TextlessTitleCard,
-        'tinted frame': TintedFrameTitleCard,
-        'tinted glass': TintedGlassTitleCard,
-        'white border': WhiteBorderTitleCard,
-    }
-
-    __slots__ = ('episode', 'profile', 'converted_title', 'maker', 'file')
+    """Mapping of card type identifiers to CardType classes (lazily imported)"""
+    CARD_TYPES = CardTypeRegistry({
+        '4x3': 'FadeTitleCard',
+        'anime': 'AnimeTitleCard',
+        'banner': 'BannerTitleCard',
+        'blurred border': 'TintedFrameTitleCard',
+        'calligraphy': 'CalligraphyTitleCard',
+        'comic book': 'ComicBookTitleCard',
+        'cutout': 'CutoutTitleCard',
+        'divider': 'DividerTitleCard',
+        'fade': 'FadeTitleCard',
+        'formula 1': 'FormulaOneTitleCard',
+        'frame': 'FrameTitleCard',
+        'generic': 'StandardTitleCard',
+        'graph': 'GraphTitleCard',
+        'gundam': 'PosterTitleCard',
+        'import': 'TextlessTitleCard',
+        'inset': 'InsetTitleCard',
+        'ishalioh': 'OlivierTitleCard',
+        'landscape': 'LandscapeTitleCard',
+        'logo': 'LogoTitleCard',
+        'marvel': 'MarvelTitleCard',
+        'music': 'MusicTitleCard',
+        'musikmann': 'WhiteBorderTitleCard',
+        'notification': 'NotificationTitleCard',
+        'olivier': 'OlivierTitleCard',
+        'overline': 'OverlineTitleCard',
+        'phendrena': 'CutoutTitleCard',
+        'photo': 'FrameTitleCard',
+        'polygon': 'StripedTitleCard',
+        'polymath': 'StandardTitleCard',
+        'poster': 'PosterTitleCard',
+        'reality tv': 'LogoTitleCard',
+        'roman': 'RomanNumeralTitleCard',
+        'roman numeral': 'RomanNumeralTitleCard',
+        'shape': 'ShapeTitleCard',
+        'sherlock': 'TintedGlassTitleCard',
+        'spotify': 'MusicTitleCard',
+        'standard': 'StandardTitleCard',
+        'star wars': 'StarWarsTitleCard',
+        'striped': 'StripedTitleCard',
+        'textless': 'TextlessTitleCard',
+        'tinted frame': 'TintedFrameTitleCard',
+        'tinted glass': 'TintedGlassTitleCard',
+        'white border': 'WhiteBorderTitleCard',
+    })
+
+    __slots__ = (
+        'episode', 'profile', 'converted_title', 'maker', 'file', 'kwargs',
+    )
 
 
     def __init__(self,
@@ -180,6 +154,7 @@ class TitleCard:
           | self.episode.episode_info.indices \
           | extra_characteristics
 
+        self.kwargs = kwargs
         try:
             self.maker = self.episode.card_class(**kwargs)
         except Exception as e:
@@ -373,3 +348,33 @@ class TitleCard:
         self.maker.image_magick.print_command_history()
 
         return False
+
+
+    def submit(self, render_queue: 'RenderQueue') -> Optional[int]:
+        """
+        Submit this title card to be rendered by the given queue, rather
+        than creating it. If the card already exists, it is not
+        submitted.
+
+        Args:
+            render_queue: Queue to submit this card to.
+
+        Returns:
+            ID of the render job of this card. None if the card was not
+            submitted.
+        """
+
+        # If card is invalid or already exists, exit
+        if self.maker is None or not self.maker.valid or self.file.exists():
+            return None
+
+        try:
+            return render_queue.submit(
+                self.episode.card_class, self.kwargs, self.file,
+            )
+        except TypeError as e:
+            log.debug(f'Cannot submit card for {self.episode} - {e}')
+        except Exception as e:
+            log.exception(f'Cannot submit card for {self.episode} - {e}')
+
+        return None
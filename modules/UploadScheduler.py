@@ -0,0 +1,241 @@
+from collections import namedtuple
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+)
+from threading import Condition
+from time import perf_counter, sleep
+from typing import Any, Callable, Optional
+
+from tqdm import tqdm
+
+from modules.Debug import log, TQDM_KWARGS
+
+
+UploadResult = namedtuple('UploadResult', ('uploaded', 'failed', 'skipped'))
+Upload = tuple[Any, Callable[[], bool]]
+
+
+class UploadScheduler:
+    """
+    This class describes a scheduler for uploading assets into a
+    MediaServer. Uploads are executed on a pool of threads, with at most
+    some maximum number of uploads in-flight at once - across all
+    concurrent calls to `run()`, so one server is never sent more than
+    this many uploads (e.g. by multiple shows in a pipeline). The number of
+    in-flight uploads adapts to the responsiveness of the server - when
+    an upload fails or is much slower than usual, fewer uploads are
+    allowed in-flight and new uploads are delayed; as uploads succeed
+    quickly, the limit and delay recover.
+    """
+
+    """Default maximum number of in-flight uploads"""
+    DEFAULT_CONCURRENCY = 4
+
+    """How many times slower than average an upload must be to back off"""
+    SLOW_FACTOR = 3.0
+
+    """Weight of the newest duration in the average upload duration"""
+    SMOOTHING = 0.2
+
+    """Minimum and maximum delay (in seconds) between uploads when backing off"""
+    MIN_BACKOFF = 0.5
+    MAX_BACKOFF = 30.0
+
+    __slots__ = (
+        'name', 'concurrency', '__limit', '__average', '__backoff',
+        '__in_flight', '__condition', '__executor',
+    )
+
+
+    def __init__(self,
+            name: str,
+            concurrency: int = DEFAULT_CONCURRENCY,
+        ) -> None:
+        """
+        Initialize this scheduler.
+
+        Args:
+            name: Name (for logging) of the server being uploaded to.
+            concurrency: Maximum number of in-flight uploads.
+        """
+
+        self.name = name
+        self.concurrency = max(1, int(concurrency))
+
+        # Current in-flight limit, average duration, and delay between uploads
+        self.__limit = self.concurrency
+        self.__average: Optional[float] = None
+        self.__backoff = 0.0
+
+        # Uploads in-flight across all runs, and the pool executing them -
+        # created when first used
+        self.__in_flight = 0
+        self.__condition = Condition()
+        self.__executor: Optional[ThreadPoolExecutor] = None
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return (f'<UploadScheduler to {self.name}, limit={self.__limit}/'
+                f'{self.concurrency}, backoff={self.__backoff:.1f}s>')
+
+
+    def __acquire(self, block: bool) -> bool:
+        """
+        Reserve an in-flight upload, if the in-flight limit allows.
+
+        Args:
+            block: Whether to wait until the limit allows an upload.
+
+        Returns:
+            Whether an in-flight upload was reserved.
+        """
+
+        with self.__condition:
+            while self.__in_flight >= self.__limit:
+                if not block:
+                    return False
+                self.__condition.wait()
+            self.__in_flight += 1
+
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.concurrency,
+                    thread_name_prefix=f'Upload-{self.name}',
+                )
+
+        return True
+
+
+    def __timed(self, upload: Callable[[], bool]) -> tuple[bool, float]:
+        """
+        Execute and time the given upload, releasing its reserved
+        in-flight upload once finished.
+
+        Args:
+            upload: Callable which performs the upload.
+
+        Returns:
+            Tuple of the return of the upload, and the duration (in
+            seconds) of the upload.
+        """
+
+        start = perf_counter()
+        try:
+            result = upload()
+        finally:
+            with self.__condition:
+                self.__in_flight -= 1
+                self.__condition.notify_all()
+
+        return result, perf_counter() - start
+
+
+    def __speed_up(self, duration: float) -> None:
+        """
+        Record an upload which succeeded in the given duration, and
+        adapt the in-flight limit and delay to it.
+
+        Args:
+            duration: How long the upload took (in seconds).
+        """
+
+        with self.__condition:
+            # Upload was much slower than average, back off
+            if (self.__average is not None
+                and duration > self.SLOW_FACTOR * self.__average):
+                self.__slow_down()
+            # Upload was typical, allow another in-flight upload, reduce delay
+            else:
+                self.__limit = min(self.concurrency, self.__limit + 1)
+                self.__backoff /= 2
+                if self.__backoff < self.MIN_BACKOFF:
+                    self.__backoff = 0.0
+                self.__condition.notify_all()
+
+            # Update moving average of upload durations
+            if self.__average is None:
+                self.__average = duration
+            else:
+                self.__average += self.SMOOTHING * (duration - self.__average)
+
+
+    def __slow_down(self) -> None:
+        """Halve the in-flight limit, and double the delay between uploads."""
+
+        with self.__condition:
+            self.__limit = max(1, self.__limit // 2)
+            self.__backoff = min(
+                self.MAX_BACKOFF, max(self.MIN_BACKOFF, self.__backoff * 2)
+            )
+        log.debug(f'Backing off uploads to {self.name} - {self!r}')
+
+
+    def run(self,
+            uploads: list[Upload],
+            *,
+            error_threshold: Optional[int] = None,
+        ) -> UploadResult:
+        """
+        Execute the given uploads.
+
+        Args:
+            uploads: List of tuples of a key identifying the upload, and
+                a callable which performs the upload. The callable
+                should return whether the asset was uploaded, and raise
+                an Exception if the upload failed.
+            error_threshold: (Keyword) How many failed uploads result in
+                the remaining uploads being skipped.
+
+        Returns:
+            UploadResult whose elements are the list of keys of the
+            uploaded assets, the number of failed uploads, and the
+            number of skipped uploads.
+        """
+
+        uploaded, failed = [], 0
+        remaining = list(reversed(uploads))
+        pending: dict[Future, Any] = {}
+
+        with tqdm(total=len(uploads), **TQDM_KWARGS) as pbar:
+            while remaining or pending:
+                # Stop submitting uploads if too many have failed
+                if (error_threshold is not None and failed >= error_threshold
+                    and remaining):
+                    break
+
+                # Submit uploads until the (shared) in-flight limit is reached;
+                # wait for the limit if none of this run's uploads are pending
+                while remaining and self.__acquire(block=not pending):
+                    if self.__backoff > 0:
+                        sleep(self.__backoff)
+                    key, upload = remaining.pop()
+                    future = self.__executor.submit(self.__timed, upload)
+                    pending[future] = key
+
+                # Wait for any upload to finish
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = pending.pop(future)
+                    pbar.set_description(f'Uploaded {key}')
+                    pbar.update()
+                    try:
+                        result, duration = future.result()
+                    except Exception: # pylint: disable=broad-except
+                        failed += 1
+                        self.__slow_down()
+                    else:
+                        self.__speed_up(duration)
+                        if result:
+                            uploaded.append(key)
+
+            # Finish any uploads still in-flight after stopping
+            for future, key in pending.items():
+                try:
+                    if future.result()[0]:
+                        uploaded.append(key)
+                except Exception: # pylint: disable=broad-except
+                    failed += 1
+
+        return UploadResult(uploaded, failed, len(remaining))
@@ -1,12 +1,19 @@
 from pathlib import Path
-from typing import Any, Union
+from threading import Lock
+from typing import Any, Optional, Union
 
 from re import IGNORECASE, compile as re_compile
-from requests import get, Session
-from tenacity import retry, stop_after_attempt, wait_fixed, wait_exponential
+from requests import Session
+from requests.adapters import DEFAULT_POOLSIZE
+from tenacity import (
+    retry, retry_if_not_exception_type, stop_after_attempt, wait_fixed,
+    wait_exponential,
+)
 import urllib3
 
+from modules.CircuitBreaker import CircuitBreaker, CircuitOpenError
 from modules.Debug import log
+from modules.RequestScheduler import ScheduledHTTPAdapter
 
 
 class WebInterface:
@@ -14,6 +21,8 @@ class WebInterface:
     This class defines a WebInterface, which is a type of interface that
     makes requests using some persistent session and returns JSON
     results. This object caches requests/results for better performance.
+    All requests are sent through the RequestScheduler of their host,
+    and are failed fast by a CircuitBreaker if the server is down.
     """
 
     """Maximum time allowed for a single GET request"""
@@ -31,31 +40,46 @@ class WebInterface:
         b'<Code>AccessDenied</Code>',
     )
 
+    """Session shared by all image downloads, created when first used"""
+    _download_session: Optional[Session] = None
+    _download_session_lock = Lock()
+
 
     def __init__(self,
             name: str,
             verify_ssl: bool = True,
             *,
             cache: bool = True,
+            pool_size: int = DEFAULT_POOLSIZE,
         ) -> None:
         """
         Construct a new instance of a WebInterface. This creates creates
-        cached request and results lists, and establishes a session for
-        future use.
+        a cache of requests and their results, and establishes a session
+        for future use.
 
         Args:
             name: Name (for logging) of this interface.
             verify_ssl: Whether to verify SSL requests with this
                 interface.
             cache: Whether to cache requests with this interface.
-            log: Logger for all log messages.
+            pool_size: (Keyword) Maximum number of connections to keep
+                open to each host, so concurrent requests reuse
+                connections.
         """
 
         # Store name of this interface
         self.name = name
 
-        # Create session for persistent requests
+        # Create session for persistent requests, pooling connections,
+        # scheduling requests per-host, and failing fast if the server is down
+        self.circuit_breaker = CircuitBreaker(name)
         self.session = Session()
+        adapter = ScheduledHTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size,
+            circuit_breaker=self.circuit_breaker,
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
         # Whether to verify SSL
         self.session.verify = verify_ssl
@@ -63,10 +87,11 @@ class WebInterface:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
             log.debug(f'Not verifying SSL connections for {name}')
 
-        # Cache of the last requests to speed up identical sequential requests
+        # Cache of the last requests to speed up identical sequential requests;
+        # the cache is shared by all threads using this interface
         self.__do_cache = cache
-        self.__cache = []
-        self.__cached_results = []
+        self.__cache: list[tuple[tuple[str, str], Any]] = []
+        self.__cache_lock = Lock()
 
 
     def __repr__(self) -> str:
@@ -75,8 +100,16 @@ class WebInterface:
         return f'<WebInterface to {self.name}>'
 
 
+    def clear_cache(self) -> None:
+        """Clear the cached requests/results of this interface."""
+
+        with self.__cache_lock:
+            self.__cache.clear()
+
+
     @retry(stop=stop_after_attempt(5),
            wait=wait_fixed(5)+wait_exponential(min=1, max=16),
+           retry=retry_if_not_exception_type(CircuitOpenError),
            before_sleep=lambda _:log.warning('Failed to submit GET request, retrying..'),
            reraise=True)
     def __retry_get(self, url: str, params: dict) -> dict:
@@ -108,36 +141,63 @@ class WebInterface:
         Args:
             url: URL to pass to GET.
             Parameters to pass to GET.
+            cache: (Keyword) Whether to cache this request.
 
         Returns:
             Parsed JSON return of the specified GET request.
         """
 
         # If not caching, just query and return
-        if not self.__do_cache:
+        if not self.__do_cache or not cache:
             return self.__retry_get(url=url, params=params)
 
         # Look through all cached results for this exact URL+params; if found,
         # skip the request and return that result
-        for cache, result in zip(self.__cache, self.__cached_results):
-            if cache['url'] == url and cache['params'] == str(params):
-                return result
+        key = (url, str(params))
+        with self.__cache_lock:
+            for cached_key, result in self.__cache:
+                if cached_key == key:
+                    return result
+
+        # Make new request (outside the lock), add to cache
+        result = self.__retry_get(url=url, params=params)
+        with self.__cache_lock:
+            self.__cache.append((key, result))
+
+            # Delete oldest element from cache if length has been exceeded
+            if len(self.__cache) > self.CACHE_LENGTH:
+                self.__cache.pop(0)
 
-        # Make new request, add to cache
-        self.__cached_results.append(self.__retry_get(url=url, params=params))
-        self.__cache.append({'url': url, 'params': str(params)})
+        return result
+
+
+    @classmethod
+    def _get_download_session(cls) -> Session:
+        """
+        Get the Session used to download images. Like the Session of
+        each interface, requests are sent through the RequestScheduler
+        of their host (and the active HTTPCassette, if any).
+
+        Returns:
+            The shared download Session.
+        """
 
-        # Delete element from cache if length has been exceeded
-        if len(self.__cache) > self.CACHE_LENGTH:
-            self.__cache.pop(0)
-            self.__cached_results.pop(0)
+        with cls._download_session_lock:
+            if cls._download_session is None:
+                session = Session()
+                adapter = ScheduledHTTPAdapter()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                cls._download_session = session
 
-        # Return latest result
-        return self.__cached_results[-1]
+        return cls._download_session
 
 
-    @staticmethod
-    def download_image(image: Union[str, bytes], destination: Path) -> bool:
+    @classmethod
+    def download_image(cls,
+            image: Union[str, bytes],
+            destination: Path,
+        ) -> bool:
         """
         Download the provided image to the destination filepath.
 
@@ -161,7 +221,7 @@ class WebInterface:
         # Attempt to download the image, if an error happens log to user
         try:
             # Get content from URL
-            image = get(image, timeout=30).content
+            image = cls._get_download_session().get(image, timeout=30).content
             if len(image) == 0:
                 raise ValueError(f'URL {image} returned no content error')
             if any(bad_content in image for bad_content in WebInterface.BAD_CONTENT):
@@ -0,0 +1,412 @@
+from email.parser import BytesParser
+from email.policy import HTTP
+from hmac import compare_digest
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps, loads
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, Literal, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from modules.Debug import log
+from modules.ImageMagickInterface import ImageMagickInterface
+
+
+MediaServer = Literal['emby', 'jellyfin', 'plex']
+
+
+class WebhookServer:
+    """
+    This class describes a local HTTP server which receives the webhooks
+    of Plex, Emby, and Jellyfin. The episodes (rating keys or item IDs)
+    of relevant events - e.g. an episode being watched, or added - are
+    put into a bounded queue, which is consumed in batches by whatever
+    remakes their cards.
+
+    Keys already waiting in the queue are not queued again. If the queue
+    is full, webhooks are rejected with a 503 (and Retry-After) so the
+    sender can retry later. Statistics are available as JSON from
+    `GET /stats`.
+
+    Each server posts to its own path - i.e. `/plex`, `/emby`, and
+    `/jellyfin`. Every request must include the shared token of the
+    server, either as the `token` query parameter (e.g.
+    `/plex?token=...`) or the `X-TCM-Token` header; requests without it
+    are rejected with a 401.
+    """
+
+    """Default address and port to listen on - only local by default"""
+    DEFAULT_HOST = '127.0.0.1'
+    DEFAULT_PORT = 8765
+
+    """Default maximum number of queued keys"""
+    DEFAULT_QUEUE_SIZE = 1000
+
+    """Largest accepted request body - Plex payloads include a thumbnail"""
+    MAX_BODY_SIZE = 10 * 2**20
+
+    """Seconds a sender is asked to wait while the queue is full"""
+    RETRY_AFTER = 30
+
+    """Events of each server which warrant remaking cards"""
+    EVENTS: dict[MediaServer, tuple[str, ...]] = {
+        'emby': (
+            'item.markplayed', 'item.markunplayed', 'library.new',
+            'playback.stop',
+        ),
+        'jellyfin': ('ItemAdded', 'PlaybackStop', 'UserDataSaved'),
+        'plex': ('library.new', 'media.scrobble'),
+    }
+
+    """Item types which can have title cards"""
+    ITEM_TYPES = ('episode', 'season', 'series', 'show')
+
+    """Header which can contain the token of a request"""
+    TOKEN_HEADER = 'X-TCM-Token'
+
+
+    def __init__(self,
+            token: str,
+            host: str = DEFAULT_HOST,
+            port: int = DEFAULT_PORT,
+            queue_size: int = DEFAULT_QUEUE_SIZE,
+        ) -> None:
+        """
+        Initialize the server. The server does not listen until it is
+        started.
+
+        Args:
+            token: Shared token which every request must include.
+            host: Address to listen on.
+            port: Port to listen on.
+            queue_size: Maximum number of keys to queue.
+        """
+
+        self.__token = token
+        self.host = host
+        self.port = int(port)
+        self.queue: Queue[tuple[MediaServer, str]] = Queue(max(1, queue_size))
+        self.__lock = Lock()
+        self.__pending: set[tuple[MediaServer, str]] = set()
+        self.__server: Optional[ThreadingHTTPServer] = None
+        self.__started = monotonic()
+
+        # Metrics
+        self.stats = {
+            'received': 0, 'queued': 0, 'duplicate': 0, 'ignored': 0,
+            'invalid': 0, 'rejected': 0, 'unauthorized': 0, 'processed': 0,
+        }
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return (f'<WebhookServer on {self.host}:{self.port}, '
+                f'{self.queue.qsize()}/{self.queue.maxsize} queued>')
+
+
+    def start(self) -> None:
+        """Start listening for webhooks (in a background thread)."""
+
+        webhook_server = self
+        class Handler(WebhookRequestHandler):
+            server_object = webhook_server
+
+        self.__server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.__server.daemon_threads = True
+        self.__started = monotonic()
+        Thread(
+            target=self.__server.serve_forever, name='WebhookServer',
+            daemon=True,
+        ).start()
+        log.info(f'Listening for webhooks on {self.host}:{self.port}')
+
+
+    def stop(self) -> None:
+        """Stop listening for webhooks."""
+
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+
+
+    def is_authorized(self, token: Optional[str]) -> bool:
+        """
+        Determine whether the given request token matches the token of
+        this server.
+
+        Args:
+            token: Token of the request, None if the request has none.
+
+        Returns:
+            True if the token matches, False otherwise.
+        """
+
+        return token is not None and compare_digest(
+            token.encode(), self.__token.encode()
+        )
+
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the statistics of this server."""
+
+        with self.__lock:
+            return self.stats | {
+                'queue_depth': self.queue.qsize(),
+                'queue_size': self.queue.maxsize,
+                'uptime': round(monotonic() - self.__started, 1),
+                'imagemagick': ImageMagickInterface.get_usage(),
+            }
+
+
+    def increment(self, stat: str, count: int = 1) -> None:
+        """Increment the given statistic."""
+
+        with self.__lock:
+            self.stats[stat] += count
+
+
+    @staticmethod
+    def parse_payload(
+            content_type: str,
+            body: bytes,
+        ) -> Optional[dict[str, Any]]:
+        """
+        Parse the JSON payload of the given webhook body. Plex (and
+        optionally Emby) send the JSON as a field of a multipart form.
+
+        Args:
+            content_type: Content-Type header of the webhook.
+            body: Body of the webhook.
+
+        Returns:
+            Parsed payload. None if the payload cannot be parsed.
+        """
+
+        try:
+            if not content_type.startswith('multipart/'):
+                return loads(body)
+
+            # Find JSON form field of the multipart form
+            message = BytesParser(policy=HTTP).parsebytes(
+                f'Content-Type: {content_type}\r\n\r\n'.encode() + body
+            )
+            for part in message.iter_parts():
+                if part.get_param('name', header='content-disposition') in (
+                        'payload', 'data'):
+                    return loads(part.get_content())
+        except (ValueError, TypeError):
+            pass
+
+        return None
+
+
+    def get_keys(self,
+            media_server: MediaServer,
+            payload: dict[str, Any],
+        ) -> Optional[list[str]]:
+        """
+        Get the rating keys or item IDs of the given webhook payload.
+
+        Args:
+            media_server: Which server sent the payload.
+            payload: Webhook payload.
+
+        Returns:
+            List of keys of the payload. Empty if the event or item is
+            not relevant. None if the payload is invalid.
+        """
+
+        if media_server == 'plex':
+            event = payload.get('event')
+            item = payload.get('Metadata', {})
+            key, item_type = item.get('ratingKey'), item.get('type')
+        elif media_server == 'emby':
+            event = payload.get('Event')
+            item = payload.get('Item', {})
+            key, item_type = item.get('Id'), item.get('Type')
+        else:
+            event = payload.get('NotificationType')
+            key, item_type = payload.get('ItemId'), payload.get('ItemType')
+
+        if event is None:
+            return None
+        if (event not in self.EVENTS[media_server] or key is None
+            or str(item_type).lower() not in self.ITEM_TYPES):
+            return []
+
+        return [str(key)]
+
+
+    def receive(self, media_server: MediaServer, keys: list[str]) -> bool:
+        """
+        Queue the given keys, ignoring any already queued.
+
+        Args:
+            media_server: Which server the keys are from.
+            keys: Rating keys or item IDs to queue.
+
+        Returns:
+            False if the queue is full, True otherwise.
+        """
+
+        for key in keys:
+            with self.__lock:
+                if (media_server, key) in self.__pending:
+                    self.stats['duplicate'] += 1
+                    continue
+                try:
+                    self.queue.put_nowait((media_server, key))
+                except Full:
+                    self.stats['rejected'] += 1
+                    return False
+                self.__pending.add((media_server, key))
+                self.stats['queued'] += 1
+
+        return True
+
+
+    def get_batch(self,
+            timeout: Optional[float] = None,
+        ) -> dict[MediaServer, list[str]]:
+        """
+        Get all queued keys, waiting for at least one.
+
+        Args:
+            timeout: Maximum number of seconds to wait. None to wait
+                indefinitely.
+
+        Returns:
+            Dictionary of each media server to its queued keys. Empty if
+            the timeout elapsed.
+        """
+
+        batch: dict[MediaServer, list[str]] = {}
+        try:
+            item = self.queue.get(timeout=timeout)
+            while True:
+                batch.setdefault(item[0], []).append(item[1])
+                with self.__lock:
+                    self.__pending.discard(item)
+                    self.stats['processed'] += 1
+                item = self.queue.get_nowait()
+        except Empty:
+            pass
+
+        return batch
+
+
+class WebhookRequestHandler(BaseHTTPRequestHandler):
+    """
+    This class describes the handler of requests to a WebhookServer.
+    """
+
+    """WebhookServer whose requests are being handled"""
+    server_object: WebhookServer
+
+    """Paths that each media server posts to"""
+    PATHS: dict[str, MediaServer] = {
+        '/emby': 'emby', '/jellyfin': 'jellyfin', '/plex': 'plex',
+    }
+
+
+    def log_message(self, format: str, *args: Any) -> None: # pylint: disable=redefined-builtin
+        """Log requests at the debug level rather than to stderr."""
+
+        log.debug(f'Webhook request - {format % args}')
+
+
+    def __respond(self,
+            status: HTTPStatus,
+            body: Optional[dict] = None,
+            headers: Optional[dict[str, str]] = None,
+        ) -> None:
+        """Send a response with the given status, JSON body, and headers."""
+
+        content = dumps(body or {'status': status.phrase}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+
+    def __authorize(self) -> bool:
+        """
+        Determine whether this request includes the token of the server
+        (as a header or query parameter), responding with a 401 if not.
+        """
+
+        token = self.headers.get(WebhookServer.TOKEN_HEADER)
+        if token is None:
+            tokens = parse_qs(urlsplit(self.path).query).get('token')
+            token = tokens[0] if tokens else None
+
+        if self.server_object.is_authorized(token):
+            return True
+
+        self.server_object.increment('unauthorized')
+        self.__respond(HTTPStatus.UNAUTHORIZED)
+        return False
+
+
+    def do_GET(self) -> None: # pylint: disable=invalid-name
+        """Respond with the server statistics."""
+
+        if self.path.split('?', 1)[0] != '/stats':
+            self.__respond(HTTPStatus.NOT_FOUND)
+        elif self.__authorize():
+            self.__respond(HTTPStatus.OK, self.server_object.get_stats())
+
+
+    def do_POST(self) -> None: # pylint: disable=invalid-name
+        """Queue the keys of the posted webhook."""
+
+        server = self.server_object
+        if (media_server := self.PATHS.get(self.path.split('?', 1)[0])) is None:
+            self.__respond(HTTPStatus.NOT_FOUND)
+            return None
+
+        # Reject requests without the token before reading anything
+        if not self.__authorize():
+            return None
+
+        # Read body, verify size
+        server.increment('received')
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > server.MAX_BODY_SIZE:
+            server.increment('invalid')
+            self.__respond(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            return None
+        body = self.rfile.read(length)
+
+        # Parse payload and its keys
+        payload = server.parse_payload(
+            self.headers.get('Content-Type', ''), body
+        )
+        if (not isinstance(payload, dict)
+            or (keys := server.get_keys(media_server, payload)) is None):
+            server.increment('invalid')
+            self.__respond(HTTPStatus.BAD_REQUEST)
+            return None
+        if not keys:
+            server.increment('ignored')
+            self.__respond(HTTPStatus.OK)
+            return None
+
+        # Queue keys, apply backpressure if full
+        if not server.receive(media_server, keys):
+            self.__respond(
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                headers={'Retry-After': str(server.RETRY_AFTER)},
+            )
+            return None
+
+        log.debug(f'Received {media_server} webhook for {keys}')
+        self.__respond(HTTPStatus.ACCEPTED)
+        return None
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Iterable
+
+from modules.Debug import log
+
+if TYPE_CHECKING:
+    from modules.Show import Show
+
+
+class WorkPrioritizer:
+    """
+    This class describes a prioritizer of the shows of a run, so that
+    the cards people will see next are made first. A show's priority is
+    raised if it was explicitly requested, if it is missing cards, and
+    further if any of those missing cards are of recently aired
+    episodes. Cards whose watched status changed are deleted when
+    sources are selected, and so are also missing.
+
+    Priorities are only re-evaluated when `update()` is called. Each card
+    is only checked until it is seen to exist, as an existing card can
+    then only go missing by being deleted (which the Episode records).
+    """
+
+    """Priority of an explicitly requested show"""
+    REQUESTED = 4
+
+    """Priority of a show missing the card of a recently aired episode"""
+    RECENTLY_AIRED = 2
+
+    """Priority of a show missing any cards"""
+    MISSING_CARDS = 1
+
+    """Default number of days an episode is considered recently aired"""
+    DEFAULT_RECENT_DAYS = 7
+
+    __slots__ = ('requested', 'recent_days', '__priorities')
+
+
+    def __init__(self,
+            requested: Iterable[str] = (),
+            recent_days: float = DEFAULT_RECENT_DAYS,
+        ) -> None:
+        """
+        Initialize this object.
+
+        Args:
+            requested: Names (or full names) of the series requested to
+                be processed first.
+            recent_days: Number of days after airing that an episode is
+                considered recently aired.
+        """
+
+        self.requested = {name.lower() for name in requested}
+        self.recent_days = timedelta(days=recent_days)
+        self.__priorities: dict[int, int] = {}
+
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the object."""
+
+        return (f'<WorkPrioritizer of {len(self.__priorities)} shows, '
+                f'requested={self.requested}>')
+
+
+    def is_requested(self, show: 'Show') -> bool:
+        """Whether the given Show was explicitly requested."""
+
+        return (show.series_info.full_name.lower() in self.requested
+                or show.series_info.name.lower() in self.requested)
+
+
+    def get(self, show: 'Show') -> int:
+        """
+        Get the last evaluated priority of the given Show (or its
+        ShowArchive).
+
+        Args:
+            show: Show whose priority is being evaluated.
+
+        Returns:
+            Priority of the show - higher priorities are more urgent.
+        """
+
+        if (priority := self.__priorities.get(id(show.series_info))) is None:
+            return self.REQUESTED if self.is_requested(show) else 0
+
+        return priority
+
+
+    def update(self, show: 'Show') -> int:
+        """
+        Re-evaluate the priority of the given Show from its episodes.
+        Only cards which are not known to exist are checked.
+
+        Args:
+            show: Show whose priority is being evaluated.
+
+        Returns:
+            New priority of the show.
+        """
+
+        priority = self.REQUESTED if self.is_requested(show) else 0
+        recent = datetime.now() - self.recent_days
+        for episode in show.episodes.values():
+            # Skip episodes without a destination or that already exist
+            if not episode.destination:
+                continue
+            if not episode.card_exists:
+                episode.card_exists = episode.destination.exists()
+            if episode.card_exists:
+                continue
+
+            priority |= self.MISSING_CARDS
+            airdate = episode.episode_info.airdate
+            if isinstance(airdate, datetime) and airdate >= recent:
+                priority |= self.RECENTLY_AIRED
+                break
+
+        if priority > self.get(show):
+            log.debug(f'Raised priority of {show} to {priority}')
+        self.__priorities[id(show.series_info)] = priority
+
+        return priority
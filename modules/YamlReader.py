@@ -2,7 +2,11 @@ from pathlib import Path
 from sys import exit as sys_exit
 from typing import Any, Callable, Optional, TypeVar
 
-from yaml import safe_load
+from yaml import load
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 from modules.BaseCardType import BaseCardType
 
 from modules.Debug import log
@@ -186,7 +190,7 @@ class YamlReader:
         # Open file and return contents
         with file.open('r', encoding='utf-8') as file_handle:
             try:
-                return safe_load(file_handle)
+                return load(file_handle, Loader=SafeLoader)
             except Exception:
                 # Log error, if critical then exit with error code
                 if critical:
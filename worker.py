@@ -0,0 +1,94 @@
+from argparse import ArgumentParser
+from os import environ
+from pathlib import Path
+from sys import exit as sys_exit
+
+try:
+    from modules.CleanPath import CleanPath
+    from modules.Debug import log, apply_no_color_formatter
+    from modules.PreferenceParser import PreferenceParser
+    from modules.global_objects import set_preference_parser
+    from modules.RenderQueue import RenderQueue
+except ImportError as e:
+    print(f'Required Python packages are missing - execute "pipenv install"')
+    print(f'  Specific Error: {e}')
+    sys_exit(1)
+
+# Environment variables
+ENV_IS_DOCKER = 'TCM_IS_DOCKER'
+ENV_PREFERENCE_FILE = 'TCM_PREFERENCES'
+ENV_RENDER_QUEUE = 'TCM_RENDER_QUEUE'
+ENV_LOG_LEVEL = 'TCM_LOG'
+
+# Default values
+DEFAULT_PREFERENCE_FILE = Path(__file__).parent / 'preferences.yml'
+
+# Set up argument parser
+parser = ArgumentParser(
+    description='Render title cards from the render queue of a TitleCardMaker '
+                'running elsewhere')
+parser.add_argument(
+    '-p', '--preferences', '--preference-file',
+    type=Path,
+    default=environ.get(ENV_PREFERENCE_FILE, DEFAULT_PREFERENCE_FILE),
+    metavar='FILE',
+    help=f'File to read global preferences from. Environment variable '
+         f'{ENV_PREFERENCE_FILE}. Defaults to '
+         f'"{DEFAULT_PREFERENCE_FILE.resolve()}"')
+parser.add_argument(
+    '-q', '--queue',
+    type=CleanPath,
+    default=environ.get(ENV_RENDER_QUEUE),
+    metavar='FILE',
+    help=f'Render queue database to pull jobs from. Environment variable '
+         f'{ENV_RENDER_QUEUE}. Defaults to the render_queue of the preference '
+         f'file')
+parser.add_argument(
+    '--exit-when-empty',
+    action='store_true',
+    help='Exit once the queue has no jobs, instead of waiting for more')
+parser.add_argument(
+    '-l', '--log',
+    choices=('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'),
+    default=environ.get(ENV_LOG_LEVEL, 'INFO'),
+    help=f'Level of logging verbosity to use. Environment variable '
+         f'{ENV_LOG_LEVEL}. Defaults to "INFO"')
+parser.add_argument(
+    '-nc', '--no-color',
+    action='store_true',
+    help='Omit color from all print messages')
+
+# Parse given arguments
+args = parser.parse_args()
+is_docker = environ.get(ENV_IS_DOCKER, 'false').lower() == 'true'
+
+# Set global log level and coloring
+log.handlers[0].setLevel(args.log)
+if args.no_color:
+    apply_no_color_formatter()
+
+# Parse preference file - cards are rendered with these preferences
+if not args.preferences.exists():
+    log.critical(f'Preference file "{args.preferences.resolve()}" does not exist')
+    sys_exit(1)
+if not (pp := PreferenceParser(args.preferences, is_docker)).valid:
+    log.critical(f'Preference file is invalid')
+    sys_exit(1)
+set_preference_parser(pp)
+
+# Get the render queue
+if (queue_file := args.queue or pp.render_queue) is None:
+    log.critical(f'No render queue specified - specify --queue or '
+                 f'options/render_queue')
+    sys_exit(1)
+queue = RenderQueue(
+    CleanPath(queue_file).sanitize(), pp.render_lease, pp.card_type_directories,
+)
+
+# Render jobs until stopped
+log.info(f'Rendering cards from {queue!r}')
+try:
+    rendered = queue.work(exit_when_empty=args.exit_when_empty)
+    log.info(f'Rendered {rendered} cards')
+except KeyboardInterrupt:
+    log.info(f'Stopping worker')